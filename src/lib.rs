@@ -1,9 +1,14 @@
 use calamine::CellErrorType::{Div0, GettingData, Name, Null, Num, Ref, Value, NA};
-use calamine::{open_workbook_auto, CellErrorType, DataType, Error, Range, Reader};
+use calamine::{open_workbook_auto, CellErrorType, DataType, Error, Range, Reader, Sheets};
 use chrono::NaiveDateTime;
-use pyo3::exceptions::PyIOError;
+use pyo3::exceptions::{PyIOError, PyValueError};
 use pyo3::import_exception;
 use pyo3::prelude::*;
+use pyo3::types::{PyByteArray, PyString};
+use std::collections::HashMap;
+use std::fs::File;
+use std::io::BufReader;
+use std::sync::{Arc, Mutex};
 
 import_exception!(xlwings, XlwingsError);
 
@@ -21,11 +26,19 @@ impl From<Error> for CalamineError {
     }
 }
 
+fn to_py_err(err: Error) -> PyErr {
+    match err {
+        Error::Io(err) => PyIOError::new_err(err.to_string()),
+        _ => XlwingsError::new_err(err.to_string()),
+    }
+}
+
 #[derive(Debug)]
-pub enum CellValue {
+pub enum CellValue<'a> {
     Int(i64),
     Float(f64),
-    String(String),
+    // Borrowed from the decoded sheet, so reading a string doesn't copy it
+    String(&'a str),
     Time(chrono::NaiveTime),
     DateTime(NaiveDateTime),
     Timedelta(chrono::Duration),
@@ -34,122 +47,395 @@ pub enum CellValue {
     Empty,
 }
 
-impl<'py> IntoPyObject<'py> for CellValue {
-    type Target = PyAny;
-    type Output = Bound<'py, Self::Target>;
-    type Error = std::convert::Infallible;
+/// Converts cell values into Python objects. Strings are interned per converter,
+/// so a string that repeats across cells (e.g., a category label) becomes a single
+/// Python str instead of one object per cell.
+struct PyConverter<'a, 'py> {
+    py: Python<'py>,
+    strings: HashMap<&'a str, Bound<'py, PyString>>,
+}
+
+impl<'a, 'py> PyConverter<'a, 'py> {
+    fn new(py: Python<'py>) -> Self {
+        PyConverter {
+            py,
+            strings: HashMap::new(),
+        }
+    }
 
-    fn into_pyobject(self, py: Python<'py>) -> Result<Self::Output, <Self as IntoPyObject<'py>>::Error> {
-        let result: Bound<'py, PyAny> = match self {
+    fn string(&mut self, value: &'a str) -> Bound<'py, PyAny> {
+        let py = self.py;
+        self.strings
+            .entry(value)
+            .or_insert_with(|| PyString::new(py, value))
+            .clone()
+            .into_any()
+    }
+
+    fn value(&mut self, value: CellValue<'a>) -> Bound<'py, PyAny> {
+        let py = self.py;
+        match value {
             CellValue::Int(v) => v.into_pyobject(py).unwrap().into_any(),
             CellValue::Float(v) => v.into_pyobject(py).unwrap().into_any(),
-            CellValue::String(v) => v.into_pyobject(py).unwrap().into_any(),
+            CellValue::String(v) => self.string(v),
             CellValue::Bool(v) => v.into_pyobject(py).unwrap().to_owned().into_any(),
             CellValue::Time(v) => v.into_pyobject(py).unwrap().into_any(),
             CellValue::DateTime(v) => v.into_pyobject(py).unwrap().into_any(),
             CellValue::Timedelta(v) => v.into_pyobject(py).unwrap().into_any(),
             CellValue::Empty => py.None().into_bound(py),
             // Errors are already converted to String or Empty
-            CellValue::Error(_) => String::from("Error").into_pyobject(py).unwrap().into_any(),
-        };
-        Ok(result)
+            CellValue::Error(_) => self.string("Error"),
+        }
+    }
+
+    fn rows(&mut self, rows: Vec<Vec<CellValue<'a>>>) -> Vec<Vec<Bound<'py, PyAny>>> {
+        let mut result = Vec::with_capacity(rows.len());
+        for row in rows {
+            let mut values = Vec::with_capacity(row.len());
+            for value in row {
+                values.push(self.value(value));
+            }
+            result.push(values);
+        }
+        result
+    }
+}
+
+/// Rows of cell values as Python objects
+type PyRows<'py> = Vec<Vec<Bound<'py, PyAny>>>;
+
+fn error_value(err: &CellErrorType, err_to_str: bool) -> CellValue<'static> {
+    if !err_to_str {
+        return CellValue::Empty;
+    }
+    let err = match err {
+        Div0 => "#DIV/0!",
+        NA => "#N/A",
+        Name => "#NAME?",
+        Null => "#NULL!",
+        Num => "#NUM!",
+        Ref => "#REF!",
+        Value => "#VALUE!",
+        GettingData => "#DATA!",
+    };
+    CellValue::String(err)
+}
+
+fn cell_value(value: &DataType, err_to_str: bool) -> CellValue<'_> {
+    match value {
+        // Float to be in line with COM API
+        DataType::Int(v) => CellValue::Float((*v) as f64),
+        DataType::Float(v) => CellValue::Float(*v),
+        DataType::String(v) => CellValue::String(v),
+        DataType::DateTime(_v) => match value.as_datetime() {
+            Some(v) => CellValue::DateTime(v),
+            // This can happen with date overflows (1e+20 formatted as date cell)
+            None => CellValue::Empty,
+        },
+        DataType::Bool(v) => CellValue::Bool(*v),
+        DataType::Error(v) => error_value(v, err_to_str),
+        DataType::Empty => CellValue::Empty,
+        DataType::DateTimeIso(_v) => CellValue::DateTime(value.as_datetime().unwrap()),
+        DataType::Duration(_v) => CellValue::Timedelta(value.as_duration().unwrap()),
+        DataType::DurationIso(_v) => CellValue::Time(value.as_time().unwrap()),
+    }
+}
+
+/// The number of rows from rows.0 to rows.1, a ValueError if the range is inverted
+fn row_count(rows: (u32, u32)) -> PyResult<usize> {
+    match rows.1.checked_sub(rows.0) {
+        Some(n) => Ok(n as usize + 1),
+        None => Err(PyValueError::new_err(format!(
+            "The last row ({}) of the range is above its first row ({}).",
+            rows.1, rows.0
+        ))),
     }
 }
 
+/// Reads the cells directly from the decoded sheet instead of via Range::range(),
+/// which would copy the cells (and strings) of the range first
 fn get_values(
-    used_range: Range<DataType>,
+    used_range: &Range<DataType>,
     cell1: (u32, u32),
     cell2: (u32, u32),
     err_to_str: bool,
-) -> Result<Vec<Vec<CellValue>>, Error> {
-    let mut result: Vec<Vec<CellValue>> = Vec::new();
-    // println!("{:?}", range.start());
-    for row in used_range.range(cell1, cell2).rows() {
-        let mut result_row: Vec<CellValue> = Vec::new();
-
-        // println!("{:?}", row);
-        for value in row.iter() {
-            match value {
-                // Float to be in line with COM API
-                DataType::Int(v) => result_row.push(CellValue::Float((*v) as f64)),
-                DataType::Float(v) => result_row.push(CellValue::Float(*v)),
-                DataType::String(v) => result_row.push(CellValue::String(String::from(v))),
-                DataType::DateTime(_v) => {
-                    if value.as_datetime().is_none() {
-                        // This can happen with date overflows (1e+20 formatted as date cell)
-                        result_row.push(CellValue::Empty);
-                    } else {
-                        result_row.push(CellValue::DateTime(value.as_datetime().unwrap()))
+) -> Result<Vec<Vec<CellValue<'_>>>, Error> {
+    let columns: Vec<u32> = (cell1.1..=cell2.1).collect();
+    Ok(get_column_values(
+        used_range,
+        (cell1.0, cell2.0),
+        &columns,
+        err_to_str,
+    ))
+}
+
+/// Like get_values, but only for the given (absolute) columns, so the cells of other
+/// columns are never converted
+fn get_column_values<'a>(
+    used_range: &'a Range<DataType>,
+    rows: (u32, u32),
+    columns: &[u32],
+    err_to_str: bool,
+) -> Vec<Vec<CellValue<'a>>> {
+    (rows.0..=rows.1)
+        .map(|row| {
+            columns
+                .iter()
+                .map(|&col| match used_range.get_value((row, col)) {
+                    Some(value) => cell_value(value, err_to_str),
+                    None => CellValue::Empty,
+                })
+                .collect()
+        })
+        .collect()
+}
+
+/// Writes the range as row-major float64 values into a buffer, so it can be handed
+/// to NumPy without creating a Python object per cell. Empty cells and errors
+/// (unless err_to_str) become NaN, all other cells (strings, bools, dates) are
+/// returned separately together with their flat index.
+fn get_array<'a, 'py>(
+    converter: &mut PyConverter<'a, 'py>,
+    used_range: &'a Range<DataType>,
+    rows: (u32, u32),
+    columns: &[u32],
+    err_to_str: bool,
+) -> PyResult<(Bound<'py, PyByteArray>, Vec<(usize, Bound<'py, PyAny>)>)> {
+    let ncols = columns.len();
+    let nrows = row_count(rows)?;
+    let mut others = Vec::new();
+    let array = PyByteArray::new_with(converter.py, nrows * ncols * 8, |bytes: &mut [u8]| {
+        for (ix, chunk) in bytes.chunks_exact_mut(8).enumerate() {
+            let position = (rows.0 + (ix / ncols) as u32, columns[ix % ncols]);
+            let number = match used_range.get_value(position) {
+                Some(value) => match cell_value(value, err_to_str) {
+                    CellValue::Float(v) => v,
+                    CellValue::Empty => f64::NAN,
+                    other => {
+                        others.push((ix, other));
+                        f64::NAN
                     }
-                }
-                DataType::Bool(v) => result_row.push(CellValue::Bool(*v)),
-                DataType::Error(v) => match v {
-                    Div0 => result_row.push(if err_to_str {
-                        CellValue::String(String::from("#DIV/0!"))
-                    } else {
-                        CellValue::Empty
-                    }),
-                    NA => result_row.push(if err_to_str {
-                        CellValue::String(String::from("#N/A"))
-                    } else {
-                        CellValue::Empty
-                    }),
-                    Name => result_row.push(if err_to_str {
-                        CellValue::String(String::from("#NAME?"))
-                    } else {
-                        CellValue::Empty
-                    }),
-                    Null => result_row.push(if err_to_str {
-                        CellValue::String(String::from("#NULL!"))
-                    } else {
-                        CellValue::Empty
-                    }),
-                    Num => result_row.push(if err_to_str {
-                        CellValue::String(String::from("#NUM!"))
-                    } else {
-                        CellValue::Empty
-                    }),
-                    Ref => result_row.push(if err_to_str {
-                        CellValue::String(String::from("#REF!"))
-                    } else {
-                        CellValue::Empty
-                    }),
-                    Value => result_row.push(if err_to_str {
-                        CellValue::String(String::from("#VALUE!"))
-                    } else {
-                        CellValue::Empty
-                    }),
-                    GettingData => result_row.push(if err_to_str {
-                        CellValue::String(String::from("#DATA!"))
-                    } else {
-                        CellValue::Empty
-                    }),
                 },
-                DataType::Empty => result_row.push(CellValue::Empty),
-                DataType::DateTimeIso(_v) => {
-                    result_row.push(CellValue::DateTime(value.as_datetime().unwrap()))
-                }
-                DataType::Duration(_v) => {
-                    result_row.push(CellValue::Timedelta(value.as_duration().unwrap()))
-                }
-                DataType::DurationIso(_v) => {
-                    result_row.push(CellValue::Time(value.as_time().unwrap()))
-                }
+                None => f64::NAN,
             };
+            chunk.copy_from_slice(&number.to_ne_bytes());
         }
-        result.push(result_row);
+        Ok(())
+    })?;
+    let others = others
+        .into_iter()
+        .map(|(ix, value)| (ix, converter.value(value)))
+        .collect();
+    Ok((array, others))
+}
+
+/// Empty cells and empty strings are blank like in Excel
+fn is_blank(used_range: &Range<DataType>, cell: (u32, u32)) -> bool {
+    match used_range.get_value(cell) {
+        None | Some(DataType::Empty) => true,
+        Some(DataType::String(v)) => v.is_empty(),
+        _ => false,
+    }
+}
+
+/// Moves from cell in the given direction as long as the next cell isn't blank
+fn region_end(
+    used_range: &Range<DataType>,
+    cell: (u32, u32),
+    direction: &str,
+) -> Result<(u32, u32), Error> {
+    let (row_step, col_step) = match direction {
+        "up" => (-1, 0),
+        "down" => (1, 0),
+        "left" => (0, -1),
+        "right" => (0, 1),
+        _ => return Err(Error::Msg("direction must be up, down, left, or right")),
+    };
+    let mut cell = cell;
+    while let (Some(row), Some(col)) = (
+        cell.0.checked_add_signed(row_step),
+        cell.1.checked_add_signed(col_step),
+    ) {
+        if is_blank(used_range, (row, col)) {
+            break;
+        }
+        cell = (row, col);
+    }
+    Ok(cell)
+}
+
+/// Grows the rectangle around cell until it's surrounded by blank rows and columns
+/// (or the edges of the sheet), like Excel's CurrentRegion
+fn current_region(used_range: &Range<DataType>, cell: (u32, u32)) -> ((u32, u32), (u32, u32)) {
+    let row_is_blank =
+        |row: u32, col1: u32, col2: u32| (col1..=col2).all(|col| is_blank(used_range, (row, col)));
+    let col_is_blank =
+        |col: u32, row1: u32, row2: u32| (row1..=row2).all(|row| is_blank(used_range, (row, col)));
+    let ((mut row1, mut col1), (mut row2, mut col2)) = (cell, cell);
+    loop {
+        let (left, right) = (col1.saturating_sub(1), col2 + 1);
+        let (top, bottom) = (row1.saturating_sub(1), row2 + 1);
+        if row1 > 0 && !row_is_blank(row1 - 1, left, right) {
+            row1 -= 1;
+        } else if !row_is_blank(row2 + 1, left, right) {
+            row2 += 1;
+        } else if col1 > 0 && !col_is_blank(col1 - 1, top, bottom) {
+            col1 -= 1;
+        } else if !col_is_blank(col2 + 1, top, bottom) {
+            col2 += 1;
+        } else {
+            break;
+        }
+    }
+    ((row1, col1), (row2, col2))
+}
+
+/// A column as (kind, data, validity), see get_columns
+type Column<'py> = (&'static str, Bound<'py, PyAny>, Bound<'py, PyByteArray>);
+
+fn column_kind(values: &[CellValue]) -> &'static str {
+    let mut kind = "empty";
+    for value in values {
+        let value_kind = match value {
+            CellValue::Empty => continue,
+            CellValue::Float(_) => "float",
+            CellValue::Bool(_) => "bool",
+            CellValue::DateTime(_) => "datetime",
+            CellValue::String(_) => "str",
+            _ => "object",
+        };
+        if kind == "empty" {
+            kind = value_kind;
+        } else if kind != value_kind {
+            return "object";
+        }
+    }
+    kind
+}
+
+fn to_buffer<'py, T, const N: usize>(
+    py: Python<'py>,
+    values: &[T],
+    to_bytes: impl Fn(&T) -> [u8; N],
+) -> PyResult<Bound<'py, PyAny>> {
+    let buffer = PyByteArray::new_with(py, values.len() * N, |bytes: &mut [u8]| {
+        for (chunk, value) in bytes.chunks_exact_mut(N).zip(values) {
+            chunk.copy_from_slice(&to_bytes(value));
+        }
+        Ok(())
+    })?;
+    Ok(buffer.into_any())
+}
+
+/// Returns the codes (-1 for empty cells) and the sorted distinct strings of a
+/// column of strings
+fn categorize<'a>(values: &[CellValue<'a>]) -> (Vec<i32>, Vec<&'a str>) {
+    let mut positions: HashMap<&'a str, i32> = HashMap::new();
+    for value in values {
+        if let CellValue::String(v) = value {
+            positions.entry(*v).or_insert(0);
+        }
+    }
+    let mut categories: Vec<&'a str> = positions.keys().copied().collect();
+    categories.sort_unstable();
+    for (ix, category) in categories.iter().enumerate() {
+        positions.insert(*category, ix as i32);
+    }
+    let codes = values
+        .iter()
+        .map(|value| match value {
+            CellValue::String(v) => positions[v],
+            _ => -1,
+        })
+        .collect();
+    (codes, categories)
+}
+
+/// Returns the range column by column with one type per column (similar to Arrow
+/// arrays), so DataFrames can be built without a row-to-column transpose and
+/// without per-cell type inference in Python. kind is "float" (float64, NaN if
+/// empty), "bool" (uint8), "datetime" (int64 microseconds since the epoch), "str"
+/// (list), "object" (list, for mixed columns), or "empty" (None). With categorical,
+/// columns of strings are returned as "category" with (codes, categories) as data,
+/// where codes is an int32 buffer that indexes into the list of sorted categories.
+/// validity is a buffer with one byte per row that is 0 for empty cells.
+fn get_columns<'a, 'py>(
+    converter: &mut PyConverter<'a, 'py>,
+    used_range: &'a Range<DataType>,
+    rows: (u32, u32),
+    columns: &[u32],
+    err_to_str: bool,
+    categorical: bool,
+) -> PyResult<Vec<Column<'py>>> {
+    let py = converter.py;
+    let mut result = Vec::new();
+    for &col in columns {
+        let values: Vec<CellValue> = (rows.0..=rows.1)
+            .map(|row| match used_range.get_value((row, col)) {
+                Some(value) => cell_value(value, err_to_str),
+                None => CellValue::Empty,
+            })
+            .collect();
+        let validity: Vec<u8> = values
+            .iter()
+            .map(|value| !matches!(value, CellValue::Empty) as u8)
+            .collect();
+        let kind = match column_kind(&values) {
+            "str" if categorical => "category",
+            kind => kind,
+        };
+        let data = match kind {
+            "float" => to_buffer(py, &values, |value| match value {
+                CellValue::Float(v) => v.to_ne_bytes(),
+                _ => f64::NAN.to_ne_bytes(),
+            })?,
+            "bool" => to_buffer(py, &values, |value| match value {
+                CellValue::Bool(v) => [*v as u8],
+                _ => [0],
+            })?,
+            "datetime" => to_buffer(py, &values, |value| match value {
+                CellValue::DateTime(v) => v.and_utc().timestamp_micros().to_ne_bytes(),
+                _ => 0i64.to_ne_bytes(),
+            })?,
+            "category" => {
+                let (codes, categories) = categorize(&values);
+                let codes = to_buffer(py, &codes, |code| code.to_ne_bytes())?;
+                let categories: Vec<_> = categories
+                    .into_iter()
+                    .map(|category| converter.string(category))
+                    .collect();
+                (codes, categories).into_pyobject(py)?.into_any()
+            }
+            "str" => values
+                .into_iter()
+                .map(|value| match value {
+                    CellValue::String(v) => Some(converter.string(v)),
+                    _ => None,
+                })
+                .collect::<Vec<_>>()
+                .into_pyobject(py)?
+                .into_any(),
+            "object" => values
+                .into_iter()
+                .map(|value| converter.value(value))
+                .collect::<Vec<_>>()
+                .into_pyobject(py)?
+                .into_any(),
+            _ => py.None().into_bound(py),
+        };
+        result.push((kind, data, PyByteArray::new(py, &validity)));
     }
     Ok(result)
-    // println!("{:?}", result)
 }
 
 #[pyfunction]
 #[pyo3(text_signature = "path: str, sheet_index: int, err_to_str: bool")]
-fn get_sheet_values(
+fn get_sheet_values<'py>(
+    py: Python<'py>,
     path: &str,
     sheet_index: usize,
     err_to_str: bool,
-) -> PyResult<Vec<Vec<CellValue>>> {
+) -> PyResult<PyRows<'py>> {
     // TODO: proper error handling
     let mut book = open_workbook_auto(path).unwrap();
     let used_range = book.worksheet_range_at(sheet_index).unwrap().unwrap();
@@ -161,13 +447,8 @@ fn get_sheet_values(
     if used_range.is_empty() {
         return Ok(vec![vec![]]);
     }
-    match get_values(used_range, cell1, cell2, err_to_str) {
-        Ok(r) => Ok(r),
-        Err(e) => match e {
-            Error::Io(err) => Err(PyIOError::new_err(err.to_string())),
-            _ => Err(XlwingsError::new_err(e.to_string())),
-        },
-    }
+    let values = get_values(&used_range, cell1, cell2, err_to_str).map_err(to_py_err)?;
+    Ok(PyConverter::new(py).rows(values))
 }
 
 #[pyfunction]
@@ -175,13 +456,14 @@ fn get_sheet_values(
     text_signature = "path: str, sheet_index: int, cell1: tuple[int, int], \
                       cell2: tuple[int, int], err_to_str: bool"
 )]
-fn get_range_values(
+fn get_range_values<'py>(
+    py: Python<'py>,
     path: &str,
     sheet_index: usize,
     cell1: (u32, u32),
     cell2: (u32, u32),
     err_to_str: bool,
-) -> PyResult<Vec<Vec<CellValue>>> {
+) -> PyResult<PyRows<'py>> {
     // TODO: proper error handling
     let mut book = open_workbook_auto(path).unwrap();
     let used_range = book.worksheet_range_at(sheet_index).unwrap().unwrap();
@@ -189,13 +471,8 @@ fn get_range_values(
         true => Range::new((0, 0), (0, 0)),
         false => used_range,
     };
-    match get_values(used_range, cell1, cell2, err_to_str) {
-        Ok(r) => Ok(r),
-        Err(e) => match e {
-            Error::Io(err) => Err(PyIOError::new_err(err.to_string())),
-            _ => Err(XlwingsError::new_err(e.to_string())),
-        },
-    }
+    let values = get_values(&used_range, cell1, cell2, err_to_str).map_err(to_py_err)?;
+    Ok(PyConverter::new(py).rows(values))
 }
 
 #[pyfunction]
@@ -212,8 +489,436 @@ fn get_defined_names(path: &str) -> Result<Vec<(String, String)>, CalamineError>
     Ok(book.defined_names().to_owned())
 }
 
+struct WorkbookState {
+    path: String,
+    reader: Sheets<BufReader<File>>,
+    // Decoded sheets by sheet index, so that each sheet is only parsed once. They're
+    // shared via Arc, so their cells are converted without holding the lock.
+    ranges: HashMap<usize, Arc<Range<DataType>>>,
+}
+
+impl WorkbookState {
+    fn range_at(&mut self, sheet_index: usize) -> Result<Arc<Range<DataType>>, Error> {
+        if !self.ranges.contains_key(&sheet_index) {
+            let used_range = match self.reader.worksheet_range_at(sheet_index) {
+                Some(used_range) => used_range?,
+                None => return Err(Error::Msg("Sheet index out of range")),
+            };
+            self.ranges.insert(sheet_index, Arc::new(used_range));
+        }
+        Ok(Arc::clone(&self.ranges[&sheet_index]))
+    }
+}
+
+fn read_values<'py>(
+    py: Python<'py>,
+    used_range: &Range<DataType>,
+    cell1: (u32, u32),
+    cell2: (u32, u32),
+    columns: Option<&[u32]>,
+    err_to_str: bool,
+) -> PyResult<PyRows<'py>> {
+    let empty_range = Range::new((0, 0), (0, 0));
+    let used_range = match used_range.is_empty() {
+        true => &empty_range,
+        false => used_range,
+    };
+    let values = match columns {
+        Some(columns) => get_column_values(used_range, (cell1.0, cell2.0), columns, err_to_str),
+        None => get_values(used_range, cell1, cell2, err_to_str).map_err(to_py_err)?,
+    };
+    Ok(PyConverter::new(py).rows(values))
+}
+
+/// Decodes the sheets on up to one thread per CPU core. Every thread opens the file
+/// with its own reader as decoding a sheet requires exclusive access to the reader.
+fn load_ranges(
+    path: &str,
+    sheet_indices: &[usize],
+) -> Result<Vec<(usize, Range<DataType>)>, Error> {
+    let threads = std::thread::available_parallelism()
+        .map_or(1, |n| n.get())
+        .min(sheet_indices.len());
+    let chunk_size = sheet_indices.len().div_ceil(threads);
+    std::thread::scope(|scope| {
+        let handles: Vec<_> = sheet_indices
+            .chunks(chunk_size)
+            .map(|chunk| {
+                scope.spawn(move || {
+                    let mut reader = open_workbook_auto(path)?;
+                    chunk
+                        .iter()
+                        .map(
+                            |&sheet_index| match reader.worksheet_range_at(sheet_index) {
+                                Some(used_range) => Ok((sheet_index, used_range?)),
+                                None => Err(Error::Msg("Sheet index out of range")),
+                            },
+                        )
+                        .collect::<Result<Vec<_>, Error>>()
+                })
+            })
+            .collect();
+        let mut ranges = Vec::new();
+        for handle in handles {
+            match handle.join() {
+                Ok(result) => ranges.extend(result?),
+                Err(_) => return Err(Error::Msg("Failed to decode sheet")),
+            }
+        }
+        Ok(ranges)
+    })
+}
+
+/// Keeps a workbook open so that the file, its shared strings and the decoded
+/// sheets are parsed only once instead of on every read.
+#[pyclass(frozen, module = "xlwings.xlwingslib")]
+struct Workbook {
+    state: Mutex<Option<WorkbookState>>,
+}
+
+impl Workbook {
+    fn with_state<T>(&self, f: impl FnOnce(&mut WorkbookState) -> Result<T, Error>) -> PyResult<T> {
+        let mut state = self.state.lock().unwrap_or_else(|e| e.into_inner());
+        match state.as_mut() {
+            Some(state) => f(state).map_err(to_py_err),
+            None => Err(XlwingsError::new_err(
+                "The workbook has already been closed.",
+            )),
+        }
+    }
+
+    /// Returns the decoded sheet. Only the lookup holds the lock: converting cells
+    /// creates Python objects, which can run Python code (e.g., via the garbage
+    /// collector) that calls back into this workbook and would deadlock on the lock.
+    fn range_at(&self, sheet_index: usize) -> PyResult<Arc<Range<DataType>>> {
+        self.with_state(|state| state.range_at(sheet_index))
+    }
+}
+
+#[pymethods]
+impl Workbook {
+    #[new]
+    fn new(path: &str) -> PyResult<Self> {
+        let reader = open_workbook_auto(path).map_err(to_py_err)?;
+        Ok(Workbook {
+            state: Mutex::new(Some(WorkbookState {
+                path: path.to_owned(),
+                reader,
+                ranges: HashMap::new(),
+            })),
+        })
+    }
+
+    fn sheet_names(&self) -> PyResult<Vec<String>> {
+        self.with_state(|state| Ok(state.reader.sheet_names().to_owned()))
+    }
+
+    fn defined_names(&self) -> PyResult<Vec<(String, String)>> {
+        self.with_state(|state| Ok(state.reader.defined_names().to_owned()))
+    }
+
+    /// Decodes the sheets that aren't cached yet in parallel and without holding the
+    /// GIL. The lock is released while decoding, so other threads aren't blocked.
+    fn load_sheets(&self, py: Python<'_>, sheet_indices: Vec<usize>) -> PyResult<()> {
+        let (path, mut missing) = self.with_state(|state| {
+            let missing: Vec<usize> = sheet_indices
+                .into_iter()
+                .filter(|sheet_index| !state.ranges.contains_key(sheet_index))
+                .collect();
+            Ok((state.path.clone(), missing))
+        })?;
+        missing.sort_unstable();
+        missing.dedup();
+        if missing.is_empty() {
+            return Ok(());
+        }
+        let ranges = py
+            .detach(|| load_ranges(&path, &missing))
+            .map_err(to_py_err)?;
+        self.with_state(|state| {
+            for (sheet_index, used_range) in ranges {
+                state
+                    .ranges
+                    .entry(sheet_index)
+                    .or_insert_with(|| Arc::new(used_range));
+            }
+            Ok(())
+        })
+    }
+
+    fn sheet_values<'py>(
+        &self,
+        py: Python<'py>,
+        sheet_index: usize,
+        err_to_str: bool,
+    ) -> PyResult<PyRows<'py>> {
+        let used_range = self.range_at(sheet_index)?;
+        match used_range.end() {
+            Some(cell2) if !used_range.is_empty() => {
+                let values =
+                    get_values(&used_range, (0, 0), cell2, err_to_str).map_err(to_py_err)?;
+                Ok(PyConverter::new(py).rows(values))
+            }
+            _ => Ok(vec![vec![]]),
+        }
+    }
+
+    /// With columns (0-based sheet columns), only these columns are returned in the
+    /// given order, the columns between cell1 and cell2 are ignored
+    #[pyo3(signature = (sheet_index, cell1, cell2, err_to_str, columns=None))]
+    fn range_values<'py>(
+        &self,
+        py: Python<'py>,
+        sheet_index: usize,
+        cell1: (u32, u32),
+        cell2: (u32, u32),
+        err_to_str: bool,
+        columns: Option<Vec<u32>>,
+    ) -> PyResult<PyRows<'py>> {
+        read_values(
+            py,
+            &self.range_at(sheet_index)?,
+            cell1,
+            cell2,
+            columns.as_deref(),
+            err_to_str,
+        )
+    }
+
+    /// Returns the first and last cell of the used range or None if the sheet is empty
+    fn used_range(&self, sheet_index: usize) -> PyResult<Option<((u32, u32), (u32, u32))>> {
+        let used_range = self.range_at(sheet_index)?;
+        match (used_range.start(), used_range.end()) {
+            (Some(cell1), Some(cell2)) if !used_range.is_empty() => Ok(Some((cell1, cell2))),
+            _ => Ok(None),
+        }
+    }
+
+    /// Returns the cell at the end of the region in the given direction, see Range.end()
+    fn region_end(
+        &self,
+        sheet_index: usize,
+        cell: (u32, u32),
+        direction: &str,
+    ) -> PyResult<(u32, u32)> {
+        region_end(&self.range_at(sheet_index)?, cell, direction).map_err(to_py_err)
+    }
+
+    /// Returns the first and last cell of the current region around cell
+    fn current_region(
+        &self,
+        sheet_index: usize,
+        cell: (u32, u32),
+    ) -> PyResult<((u32, u32), (u32, u32))> {
+        Ok(current_region(&self.range_at(sheet_index)?, cell))
+    }
+
+    /// Returns an iterator over the range that converts batch_size rows at a time, so
+    /// only one batch exists as Python objects at any time. Without cell2, the range
+    /// goes from A1 to the end of the used range like sheet_values. With columns,
+    /// only these columns are read, see range_values.
+    #[pyo3(signature = (sheet_index, cell1, cell2, batch_size, err_to_str, columns=None))]
+    fn iter_rows(
+        slf: &Bound<'_, Self>,
+        sheet_index: usize,
+        cell1: (u32, u32),
+        cell2: Option<(u32, u32)>,
+        batch_size: u32,
+        err_to_str: bool,
+        columns: Option<Vec<u32>>,
+    ) -> PyResult<RowIterator> {
+        if batch_size == 0 {
+            return Err(PyValueError::new_err("batch_size must be at least 1."));
+        }
+        let cell2 = match cell2 {
+            Some(cell2) => Some(cell2),
+            None => slf.get().used_range(sheet_index)?.map(|(_, cell2)| cell2),
+        };
+        Ok(RowIterator {
+            workbook: slf.clone().unbind(),
+            sheet_index,
+            cell1,
+            // An empty sheet yields no batches
+            cell2: cell2.unwrap_or((0, 0)),
+            next_row: match cell2 {
+                Some(_) => cell1.0,
+                None => 1,
+            },
+            batch_size,
+            err_to_str,
+            columns,
+        })
+    }
+
+    /// Returns the range as a bytearray of row-major float64 values together with
+    /// its shape and the cells that aren't numbers, see get_array. Without cell2,
+    /// the range goes from A1 to the end of the used range like sheet_values. With
+    /// columns, only these columns are read, see range_values.
+    #[pyo3(signature = (sheet_index, cell1, cell2, err_to_str, columns=None))]
+    fn range_array<'py>(
+        &self,
+        py: Python<'py>,
+        sheet_index: usize,
+        cell1: (u32, u32),
+        cell2: Option<(u32, u32)>,
+        err_to_str: bool,
+        columns: Option<Vec<u32>>,
+    ) -> PyResult<(
+        Bound<'py, PyByteArray>,
+        (usize, usize),
+        Vec<(usize, Bound<'py, PyAny>)>,
+    )> {
+        let used_range = self.range_at(sheet_index)?;
+        let cell2 = match cell2 {
+            Some(cell2) => cell2,
+            None => match used_range.end() {
+                Some(cell2) if !used_range.is_empty() => cell2,
+                _ => return Ok((PyByteArray::new(py, &[]), (0, 0), Vec::new())),
+            },
+        };
+        let columns = columns.unwrap_or_else(|| (cell1.1..=cell2.1).collect());
+        let shape = (row_count((cell1.0, cell2.0))?, columns.len());
+        let (array, others) = get_array(
+            &mut PyConverter::new(py),
+            &used_range,
+            (cell1.0, cell2.0),
+            &columns,
+            err_to_str,
+        )?;
+        Ok((array, shape, others))
+    }
+
+    /// Returns the first header rows of the range as values and the remaining rows
+    /// as typed columns, see get_columns. Without cell2, the range goes from A1 to
+    /// the end of the used range like sheet_values. With columns, only these columns
+    /// are read, see range_values. With categorical, columns of strings are returned
+    /// as categories.
+    #[pyo3(signature = (sheet_index, cell1, cell2, header, err_to_str, columns=None, categorical=false))]
+    fn range_columns<'py>(
+        &self,
+        py: Python<'py>,
+        sheet_index: usize,
+        cell1: (u32, u32),
+        cell2: Option<(u32, u32)>,
+        header: u32,
+        err_to_str: bool,
+        columns: Option<Vec<u32>>,
+        categorical: bool,
+    ) -> PyResult<(PyRows<'py>, Vec<Column<'py>>)> {
+        let range = self.range_at(sheet_index)?;
+        let cell2 = match cell2 {
+            Some(cell2) => cell2,
+            None => match range.end() {
+                Some(cell2) if !range.is_empty() => cell2,
+                _ => return Ok((Vec::new(), Vec::new())),
+            },
+        };
+        row_count((cell1.0, cell2.0))?;
+        let empty_range = Range::new((0, 0), (0, 0));
+        let used_range = match range.is_empty() {
+            true => &empty_range,
+            false => &*range,
+        };
+        let columns = columns.unwrap_or_else(|| (cell1.1..=cell2.1).collect());
+        let first_row = cell1.0.saturating_add(header);
+        // Shared by the header and the columns, so the strings are interned once
+        let mut converter = PyConverter::new(py);
+        let header_values = match header {
+            0 => Vec::new(),
+            _ => converter.rows(get_column_values(
+                used_range,
+                (cell1.0, first_row.min(cell2.0.saturating_add(1)) - 1),
+                &columns,
+                err_to_str,
+            )),
+        };
+        let columns = match first_row <= cell2.0 {
+            true => get_columns(
+                &mut converter,
+                used_range,
+                (first_row, cell2.0),
+                &columns,
+                err_to_str,
+                categorical,
+            )?,
+            false => Vec::new(),
+        };
+        Ok((header_values, columns))
+    }
+
+    fn close(&self) {
+        let mut state = self.state.lock().unwrap_or_else(|e| e.into_inner());
+        *state = None;
+    }
+
+    #[getter]
+    fn closed(&self) -> bool {
+        let state = self.state.lock().unwrap_or_else(|e| e.into_inner());
+        state.is_none()
+    }
+
+    fn __enter__(slf: PyRef<'_, Self>) -> PyRef<'_, Self> {
+        slf
+    }
+
+    fn __exit__(
+        &self,
+        _exc_type: &Bound<'_, PyAny>,
+        _exc_value: &Bound<'_, PyAny>,
+        _traceback: &Bound<'_, PyAny>,
+    ) -> bool {
+        self.close();
+        false
+    }
+}
+
+#[pyclass(module = "xlwings.xlwingslib")]
+struct RowIterator {
+    workbook: Py<Workbook>,
+    sheet_index: usize,
+    cell1: (u32, u32),
+    cell2: (u32, u32),
+    next_row: u32,
+    batch_size: u32,
+    err_to_str: bool,
+    columns: Option<Vec<u32>>,
+}
+
+#[pymethods]
+impl RowIterator {
+    fn __iter__(slf: PyRef<'_, Self>) -> PyRef<'_, Self> {
+        slf
+    }
+
+    fn __next__<'py>(&mut self, py: Python<'py>) -> PyResult<Option<PyRows<'py>>> {
+        if self.next_row > self.cell2.0 {
+            return Ok(None);
+        }
+        let cell1 = (self.next_row, self.cell1.1);
+        let cell2 = (
+            self.next_row
+                .saturating_add(self.batch_size - 1)
+                .min(self.cell2.0),
+            self.cell2.1,
+        );
+        let used_range = self.workbook.get().range_at(self.sheet_index)?;
+        let values = read_values(
+            py,
+            &used_range,
+            cell1,
+            cell2,
+            self.columns.as_deref(),
+            self.err_to_str,
+        )?;
+        self.next_row = cell2.0 + 1;
+        Ok(Some(values))
+    }
+}
+
 #[pymodule]
 fn xlwingslib(m: &Bound<'_, PyModule>) -> PyResult<()> {
+    m.add_class::<Workbook>()?;
+    m.add_class::<RowIterator>()?;
     m.add_function(wrap_pyfunction!(get_range_values, m)?)?;
     m.add_function(wrap_pyfunction!(get_sheet_values, m)?)?;
     m.add_function(wrap_pyfunction!(get_sheet_names, m)?)?;
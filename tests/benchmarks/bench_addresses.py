@@ -0,0 +1,32 @@
+"""Parsing of A1 addresses, e.g., by sheet["A1"] on the remote and calamine engines"""
+
+import pytest
+
+import xlwings as xw
+from xlwings import utils
+
+pytestmark = pytest.mark.benchmark(group="addresses")
+
+ADDRESSES = [
+    f"{utils.col_name(col)}{row}:{utils.col_name(col + 3)}{row + 10}"
+    for row in range(1, 51)
+    for col in range(1, 700, 35)
+]
+
+
+def test_a1_to_tuples(benchmark):
+    # Uncached, i.e., every address is parsed once
+    def parse():
+        utils.a1_to_tuples.cache_clear()
+        return [utils.a1_to_tuples(address) for address in ADDRESSES]
+
+    benchmark(parse)
+
+
+def test_a1_to_tuples_cached(benchmark):
+    benchmark(lambda: [utils.a1_to_tuples(address) for address in ADDRESSES])
+
+
+def test_range_by_address_in_loop(benchmark, book_json):
+    sheet = xw.Book(json=book_json).sheets[0]
+    benchmark(lambda: [sheet[f"B{row}"] for row in range(1, 1001)])
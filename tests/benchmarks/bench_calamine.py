@@ -0,0 +1,77 @@
+"""Reading files with the calamine engine: xw.Book(..., mode="r")"""
+
+import pytest
+from conftest import SHEET_FILE
+
+import xlwings as xw
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+try:
+    import polars as pl
+except ImportError:
+    pl = None
+
+pytestmark = pytest.mark.benchmark(group="calamine")
+
+
+def test_open_and_read_sheet(benchmark):
+    # Includes opening the file and decoding the sheet
+    def read():
+        with xw.Book(SHEET_FILE, mode="r") as book:
+            return book.sheets[0].cells.value
+
+    benchmark(read)
+
+
+def test_read_sheet(benchmark, calamine_book):
+    benchmark(lambda: calamine_book.sheets[0].cells.value)
+
+
+def test_read_small_range(benchmark, calamine_book):
+    benchmark(lambda: calamine_book.sheets[0]["A1:G11"].value)
+
+
+def test_read_expand(benchmark, calamine_book):
+    benchmark(lambda: calamine_book.sheets[0]["A1"].expand().value)
+
+
+def test_read_columns(benchmark, calamine_book):
+    rng = calamine_book.sheets[0].cells.options(columns=["store", "amount"])
+    benchmark(lambda: rng.value)
+
+
+def test_iter_batches(benchmark, calamine_book):
+    benchmark(lambda: sum(1 for _ in calamine_book.sheets[0].iter_batches(1000)))
+
+
+@pytest.mark.skipif(not np, reason="requires numpy")
+def test_read_np(benchmark, calamine_book):
+    rng = calamine_book.sheets[0]["G2"].options(np.array, expand="down")
+    benchmark(lambda: rng.value)
+
+
+@pytest.mark.skipif(not pd, reason="requires pandas")
+def test_read_df(benchmark, calamine_book):
+    rng = calamine_book.sheets[0].cells.options(pd.DataFrame, index=False)
+    benchmark(lambda: rng.value)
+
+
+@pytest.mark.skipif(not pd, reason="requires pandas")
+def test_read_df_categorical(benchmark, calamine_book):
+    rng = calamine_book.sheets[0].cells.options(
+        pd.DataFrame, index=False, categorical=True
+    )
+    benchmark(lambda: rng.value)
+
+
+@pytest.mark.skipif(not pl, reason="requires polars")
+def test_read_polars(benchmark, calamine_book):
+    rng = calamine_book.sheets[0].cells.options(pl.DataFrame)
+    benchmark(lambda: rng.value)
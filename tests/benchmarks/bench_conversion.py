@@ -0,0 +1,89 @@
+"""The conversion pipeline on synthetic data, independent of an engine's I/O"""
+
+import pytest
+
+from xlwings import conversion
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+try:
+    import polars as pl
+except ImportError:
+    pl = None
+
+pytestmark = pytest.mark.benchmark(group="conversion")
+
+
+def read(values, convert=None, **options):
+    options = conversion.Options(dict(options, convert=convert))
+    return conversion.read(None, values, options, engine_name="remote")
+
+
+def write(value, convert=None, **options):
+    options = conversion.Options(dict(options, convert=convert))
+    return conversion.write(value, None, options, engine_name="remote")
+
+
+def test_read_list(benchmark, values):
+    benchmark(read, values)
+
+
+def test_write_list(benchmark, values):
+    benchmark(write, values)
+
+
+@pytest.mark.skipif(not np, reason="requires numpy")
+def test_read_np(benchmark, values):
+    numbers = [row[:2] for row in values[1:]]
+    benchmark(read, numbers, np.array)
+
+
+@pytest.mark.skipif(not pd, reason="requires pandas")
+def test_read_df(benchmark, values):
+    benchmark(read, values, pd.DataFrame, index=False)
+
+
+@pytest.mark.skipif(not pd, reason="requires pandas")
+def test_write_df(benchmark, values):
+    df = pd.DataFrame(values[1:], columns=values[0])
+    benchmark(write, df, index=False)
+
+
+@pytest.mark.skipif(not pd, reason="requires pandas")
+def test_write_df_floats(benchmark):
+    df = pd.DataFrame(np.random.default_rng(0).random((100_000, 10)))
+    df[df > 0.9] = np.nan
+    benchmark(write, df, index=False)
+
+
+@pytest.mark.skipif(not pd, reason="requires pandas")
+def test_write_df_mixed(benchmark):
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(
+        {
+            f"{kind}{ix}": column
+            for ix in range(10)
+            for kind, column in [
+                ("float", rng.random(10_000)),
+                ("int", rng.integers(0, 100, 10_000)),
+                ("date", pd.date_range("2000-01-01", periods=10_000, freq="h")),
+                ("str", ["a", "b"] * 5_000),
+            ]
+        }
+    )
+    benchmark(write, df, index=False)
+
+
+def test_read_numbers_option(benchmark, values):
+    benchmark(read, values, numbers=int)
+
+
+@pytest.mark.skipif(not pl, reason="requires polars")
+def test_read_polars(benchmark, values):
+    benchmark(read, values, pl.DataFrame)
@@ -0,0 +1,61 @@
+"""Custom function calls of a recalculation (xlwings Server/Lite)"""
+
+import asyncio
+from types import ModuleType
+
+import pytest
+
+from xlwings.server import custom_functions_call, custom_functions_call_batch, func
+
+pytestmark = pytest.mark.benchmark(group="custom_functions")
+
+NCALLS = 5_000
+
+
+@func
+def add(x: float, y: float) -> float:
+    return x + y
+
+
+module = ModuleType("custom_functions")
+module.add = add
+
+data_list = [
+    {
+        "func_name": "add",
+        "args": [[[float(i)]], [[1.0]]],
+        "version": "dev",
+        "client": "Office.js",
+        "runtime": "1.4",
+        "date_format": "TT.MM.JJJJ",
+        "culture_info_name": "de-DE",
+    }
+    for i in range(NCALLS)
+]
+
+
+def test_calls(benchmark):
+    async def call_all():
+        return [await custom_functions_call(data, module) for data in data_list]
+
+    benchmark(lambda: asyncio.run(call_all()))
+
+
+def test_call_batch(benchmark):
+    benchmark(lambda: asyncio.run(custom_functions_call_batch(data_list, module)))
+
+
+@func(cache=True)
+def add_cached(x: float, y: float) -> float:
+    return x + y
+
+
+module.add_cached = add_cached
+
+
+def test_call_batch_cached(benchmark):
+    # A recalculation where every cell calls the function with the same arguments
+    cached_data_list = [dict(data_list[0], func_name="add_cached")] * NCALLS
+    benchmark(
+        lambda: asyncio.run(custom_functions_call_batch(cached_data_list, module))
+    )
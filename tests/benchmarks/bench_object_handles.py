@@ -0,0 +1,83 @@
+"""The object handle cache of custom functions (xlwings Server/Lite)"""
+
+import uuid
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from xlwings.pro import object_handles
+
+pytestmark = pytest.mark.benchmark(group="object_handles")
+
+NOBJECTS = 10_000
+
+
+def test_cache_set_with_eviction(benchmark):
+    cache = object_handles.LRUObjectCache(maxsize=1000)
+    keys = [str(uuid.uuid4()) for _ in range(NOBJECTS)]
+
+    def set_all():
+        for key in keys:
+            cache.set(key, key)
+
+    benchmark(set_all)
+
+
+def test_cache_set_with_max_bytes(benchmark):
+    cache = object_handles.LRUObjectCache(maxsize=NOBJECTS, max_bytes=100_000)
+    keys = [str(uuid.uuid4()) for _ in range(NOBJECTS)]
+
+    def set_all():
+        for key in keys:
+            cache.set(key, key)
+
+    benchmark(set_all)
+
+
+def test_cache_get(benchmark):
+    cache = object_handles.LRUObjectCache(maxsize=NOBJECTS)
+    keys = [str(uuid.uuid4()) for _ in range(NOBJECTS)]
+    for key in keys:
+        cache.set(key, key)
+
+    def get_all():
+        for key in keys:
+            cache.get(key)
+
+    benchmark(get_all)
+
+
+def test_write_and_evict_superseded(benchmark, monkeypatch):
+    # A recalculation of a handle-producing cell
+    monkeypatch.setattr(object_handles, "cache", object_handles.LRUObjectCache())
+    monkeypatch.setattr(object_handles, "_producer_cache_ids", {})
+
+    def recalculate():
+        for ix in range(100):
+            entity = object_handles.ObjectCacheConverter.write_value([ix], {})
+            object_handles.evict_superseded(f"Sheet1!A{ix + 1}", [[entity]])
+
+    benchmark(recalculate)
+
+
+def test_read_handle(benchmark, monkeypatch):
+    monkeypatch.setattr(object_handles, "cache", object_handles.LRUObjectCache())
+    entity = object_handles.ObjectCacheConverter.write_value([1, 2, 3], {})
+    cache_id = entity["properties"][object_handles.RESERVED_PROPERTY]["basicValue"]
+    benchmark(object_handles.ObjectCacheConverter.read_value, cache_id, {})
+
+
+def test_reload_spilled_dataframe(benchmark, tmp_path):
+    # Two DataFrames alternating in a cache that only holds one: every read reloads
+    # a spilled one from disk
+    cache = object_handles.LRUObjectCache(maxsize=1, spill_dir=tmp_path)
+    df = pd.DataFrame(np.random.rand(100_000, 10))
+    cache.set("a", df)
+    cache.set("b", df)
+
+    def read_alternating():
+        cache.get("a")
+        cache.get("b")
+
+    benchmark(read_alternating)
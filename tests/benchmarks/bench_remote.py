@@ -0,0 +1,114 @@
+"""The remote engine (xlwings Server): JSON payload in, JSON actions out"""
+
+import json
+
+import pytest
+
+import xlwings as xw
+
+pytestmark = pytest.mark.benchmark(group="remote")
+
+
+def test_json_round_trip(benchmark, book_json):
+    # What a request does: parse the payload, read and write a range, and return
+    # the actions as JSON
+    payload = json.dumps(book_json)
+
+    def round_trip():
+        book = xw.Book(json=json.loads(payload))
+        sheet = book.sheets[0]
+        values = sheet["A1"].expand().value
+        sheet["G1"].value = values
+        return json.dumps(book.json())
+
+    benchmark(round_trip)
+
+
+def test_read_values(benchmark, book_json):
+    book = xw.Book(json=book_json)
+    nrows, ncols = len(book_json["sheets"][0]["values"]), 5
+    rng = book.sheets[0].range((1, 1), (nrows, ncols))
+    benchmark(lambda: rng.value)
+
+
+def test_read_values_columns_format(benchmark, book_json):
+    # Same as test_read_values, but with the values sent column by column
+    values = book_json["sheets"][0]["values"]
+    book_json["sheets"][0]["values"] = {
+        "format": "columns",
+        "columns": [list(col) for col in zip(*values)],
+        "dates": [[row, 3] for row in range(1, len(values))],
+    }
+    book = xw.Book(json=book_json)
+    rng = book.sheets[0].range((1, 1), (len(values), 5))
+    benchmark(lambda: rng.value)
+
+
+def test_write_values(benchmark, book_json, values):
+    book = xw.Book(json=book_json)
+
+    def write():
+        book.impl._json = {"actions": []}
+        book.sheets[0]["G1"].value = values
+        return book.json()
+
+    benchmark(write)
+
+
+@pytest.mark.parametrize("encodings", [[], ["float64", "rle", "gzip"]])
+def test_write_values_streamed(benchmark, book_json, values, encodings):
+    # Serializing a large write payload by payload as a server would stream it
+    book_json["encodings"] = encodings
+    book = xw.Book(json=book_json)
+
+    def write():
+        book.impl._json = {"actions": []}
+        book.sheets[0]["G1"].value = values
+        return [json.dumps(payload) for payload in book.json_chunks(max_cells=10_000)]
+
+    benchmark(write)
+
+
+def test_write_cell_by_cell(benchmark, book_json):
+    # Includes coalescing the actions into a single block per action type
+    book = xw.Book(json=book_json)
+    sheet = book.sheets[0]
+
+    def write():
+        book.impl._json = {"actions": []}
+        for row in range(100):
+            for col in range(10):
+                sheet[row, col].value = row * col
+                sheet[row, col].number_format = "0.00"
+        return json.dumps(book.json())
+
+    benchmark(write)
+
+
+def test_write_column_cell_by_cell(benchmark, book_json):
+    # Coalesces 10,000 single cell writes into a single block
+    book = xw.Book(json=book_json)
+    sheet = book.sheets[0]
+
+    def write():
+        book.impl._json = {"actions": []}
+        for row in range(10_000):
+            sheet[row, 0].value = row
+        return json.dumps(book.json())
+
+    benchmark(write)
+
+
+def test_named_range_lookup(benchmark, book_json):
+    book_json["names"] = [
+        {
+            "name": f"name{i}",
+            "sheet_index": 0,
+            "address": f"A{i + 1}",
+            "book_scope": True,
+            "scope_sheet_index": None,
+        }
+        for i in range(5_000)
+    ]
+    sheet = xw.Book(json=book_json).sheets[0]
+    benchmark(lambda: [sheet[f"name{i}"] for i in range(0, 5_000, 50)])
@@ -0,0 +1,34 @@
+"""Rendering xlwings Reports templates against a stand-in engine (no Excel)"""
+
+import pytest
+from conftest import make_book_json
+
+import xlwings as xw
+
+pd = pytest.importorskip("pandas")
+pytest.importorskip("jinja2")
+from xlwings.pro.reports.main import render_sheet  # noqa: E402
+
+pytestmark = pytest.mark.benchmark(group="reports")
+
+
+def template(nrows, ncols):
+    values = [["Report: {{ title }}"] + [None] * (ncols - 1), ["{{ df }}"]]
+    values[1] += [None] * (ncols - 1)
+    for ix in range(nrows):
+        values.append(
+            [f"{{{{ label }}}} {ix}" if col == 0 else None for col in range(ncols)]
+        )
+    return make_book_json(values)
+
+
+def test_render_sheet(benchmark, stand_in_engine, values):
+    book_json = template(nrows=500, ncols=5)
+    df = pd.DataFrame(values[1:1001], columns=values[0])
+
+    def render():
+        book = xw.Book(json=book_json)
+        render_sheet(book.sheets[0], title="Sales", df=df, label="Row")
+        return book.json()
+
+    benchmark(render)
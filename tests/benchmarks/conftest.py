@@ -0,0 +1,103 @@
+"""Fixtures for the benchmarks, see DEVELOPER_GUIDE.md"""
+
+import datetime as dt
+from pathlib import Path
+
+import pytest
+
+import xlwings as xw
+from xlwings.pro import _xlremote
+
+this_dir = Path(__file__).resolve().parent
+
+# 7,353 rows x 7 columns with strings, dates, and numbers
+SHEET_FILE = this_dir.parent / "test_engines" / "single_sheet_many_rows.xlsx"
+NROWS = 10_000
+
+
+def make_values(nrows=NROWS):
+    """Header row and nrows rows with numbers, repeated labels, dates, and bools"""
+    values = [["id", "amount", "store", "date", "active"]]
+    for ix in range(nrows):
+        values.append(
+            [
+                float(ix),
+                ix * 1.5,
+                f"store {ix % 20}",
+                dt.datetime(2024, 1, 1) + dt.timedelta(days=ix % 365),
+                ix % 2 == 0,
+            ]
+        )
+    return values
+
+
+def make_book_json(values):
+    """The payload that the remote clients (Office.js, VBA, Google Apps Script) send"""
+    return {
+        "client": "Microsoft Office Scripts",
+        "version": xw.__version__,
+        "book": {"name": "bench.xlsx", "active_sheet_index": 0, "selection": "A1"},
+        "names": [],
+        "sheets": [
+            {
+                "name": "Sheet1",
+                "values": [
+                    [
+                        f"{v.isoformat(timespec='milliseconds')}Z"
+                        if isinstance(v, dt.datetime)
+                        else v
+                        for v in row
+                    ]
+                    for row in values
+                ],
+                "pictures": [],
+                "tables": [],
+            }
+        ],
+    }
+
+
+@pytest.fixture(scope="session")
+def values():
+    return make_values()
+
+
+@pytest.fixture
+def book_json(values):
+    # Not shared across benchmarks as books keep state on their payload
+    return make_book_json(values)
+
+
+@pytest.fixture(scope="session")
+def calamine_book():
+    # Sheets are decoded once and cached by the reader, so the benchmarks that use
+    # this fixture measure the conversion into Python objects
+    with xw.Book(SHEET_FILE, mode="r") as book:
+        yield book
+
+
+class _PageSetup:
+    print_area = None
+
+
+@pytest.fixture
+def stand_in_engine(monkeypatch):
+    """The remote engine with the properties that xlwings Reports needs and the remote
+    engine doesn't support, so templates can be rendered without Excel"""
+    monkeypatch.setattr(_xlremote.Sheet, "visible", True, raising=False)
+    monkeypatch.setattr(_xlremote.Sheet, "select", lambda self: None)
+    monkeypatch.setattr(_xlremote.Sheet, "page_setup", _PageSetup(), raising=False)
+    monkeypatch.setattr(_xlremote.Sheet, "shapes", (), raising=False)
+    monkeypatch.setattr(
+        _xlremote.Sheet,
+        "used_range",
+        property(
+            lambda self: self.range(
+                (1, 1), (len(self.api["values"]), len(self.api["values"][0]))
+            )
+        ),
+        raising=False,
+    )
+    monkeypatch.setattr(_xlremote.Range, "note", None, raising=False)
+    monkeypatch.setattr(_xlremote.Range, "table", None, raising=False)
+    monkeypatch.setattr(_xlremote.App, "cut_copy_mode", False, raising=False)
@@ -12,6 +12,7 @@ methods gate on ``sys.platform == "emscripten"``, so the fixtures below fake jus
 enough of that surface to run the real branching logic.
 """
 
+import copy
 import sys
 from types import ModuleType, SimpleNamespace
 
@@ -88,6 +89,22 @@ def test_loaded_state_survives_sheet_rename():
     assert rng.raw_value == [(1,)]  # still loaded, must not raise
 
 
+def test_range_reads_share_the_sheet_values_store():
+    book = _make_book(lazy=False, values=[[1, 2, 3], [4, 5, 6]])
+    sheet = book.sheets.active
+    api = copy.deepcopy(sheet.api)
+    assert R.Range(sheet=sheet, arg1=(2, 2)).raw_value == [(5,)]
+    store = R._sheet_values(book, sheet.api)
+    assert R.Range(sheet=sheet, arg1=(1, 2), arg2=(3, 4)).raw_value == [
+        (2, 3, None),
+        (5, 6, None),
+        (None, None, None),
+    ]
+    assert R._sheet_values(book, sheet.api) is store
+    # The store isn't part of the payload
+    assert sheet.api == api
+
+
 # --- load() branching (js/emscripten faked) ---
 
 
@@ -176,6 +193,17 @@ async def test_metadata_only_load_does_not_clobber_loaded_values(fake_emscripten
     assert rng.raw_value == [(10,)]
 
 
+@pytest.mark.anyio
+async def test_value_load_invalidates_values_store(fake_emscripten):
+    book = _make_book(lazy=False, values=[[1, 2], [3, 4]])
+    rng = R.Range(sheet=book.sheets.active, arg1=(1, 1))
+    assert rng.raw_value == [(1,)]
+    await book.load()
+    assert rng.raw_value == [(10,)]
+    await book.sheets.active.load()
+    assert rng.raw_value == [(10,)]
+
+
 @pytest.mark.anyio
 async def test_sheet_load_values_true_marks_only_that_sheet(fake_emscripten):
     book = _make_book(lazy=True)
@@ -199,3 +227,84 @@ async def test_public_wrapper_forwards_values_kwarg(fake_emscripten):
     await book.load(values=True)
     # Values are now readable through the public wrapper.
     assert book.sheets[0]["A1"].value is not None
+
+
+# --- on-demand reads via a Fetcher (outside of xlwings Lite) ---
+
+
+class InProcessFetcher(R.Fetcher):
+    """Fake client that serves on-demand reads from a complete book payload"""
+
+    def __init__(self, book_json):
+        self.book_json = book_json
+        self.client_book = xw.Book(json=copy.deepcopy(book_json))
+        self.calls = []
+
+    async def get_book_data(self, include=None, lazy=False):
+        self.calls.append(("get_book_data", include, lazy))
+        data = copy.deepcopy(self.book_json)
+        if include is not None:
+            data["sheets"] = [s for s in data["sheets"] if s["name"] == include]
+        if lazy:
+            for sheet in data["sheets"]:
+                sheet["values"] = [[]]
+        return data
+
+    async def get_range_values(self, sheet_name, address):
+        self.calls.append(("get_range_values", sheet_name, address))
+        rng = self.client_book.sheets[sheet_name][address]
+        return [list(row) for row in rng.impl.raw_value]
+
+    async def get_expanded_address(self, sheet_name, address, mode):
+        self.calls.append(("get_expanded_address", sheet_name, address, mode))
+        return self.client_book.sheets[sheet_name][address].expand(mode).address
+
+
+@pytest.mark.anyio
+async def test_get_value_with_fetcher():
+    fetcher = InProcessFetcher(_book_json([[1, 2, 3], [4, 5, 6], [7, 8, 9]]))
+    # The client only sends the structure of the book
+    book = xw.Book(json=_book_json(), fetcher=fetcher)
+    book.impl._lazy = True
+    sheet = book.sheets[0]
+    assert await sheet["B2:C3"].get_value() == [[5, 6], [8, 9]]
+    assert await sheet["A1"].options(expand="table").get_value() == [
+        [1, 2, 3],
+        [4, 5, 6],
+        [7, 8, 9],
+    ]
+    assert await sheet["A1:C3"].options(chunksize=2).get_value() == [
+        [1, 2, 3],
+        [4, 5, 6],
+        [7, 8, 9],
+    ]
+    assert fetcher.calls == [
+        ("get_range_values", "S", "$B$2:$C$3"),
+        ("get_expanded_address", "S", "$A$1", "table"),
+        ("get_range_values", "S", "$A$1:$C$3"),
+        ("get_range_values", "S", "$A$1:$C$2"),
+        ("get_range_values", "S", "$A$3:$C$3"),
+    ]
+    with pytest.raises(XlwingsError, match="haven't been loaded"):
+        sheet["A1"].value
+
+
+@pytest.mark.anyio
+async def test_load_with_fetcher():
+    fetcher = InProcessFetcher(_book_json([[1, 2], [3, 4]]))
+    book = xw.Book(json=_book_json(), fetcher=fetcher)
+    book.impl._lazy = True
+    await book.load()
+    assert fetcher.calls[-1] == ("get_book_data", None, True)
+    await book.sheets[0].load(values=True)
+    assert fetcher.calls[-1] == ("get_book_data", "S", False)
+    assert book.sheets[0]["A1:B2"].value == [[1, 2], [3, 4]]
+
+
+@pytest.mark.anyio
+async def test_get_value_without_fetcher_raises():
+    book = xw.Book(json=_book_json([[1]]))
+    with pytest.raises(NotImplementedError, match="fetcher"):
+        await book.sheets[0]["A1"].get_value()
+    with pytest.raises(NotImplementedError, match="fetcher"):
+        await book.load()
@@ -1,12 +1,17 @@
+import os
 import sys
+import threading
 from types import ModuleType
 
 import pytest
 
 from xlwings.server import (
     custom_functions_call,
+    custom_functions_call_batch,
     custom_functions_meta,
+    func,
     register_injectable_typehint,
+    set_executor,
 )
 
 
@@ -489,3 +494,241 @@ async def stream():
 
     assert len(results) == 1
     assert "WithScript is not supported in streaming functions" in results[0][0][0]
+
+
+@func(executor="process")
+def process_id(x):
+    # Module level, so the process pool's workers can import it
+    return [os.getpid(), x]
+
+
+def test_executors(monkeypatch):
+    import anyio
+
+    from xlwings import XlwingsError
+
+    module = make_module(
+        monkeypatch,
+        "executors",
+        """
+import threading
+from xlwings.server import func
+
+@func(executor="thread")
+def in_thread():
+    return threading.current_thread().name
+
+@func
+def default():
+    return threading.current_thread().name
+""",
+    )
+
+    assert anyio.run(call, module, "in_thread", [])[0][0].startswith(
+        "xlwings-custom-functions"
+    )
+    assert anyio.run(call, module, "default", []) == [[threading.current_thread().name]]
+    try:
+        set_executor("thread", max_workers=1)
+        assert anyio.run(call, module, "default", [])[0][0].startswith(
+            "xlwings-custom-functions"
+        )
+    finally:
+        set_executor()
+
+    pid, x = anyio.run(call, sys.modules[__name__], "process_id", [2.0])[0]
+    assert pid != os.getpid() and x == 2.0
+
+    with pytest.raises(XlwingsError):
+        func(executor="greenlet")(lambda: None)
+    with pytest.raises(XlwingsError):
+        set_executor("greenlet")
+
+
+def test_custom_functions_call_batch(monkeypatch):
+    import anyio
+
+    from xlwings import XlwingsError
+
+    module = make_module(
+        monkeypatch,
+        "batch",
+        """
+import asyncio
+from xlwings.server import func
+
+running = []
+max_running = []
+
+@func
+async def double(x):
+    running.append(x)
+    max_running.append(len(running))
+    await asyncio.sleep(0.01)
+    running.remove(x)
+    return 2 * x
+
+@func
+def fail():
+    raise ValueError("fail")
+
+@func
+async def stream():
+    yield 1
+""",
+    )
+
+    class CountingUser(FakeCurrentUser):
+        role_checks = 0
+
+        async def has_required_roles(self, required_roles):
+            self.role_checks += 1
+            return True
+
+    user = CountingUser()
+    data_list = [make_call_data("double", [[[float(i)]]]) for i in range(10)]
+    data_list[3] = make_call_data("fail", [])
+    data_list[5] = make_call_data("stream", [])
+
+    results = anyio.run(
+        lambda: custom_functions_call_batch(
+            data_list, module, current_user=user, max_concurrency=4
+        )
+    )
+
+    assert [r for i, r in enumerate(results) if i not in (3, 5)] == [
+        [[2.0 * i]] for i in range(10) if i not in (3, 5)
+    ]
+    assert isinstance(results[3], ValueError)
+    assert isinstance(results[5], XlwingsError)
+    assert user.role_checks == 1
+    assert max(module.max_running) == 4
+
+
+def test_cached_results(monkeypatch):
+    import asyncio
+
+    import anyio
+
+    from xlwings import XlwingsError
+    from xlwings.pro import result_cache
+
+    monkeypatch.setattr(result_cache, "cache", result_cache.LRUResultCache())
+    monkeypatch.setattr(result_cache, "stats", {})
+    module = make_module(
+        monkeypatch,
+        "cached_results",
+        """
+import asyncio
+from xlwings.server import func
+
+calls = []
+
+@func(cache=True)
+async def price(ticker):
+    calls.append(ticker)
+    await asyncio.sleep(0.01)
+    return len(calls)
+
+@func(cache=True, ttl=0)
+def expired(x):
+    calls.append(x)
+    return len(calls)
+
+@func(cache="user")
+def per_user(x):
+    calls.append(x)
+    return len(calls)
+""",
+    )
+
+    async def call_as(user, func_name, args):
+        return await custom_functions_call(
+            make_call_data(func_name, args), module, current_user=user
+        )
+
+    async def concurrent_calls():
+        return await asyncio.gather(*(call(module, "price", ["XYZ"]) for _ in range(3)))
+
+    # Concurrent identical calls compute once
+    assert anyio.run(concurrent_calls) == [[[1]]] * 3
+    assert anyio.run(call, module, "price", ["XYZ"]) == [[1]]
+    assert anyio.run(call, module, "price", ["ABC"]) == [[2]]
+    assert result_cache.stats["price"] == {"hits": 3, "misses": 2}
+
+    assert anyio.run(call, module, "expired", [1.0]) == [[3]]
+    assert anyio.run(call, module, "expired", [1.0]) == [[4]]
+
+    alice, bob = FakeCurrentUser("alice"), FakeCurrentUser("bob")
+    alice.id, bob.id = "alice", "bob"
+    assert anyio.run(call_as, alice, "per_user", [1.0]) == [[5]]
+    assert anyio.run(call_as, alice, "per_user", [1.0]) == [[5]]
+    assert anyio.run(call_as, bob, "per_user", [1.0]) == [[6]]
+
+    with pytest.raises(XlwingsError):
+        func(cache="yes")(lambda: None)
+
+
+def test_cache_rejects_injected_parameters():
+    from xlwings import XlwingsError
+    from xlwings.pro.caller import Caller
+
+    def whoami(x, user: FakeCurrentUser):
+        return user.id
+
+    def address(x, caller: Caller):
+        return caller.address
+
+    # The injected values aren't part of the cache key
+    with pytest.raises(XlwingsError, match="is injected"):
+        func(cache=True)(whoami)
+    with pytest.raises(XlwingsError, match="calling cell"):
+        func(cache="user")(address)
+    assert func(cache="user")(whoami).__xlfunc__["cache"]["per_user"]
+
+
+def test_cancelled_call_doesnt_cancel_identical_calls(monkeypatch):
+    import asyncio
+
+    from xlwings.pro import result_cache
+
+    monkeypatch.setattr(result_cache, "cache", result_cache.LRUResultCache())
+    monkeypatch.setattr(result_cache, "stats", {})
+    calls = []
+
+    async def compute():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return [[len(calls)]]
+
+    async def main():
+        first = asyncio.ensure_future(result_cache.get_or_compute("f", "k", compute))
+        await asyncio.sleep(0)
+        second = asyncio.ensure_future(result_cache.get_or_compute("f", "k", compute))
+        await asyncio.sleep(0)
+        # E.g., the client of the first call disconnected
+        first.cancel()
+        assert await second == [[1]]
+        with pytest.raises(asyncio.CancelledError):
+            await first
+
+    asyncio.run(main())
+    assert calls == [1]
+    assert result_cache.cache.get("f", "k") == [[1]]
+    assert not result_cache._in_flight
+
+
+def test_lru_result_cache():
+    from xlwings.pro.result_cache import LRUResultCache
+
+    cache = LRUResultCache(maxsize=2)
+    cache.set("f", "a", [[1]])
+    cache.set("f", "b", [[2]])
+    cache.get("f", "a")
+    cache.set("f", "c", [[3]])
+    assert cache.get("f", "b") is None
+    assert cache.get("f", "a") == [[1]]
+    cache.set("g", "a", [[4]], maxsize=1)
+    assert len(cache) == 3
+    cache.clear("f")
+    assert len(cache) == 1
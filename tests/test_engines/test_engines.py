@@ -1,7 +1,11 @@
 import asyncio
+import base64
+import copy
 import datetime as dt
+import gzip
 import json
 import os
+import struct
 from pathlib import Path
 
 import pytest
@@ -14,6 +18,10 @@ try:
     import pandas as pd
 except ImportError:
     pd = None
+try:
+    import polars as pl
+except ImportError:
+    pl = None
 try:
     from dateutil import tz
 except ImportError:
@@ -315,6 +323,25 @@ def test_partly_outside_usedrange(book):
     assert sheet["D4:F5"].value == [[None, None, None], [None, None, None]]
 
 
+def test_end(book):
+    sheet1 = book.sheets[0]
+    assert sheet1["A1"].end("down").address == "$A$3"
+    assert sheet1["A1"].end("right").address == "$C$1"
+    assert sheet1["C3"].end("up").address == "$C$1"
+    assert sheet1["C3"].end("left").address == "$A$3"
+    assert sheet1["A4"].end("down").address == "$A$4"
+    assert sheet1["A15"].end("down").address == "$A$17"
+
+
+@pytest.mark.skipif(engine != "calamine", reason="requires calamine engine")
+def test_current_region(book):
+    sheet1 = book.sheets[0]
+    assert sheet1["B2"].current_region.address == "$A$1:$D$3"
+    assert sheet1["A11"].current_region.address == "$A$10:$B$11"
+    assert sheet1["C16"].current_region.address == "$A$15:$C$17"
+    assert sheet1["F20"].current_region.address == "$F$20"
+
+
 def test_len(book):
     assert len(book.sheets[0]["A1:C4"]) == 12
 
@@ -341,6 +368,221 @@ def test_pandas_df(book):
     )
 
 
+@pytest.mark.skipif(engine != "calamine", reason="requires calamine engine")
+@pytest.mark.skipif(not pd, reason="requires pandas")
+def test_numeric_ranges_match_list_conversion(book):
+    # On calamine, purely numeric ranges are converted from a NumPy array directly,
+    # non-default options like dates=... use the list-based conversion
+    sheet = book.sheets[0]
+    for address in ["A2:C3", "A3:C5", "D5:E7", "B2"]:
+        np.testing.assert_array_equal(
+            sheet[address].options(np.array).value,
+            sheet[address].options(np.array, dates=dt.datetime).value,
+        )
+    np.testing.assert_array_equal(
+        sheet["A2:C2"].options(np.array, expand="down", transpose=True).value,
+        np.array([[1.1, 4.4], [2.2, 5.5], [3.3, 6.6]]),
+    )
+    for address in ["A1:C3", "A1:C5", "A1:D3"]:
+        pd.testing.assert_frame_equal(
+            sheet[address].options(pd.DataFrame).value,
+            sheet[address].options(pd.DataFrame, dates=dt.datetime).value,
+        )
+    pd.testing.assert_frame_equal(
+        sheet["A1:C1"].options(pd.DataFrame, index=False, expand="down").value,
+        pd.DataFrame(data=[[1.1, 2.2, 3.3], [4.4, 5.5, 6.6]], columns=["a", "b", "c"]),
+    )
+
+
+@pytest.mark.skipif(engine != "calamine", reason="requires calamine engine")
+@pytest.mark.skipif(not np, reason="requires NumPy")
+def test_numpy_array_reads_mixed_ranges_once(book, monkeypatch):
+    # Ranges that aren't purely numeric are converted from the values of the array
+    # instead of being read a second time as list
+    sheet = book.sheets[0]
+    expected = {
+        address: sheet[address].options(np.array, dates=dt.datetime).value
+        for address in ["A1:C3", "A1:A3", "A1"]
+    }
+
+    def read_raw_value(*args, **kwargs):
+        raise AssertionError("The range was read a second time")
+
+    monkeypatch.setattr(type(sheet["A1"].impl), "raw_value", property(read_raw_value))
+    monkeypatch.setattr(type(sheet["A1"].impl), "read_raw_value", read_raw_value)
+    for address, value in expected.items():
+        np.testing.assert_array_equal(sheet[address].options(np.array).value, value)
+    np.testing.assert_array_equal(
+        sheet["A1:C1"].options(np.array, expand="down", columns=[2, 0]).value,
+        np.array([["c", "a"], [3.3, 1.1], [6.6, 4.4]]),
+    )
+
+
+@pytest.mark.skipif(engine != "calamine", reason="requires calamine engine")
+@pytest.mark.skipif(not pd, reason="requires pandas")
+def test_typed_columns_match_list_conversion(book):
+    # On calamine, DataFrames are built from typed columns
+    sheet = book.sheets[2]
+    for address in ["A1:B2", "B1:B4", "A2:B4", "A3:B3", "A2:B3"]:
+        for header in [0, 1]:
+            pd.testing.assert_frame_equal(
+                sheet[address].options(pd.DataFrame, header=header).value,
+                sheet[address]
+                .options(pd.DataFrame, header=header, dates=dt.datetime)
+                .value,
+            )
+    pd.testing.assert_frame_equal(
+        book.sheets[0].cells.options(pd.DataFrame, index=False).value,
+        book.sheets[0]
+        .cells.options(pd.DataFrame, index=False, dates=dt.datetime)
+        .value,
+    )
+    for address in ["A4:C10", "A9:C17"]:
+        rng = book.sheets[0][address]
+        pd.testing.assert_frame_equal(
+            rng.options(pd.DataFrame, header=0, categorical=True).value,
+            rng.options(
+                pd.DataFrame, header=0, categorical=True, dates=dt.datetime
+            ).value,
+        )
+
+
+@pytest.mark.skipif(engine != "calamine", reason="requires calamine engine")
+@pytest.mark.skipif(not pl, reason="requires polars")
+def test_typed_columns_polars(book):
+    sheet = book.sheets[2]
+    for address, header in [("B1:B4", True), ("A2:B3", False), ("A3:B3", False)]:
+        rng = sheet[address].options(pl.DataFrame, header=header)
+        expected = rng.options(pl.DataFrame, header=header, dates=dt.datetime).value
+        assert rng.value.equals(expected)
+    df = book.sheets[0]["A1:C1"].options(pl.DataFrame, expand="down").value
+    assert df.columns == ["a", "b", "c"]
+    assert df.to_dict(as_series=False) == {
+        "a": [1.1, 4.4],
+        "b": [2.2, 5.5],
+        "c": [3.3, 6.6],
+    }
+
+
+def test_columns_option(book):
+    sheet = book.sheets[0]
+    assert sheet["A1:C3"].options(columns=[2, 0]).value == [
+        ["c", "a"],
+        [3.3, 1.1],
+        [6.6, 4.4],
+    ]
+    assert sheet["A1:C3"].options(columns=["b"]).value == ["b", 2.2, 5.5]
+    assert sheet["A1:C3"].options(columns=[-1], skip_rows=1).value == [3.3, 6.6]
+    np.testing.assert_array_equal(
+        sheet["A2:C3"].options(np.array, columns=[0, 2]).value,
+        np.array([[1.1, 3.3], [4.4, 6.6]]),
+    )
+    with pytest.raises(ValueError):
+        sheet["A1:C3"].options(columns=["x"]).value
+    with pytest.raises(IndexError):
+        sheet["A1:C3"].options(columns=[3]).value
+
+
+def test_rows_options(book):
+    sheet = book.sheets[0]
+    assert sheet["A1:C3"].options(skip_rows=1).value == [
+        [1.1, 2.2, 3.3],
+        [4.4, 5.5, 6.6],
+    ]
+    assert sheet["A1:C3"].options(max_rows=1).value == ["a", "b", "c"]
+    assert sheet["A1:C1"].options(expand="down", skip_rows=2).value == [4.4, 5.5, 6.6]
+    assert list(sheet["A1:C3"].options(skip_rows=1, columns=[1]).iter_rows(1)) == [
+        [[2.2]],
+        [[5.5]],
+    ]
+    with pytest.raises(ValueError):
+        sheet["A1:C3"].options(skip_rows=3).value
+
+
+@pytest.mark.skipif(not pd, reason="requires pandas")
+def test_columns_and_rows_options_df(book):
+    sheet = book.sheets[0]
+    pd.testing.assert_frame_equal(
+        sheet["A1:C3"].options(pd.DataFrame, index=False, columns=["c", "a"]).value,
+        pd.DataFrame(data=[[3.3, 1.1], [6.6, 4.4]], columns=["c", "a"]),
+    )
+    pd.testing.assert_frame_equal(
+        sheet["A1:C3"].options(pd.DataFrame, index=False, max_rows=1).value,
+        pd.DataFrame(data=[[1.1, 2.2, 3.3]], columns=["a", "b", "c"]),
+    )
+
+
+@pytest.mark.skipif(not pd, reason="requires pandas")
+def test_categorical_df(book):
+    sheet = book.sheets[0]
+    df = (
+        sheet["A4:C10"]
+        .options(pd.DataFrame, header=0, index=False, categorical=True)
+        .value
+    )
+    pd.testing.assert_series_equal(
+        df[0], pd.Series(pd.Categorical([None] * 6 + ["Column1"])), check_names=False
+    )
+    assert df[2].dtype == object
+    df = (
+        sheet["A16:C17"]
+        .options(pd.DataFrame, header=0, index=False, categorical=True)
+        .value
+    )
+    assert df[0].dtype == object
+
+
+@pytest.mark.skipif(not pl, reason="requires polars")
+def test_categorical_polars(book):
+    df = (
+        book.sheets[0]["A9:C10"]
+        .options(pl.DataFrame, header=False, categorical=True)
+        .value
+    )
+    assert df["column_0"].dtype == pl.Categorical
+    assert df["column_0"].to_list() == [None, "Column1"]
+
+
+def test_iter_rows(book):
+    sheet = book.sheets[0]
+    assert list(sheet["A1:C3"].iter_rows(batch_size=2)) == [
+        [["a", "b", "c"], [1.1, 2.2, 3.3]],
+        [[4.4, 5.5, 6.6]],
+    ]
+    assert list(sheet["A2"].iter_rows()) == [[[1.1]]]
+    with pytest.raises(ValueError, match="transpose"):
+        next(sheet["A1:C3"].options(transpose=True).iter_rows(batch_size=2))
+
+
+@pytest.mark.skipif(not pd, reason="requires pandas")
+def test_iter_rows_df(book):
+    sheet = book.sheets[0]
+    dfs = list(
+        sheet["A1:C1"]
+        .options(pd.DataFrame, index=False, expand="down")
+        .iter_rows(batch_size=1)
+    )
+    assert len(dfs) == 2
+    pd.testing.assert_frame_equal(
+        pd.concat(dfs, ignore_index=True),
+        pd.DataFrame(data=[[1.1, 2.2, 3.3], [4.4, 5.5, 6.6]], columns=["a", "b", "c"]),
+    )
+
+
+@pytest.mark.skipif(engine != "calamine", reason="requires calamine engine")
+def test_sheet_iter_batches(book):
+    sheet = book.sheets[0]
+    assert sheet.used_range.address == "$A$1:$D$17"
+    batches = list(sheet.iter_batches(batch_size=5))
+    assert [len(batch) for batch in batches] == [5, 5, 5, 2]
+    assert sum(batches, []) == sheet.used_range.value
+    batches = list(sheet.iter_batches(10, "df", index=False))
+    assert [len(df) for df in batches] == [10, 6]
+    assert list(batches[0].columns) == ["a", "b", "c", None]
+    with pytest.raises(ValueError, match="transpose"):
+        next(sheet.iter_batches(2, transpose=True))
+
+
 def test_read_basic_types(book):
     sheet = book.sheets[2]
     assert sheet["A1:B4"].value == [
@@ -380,6 +622,382 @@ def test_write_basic_types(book):
     )
 
 
+@pytest.mark.skipif(engine != "remote", reason="requires remote engine")
+@pytest.mark.skipif(not pd, reason="requires pandas")
+def test_write_df_by_column(book):
+    # The columns are cleaned with array operations, object columns cell by cell
+    df = pd.DataFrame(
+        {
+            "float": [1.5, np.nan, -0.0],
+            "int": [1, 2, 3],
+            "date": pd.to_datetime(
+                ["2021-10-01", None, "2021-12-31 23:35:00.5"], format="ISO8601"
+            ),
+            "object": [dt.date(2021, 10, 1), pd.NaT, "string"],
+        }
+    )
+    book.sheets[0]["A1"].options(index=False).value = df
+    assert book.json()["actions"][0]["values"] == [
+        ["float", "int", "date", "object"],
+        [1.5, 1, "2021-10-01", "2021-10-01"],
+        ["", 2, "", ""],
+        [-0.0, 3, "2021-12-31 23:35:00", "string"],
+    ]
+
+    book.impl._json = {"actions": []}
+    book.sheets[0]["A1"].options(index=False, transpose=True).value = df[["float"]]
+    assert book.json()["actions"][0]["values"] == [["float", 1.5, "", -0.0]]
+
+    book.impl._json = {"actions": []}
+    book.sheets[0]["A1"].value = np.array([[1.0, np.nan], [2.0, 3.0]])
+    assert book.json()["actions"][0]["values"] == [[1.0, ""], [2.0, 3.0]]
+
+
+@pytest.mark.skipif(engine != "remote", reason="requires remote engine")
+def test_converters_write_value_returns_rows(book):
+    from xlwings.conversion import NumpyArrayConverter, PandasDataFrameConverter
+
+    df = pd.DataFrame({"a": [1.5, 2.5]})
+    rows = PandasDataFrameConverter.write_value(df, {"index": False})
+    assert rows == [["a"], [1.5], [2.5]]
+    assert NumpyArrayConverter.write_value(np.array([[1, 2]]), {}) == [[1, 2]]
+
+    # Subclasses that post-process the rows of write_value keep working
+    class UpperHeaderConverter(PandasDataFrameConverter):
+        @classmethod
+        def write_value(cls, value, options):
+            rows = super().write_value(value, options)
+            rows[0] = [name.upper() for name in rows[0]]
+            return rows
+
+    book.sheets[0]["A1"].options(UpperHeaderConverter, index=False).value = df
+    assert book.json()["actions"][0]["values"] == [["A"], [1.5], [2.5]]
+
+
+def test_read_options_by_column(book):
+    sheet = book.sheets[0]
+    assert sheet["A1:C3"].options(numbers=int).value == [
+        ["a", "b", "c"],
+        [1, 2, 3],
+        [4, 6, 7],
+    ]
+    assert sheet["A4:C5"].options(empty="NA").value == [
+        ["NA", "NA", "NA"],
+        ["NA", "NA", "NA"],
+    ]
+
+
+@pytest.mark.skipif(engine != "remote", reason="requires remote engine")
+def test_coalesce_actions(book):
+    sheet = book.sheets[0]
+    for row in range(2):
+        for col in range(3):
+            sheet[row, col].value = row * 3 + col
+            sheet[row, col].number_format = "0.00"
+    sheet["B1:C2"].number_format = "0%"
+    actions = book.json()["actions"]
+    assert [action["func"] for action in actions] == [
+        "setValues",
+        "setNumberFormat",
+        "setNumberFormat",
+    ]
+    assert actions[0]["values"] == [[0, 1, 2], [3, 4, 5]]
+    assert (actions[0]["row_count"], actions[0]["column_count"]) == (2, 3)
+    assert actions[1]["row_count"] == 2 and actions[1]["args"] == ["0.00"]
+    assert actions[2]["args"] == ["0%"]
+
+    # Overlapping writes are merged, later values win
+    book.impl._json = {"actions": []}
+    sheet["A1:B2"].value = 1
+    sheet["A2:B3"].value = [[2, 3], [4, 5]]
+    actions = book.json()["actions"]
+    assert len(actions) == 1
+    assert actions[0]["values"] == [[1, 1], [2, 3], [4, 5]]
+
+    # Superseded writes are dropped unless another action touches them in between
+    book.impl._json = {"actions": []}
+    sheet["A1"].value = 1
+    sheet["D1"].clear_contents()
+    sheet["A1:A2"].value = [[2], [3]]
+    sheet["B1"].clear_contents()
+    sheet["B1"].value = 4
+    sheet["B1"].value = 5
+    actions = book.json()["actions"]
+    assert [action["func"] for action in actions] == [
+        "rangeClearContents",
+        "setValues",
+        "rangeClearContents",
+        "setValues",
+    ]
+    assert actions[1]["values"] == [[2], [3]]
+    assert actions[3]["values"] == [[5]]
+
+    # Never across an action that isn't limited to its range
+    book.impl._json = {"actions": []}
+    sheet["A1"].value = 1
+    sheet["A1"].insert("down")
+    sheet["A1"].value = 2
+    assert len(book.json()["actions"]) == 3
+
+
+@pytest.mark.skipif(engine != "remote", reason="requires remote engine")
+def test_coalesce_cell_by_cell_column(book):
+    sheet = book.sheets[0]
+    for row in range(10_000):
+        sheet[row, 0].value = row
+    actions = book.json()["actions"]
+    assert len(actions) == 1
+    assert actions[0]["values"] == [[row] for row in range(10_000)]
+    # Cached until the next action is added
+    assert book.json()["actions"][0] is actions[0]
+    sheet[0, 0].value = -1
+    sheet[10_000, 0].value = 10_000
+    actions = book.json()["actions"]
+    assert [action["row_count"] for action in actions] == [10_000, 1]
+    assert actions[0]["values"][0] == [-1]
+
+
+@pytest.mark.skipif(engine != "remote", reason="requires remote engine")
+def test_large_writes_are_not_merged(book):
+    sheet = book.sheets[0]
+    sheet["A1"].options(chunksize=5_000).value = [[i, i] for i in range(12_000)]
+    actions = book.json()["actions"]
+    assert [action["row_count"] for action in actions] == [5_000, 5_000, 2_000]
+
+
+@pytest.mark.skipif(engine != "remote", reason="requires remote engine")
+def test_json_chunks(book):
+    sheet = book.sheets[0]
+    sheet["A1"].value = [[i, i, i] for i in range(10)]
+    sheet["A1"].number_format = "0.00"
+    sheet["E1"].value = "x"
+    chunks = list(book.json_chunks(max_cells=9))
+    assert [
+        [(a["func"], a["start_row"], a["row_count"]) for a in chunk["actions"]]
+        for chunk in chunks
+    ] == [
+        [("setValues", 0, 3)],
+        [("setValues", 3, 3)],
+        [("setValues", 6, 3)],
+        [("setValues", 9, 1), ("setNumberFormat", 0, 1), ("setValues", 0, 1)],
+    ]
+    values = [row for chunk in chunks[:4] for row in chunk["actions"][0]["values"]]
+    assert values == [[i, i, i] for i in range(10)]
+
+    book.impl._json = {"actions": []}
+    assert list(book.json_chunks(max_cells=9)) == [{"actions": []}]
+
+
+def decode_values(values):
+    """Reference decoder of xlwings.pro._xlremote.encode_values"""
+    if not isinstance(values, dict):
+        return values
+    data = values["data"]
+    if values["encoding"] == "float64" or values.get("compression") == "gzip":
+        data = base64.b64decode(data)
+    if values.get("compression") == "gzip":
+        data = gzip.decompress(data)
+        if values["encoding"] != "float64":
+            data = json.loads(data)
+    nrows, ncols = values["shape"]
+    if values["encoding"] == "float64":
+        flat = struct.unpack(f"<{nrows * ncols}d", data)
+        return [list(flat[ix * ncols : (ix + 1) * ncols]) for ix in range(nrows)]
+    if values["encoding"] == "rle":
+        flat = [value for value, count in data for _ in range(count)]
+        return [flat[ix::nrows] for ix in range(nrows)]  # column-major
+    return data
+
+
+@pytest.mark.skipif(engine != "remote", reason="requires remote engine")
+@pytest.mark.parametrize(
+    "encodings, expected",
+    [
+        ([], [None, None, None]),
+        (["float64"], ["float64", None, None]),
+        (["rle"], [None, "rle", None]),
+        (["float64", "rle", "gzip"], ["float64", "rle", "plain"]),
+    ],
+)
+def test_value_encodings(book, monkeypatch, encodings, expected):
+    monkeypatch.setitem(book.impl.api, "encodings", encodings)
+    sheet = book.sheets[0]
+    numbers = [[i + 0.5, i, -i] for i in range(1_000)]
+    runs = [["a", "", 1] if i < 500 else ["b", True, 1.0] for i in range(1_000)]
+    mixed = [[str(i), i, ""] for i in range(1_000)]
+    sheet["A1"].value = numbers
+    sheet["E1"].value = runs
+    sheet["I1"].value = mixed
+    sheet["M1"].value = [[1, 2]]  # too small to be encoded
+    actions = book.json()["actions"]
+    for action, encoding, values in zip(actions, expected, [numbers, runs, mixed]):
+        if encoding is None:
+            assert action["values"] == values
+        else:
+            assert action["values"]["encoding"] == encoding
+            assert action["values"]["shape"] == [1_000, 3]
+            assert (action["values"].get("compression") == "gzip") == (
+                "gzip" in encodings
+            )
+            decoded = decode_values(action["values"])
+            assert decoded == values
+            if encoding != "float64":
+                assert [list(map(type, row)) for row in decoded] == [
+                    list(map(type, row)) for row in values
+                ]
+    assert actions[3]["values"] == [[1, 2]]
+
+
+@pytest.mark.skipif(engine != "remote", reason="requires remote engine")
+def test_delta_payload(monkeypatch):
+    from xlwings.pro import _xlremote
+
+    monkeypatch.setattr(_xlremote, "snapshots", _xlremote.SnapshotCache(maxsize=2))
+    header = {key: data[key] for key in ("client", "version", "book", "names")}
+    base = {
+        **header,
+        "snapshot_id": "1",
+        "sheets": [
+            {
+                "name": "Sheet1",
+                "values": [[1, 2], [3, 4]],
+                "pictures": [],
+                "tables": [],
+            },
+            {"name": "Sheet2", "values": [["a"]], "pictures": [], "tables": []},
+        ],
+    }
+    xw.Book(json=base)
+    delta = {
+        **header,
+        "base_snapshot_id": "1",
+        "snapshot_id": "2",
+        "sheets": [
+            {
+                "name": "Sheet1",
+                "changes": [{"start_row": 1, "start_column": 1, "values": [[5, 6]]}],
+                "shape": [2, 3],
+                "pictures": [],
+                "tables": [],
+            },
+            {"name": "Sheet2", "shape": [2, 2], "pictures": [], "tables": []},
+            {"name": "Sheet3", "values": [["new"]], "pictures": [], "tables": []},
+        ],
+    }
+    delta_copy = copy.deepcopy(delta)
+    book = xw.Book(json=delta)
+    assert book.sheets[0]["A1:C2"].value == [[1, 2, None], [3, 5, 6]]
+    assert book.sheets[1]["A1:C3"].value == [
+        ["a", None, None],
+        [None, None, None],
+        [None, None, None],
+    ]
+    assert book.sheets[1]["A1"].expand().value == "a"
+    assert book.sheets[2]["A1"].value == "new"
+    # Neither applying the delta nor reading from the book modifies the payload
+    assert delta == delta_copy
+
+    # A delta on top of a delta
+    delta2 = {
+        **header,
+        "base_snapshot_id": "2",
+        "sheets": [
+            {
+                "name": "Sheet1",
+                "changes": [{"start_row": 0, "start_column": 0, "values": [[0]]}],
+                "shape": [1, 2],
+                "pictures": [],
+                "tables": [],
+            }
+        ],
+    }
+    book = xw.Book(json=delta2)
+    assert book.sheets[0]["A1"].expand().value == [0, 2]
+
+    # Without shape, changes beyond the base keep the values rectangular
+    delta3 = {
+        **header,
+        "base_snapshot_id": "2",
+        "sheets": [
+            {
+                "name": "Sheet1",
+                "changes": [{"start_row": 3, "start_column": 3, "values": [[7]]}],
+                "pictures": [],
+                "tables": [],
+            }
+        ],
+    }
+    sheet = xw.Book(json=delta3).sheets[0]
+    values = sheet.impl.api["values"]
+    assert len(values) == 4 and {len(row) for row in values} == {4}
+    assert sheet["A1:D4"].value == [
+        [1, 2, None, None],
+        [3, 5, 6, None],
+        [None, None, None, None],
+        [None, None, None, 7],
+    ]
+
+    # Evicted (maxsize) or expired snapshots
+    xw.Book(json={**base, "snapshot_id": "3"})
+    with pytest.raises(xw.SnapshotMissError):
+        xw.Book(json={**delta2, "base_snapshot_id": "1"})
+    monkeypatch.setattr(_xlremote.snapshots, "ttl", -1)
+    xw.Book(json={**base, "snapshot_id": "4"})
+    with pytest.raises(xw.SnapshotMissError):
+        xw.Book(json={**delta2, "base_snapshot_id": "4"})
+
+
+def to_columns_format(values):
+    columns = [list(col) for col in zip(*values)]
+    dates = [
+        [row_ix, col_ix]
+        for row_ix, row in enumerate(values)
+        for col_ix, value in enumerate(row)
+        if isinstance(value, str) and value.endswith(".000Z")
+    ]
+    return {"format": "columns", "columns": columns, "dates": dates}
+
+
+@pytest.mark.skipif(engine != "remote", reason="requires remote engine")
+def test_columns_format():
+    rows_data = json.loads(json.dumps(data))
+    columns_data = json.loads(json.dumps(data))
+    for columns_sheet in columns_data["sheets"]:
+        columns_sheet["values"] = to_columns_format(columns_sheet["values"])
+    rows_book = xw.Book(json=rows_data)
+    columns_book = xw.Book(json=columns_data)
+    for ix in range(len(rows_book.sheets)):
+        rows_sheet, columns_sheet = rows_book.sheets[ix], columns_book.sheets[ix]
+        for address in ("A1", "A1:D4", "D2", "B3:E20", "A100"):
+            assert columns_sheet[address].value == rows_sheet[address].value
+        options = {"expand": "table", "columns": [0, 1]}
+        assert (
+            columns_sheet["A1"].options(**options).value
+            == rows_sheet["A1"].options(**options).value
+        )
+        options = {"dates": dt.date, "empty": "NA"}
+        assert (
+            columns_sheet["A1:D4"].options(**options).value
+            == rows_sheet["A1:D4"].options(**options).value
+        )
+    # Text that looks like a date isn't parsed if the cell isn't listed under "dates"
+    text_data = {**rows_data, "names": []}
+    text_data["sheets"] = [
+        {
+            "name": "Sheet 1",
+            "values": {
+                "format": "columns",
+                "columns": [["2021-01-01T00:00:00.000Z"], [1.0]],
+                "dates": [],
+            },
+            "pictures": [],
+            "tables": [],
+        }
+    ]
+    text_book = xw.Book(json=text_data)
+    assert text_book.sheets[0]["A1:B1"].value == ["2021-01-01T00:00:00.000Z", 1.0]
+
+
 # sheets
 def test_sheet_access(book):
     assert book.sheets[0] == book.sheets["Sheet 1"]
@@ -403,6 +1021,70 @@ def test_book(book):
     assert book.name == f"engines.{file_extension}"
 
 
+@pytest.mark.skipif(engine != "calamine", reason="requires calamine engine")
+def test_book_close_releases_reader():
+    book = xw.Book(this_dir / f"engines.{file_extension}", mode="r")
+    reader = book.impl.reader
+    assert book.sheets[0]["A1"].value == "a"
+    assert book.sheets[0]["B2"].value == 2.2
+    book.close()
+    assert reader.closed
+
+
+@pytest.mark.skipif(engine != "calamine", reason="requires calamine engine")
+def test_reader_rejects_inverted_range(book):
+    reader = book.impl.reader
+    with pytest.raises(ValueError, match="above its first row"):
+        reader.range_array(0, (5, 0), (2, 1), False)
+    with pytest.raises(ValueError, match="above its first row"):
+        reader.range_columns(0, (5, 0), (2, 1), 1, False)
+
+
+@pytest.mark.skipif(engine != "calamine", reason="requires calamine engine")
+def test_geometry_does_not_read_cells(monkeypatch):
+    from xlwings.pro import _xlcalamine
+
+    class CountingReader:
+        def __init__(self, *args):
+            counts["opens"] += 1
+            self.reader = workbook(*args)
+
+        def __getattr__(self, name):
+            counts["reads"] += 1
+            return getattr(self.reader, name)
+
+    counts = {"opens": 0, "reads": 0}
+    workbook = _xlcalamine.xlwingslib.Workbook
+    monkeypatch.setattr(_xlcalamine.xlwingslib, "Workbook", CountingReader)
+    with xw.Book(this_dir / f"engines.{file_extension}", mode="r") as book:
+        counts["reads"] = 0
+        sheet = book.sheets[0]
+        rng = sheet.range(sheet["A1"], sheet["C3"])
+        assert rng.address == "$A$1:$C$3"
+        assert rng.shape == (3, 3)
+        assert rng.impl.coords == ("Sheet 1", 1, 1, 3, 3)
+        assert rng.resize(2, 2).offset(1, 1).address == "$B$2:$C$3"
+        assert rng[1:, 1].address == "$B$2:$B$3"
+        assert rng.last_cell.address == "$C$3"
+        assert len(rng) == rng.count == 9
+        assert counts["reads"] == 0
+        assert sheet.used_range.address == sheet.used_range.address == "$A$1:$D$17"
+        assert counts["reads"] == 1
+        assert rng.value == sheet["A1:C3"].value
+    assert counts["opens"] == 1
+
+
+@pytest.mark.skipif(engine != "calamine", reason="requires calamine engine")
+def test_book_read_all(book):
+    values = book.read_all()
+    assert list(values) == ["Sheet 1", "Sheet2", "Sheet3"]
+    assert values["Sheet 1"] == book.sheets[0].used_range.value
+    assert values["Sheet3"] == book.sheets[2].used_range.value
+    dfs = book.read_all(sheets=["Sheet 1", 1], convert="df", index=False)
+    assert list(dfs) == ["Sheet 1", "Sheet2"]
+    assert list(dfs["Sheet 1"].columns) == ["a", "b", "c", None]
+
+
 @pytest.mark.skipif(engine in ["calamine", "excel"], reason="calamine engine")
 def test_book_selection(book):
     assert book.selection.address == "$B$3:$B$4"
@@ -676,6 +1358,17 @@ def test_range_with_table_name(book):
     assert book.sheets[0]["Table1"].value == [1.1, 2.2]
 
 
+@pytest.mark.skipif(engine != "remote", reason="requires remote engine")
+def test_range_with_renamed_table():
+    book = xw.Book(json=json.loads(json.dumps(data)))
+    sheet1 = book.sheets[0]
+    assert sheet1["Table1"].value == [1.1, 2.2]
+    sheet1.tables["Table1"].name = "Renamed"
+    assert sheet1["Renamed"].value == [1.1, 2.2]
+    with pytest.raises(xw.NoSuchObjectError):
+        sheet1["Table1"]
+
+
 @pytest.mark.skipif(engine != "remote", reason="requires remote engine")
 def test_tables_add(book):
     sheet1 = book.sheets[0]
@@ -713,24 +1406,15 @@ def test_tables_update(book):
                 "row_count": None,
                 "column_count": None,
             },
+            # Header and data body are sent as a single block
             {
                 "func": "setValues",
                 "args": [None],
-                "values": [[" ", "A", "B"]],
+                "values": [[" ", "A", "B"], [0, 1, 3], [1, 2, 4]],
                 "sheet_position": 0,
                 "start_row": 9,
                 "start_column": 0,
-                "row_count": 1,
-                "column_count": 3,
-            },
-            {
-                "func": "setValues",
-                "args": [None],
-                "values": [[0, 1, 3], [1, 2, 4]],
-                "sheet_position": 0,
-                "start_row": 10,
-                "start_column": 0,
-                "row_count": 2,
+                "row_count": 3,
                 "column_count": 3,
             },
         ]
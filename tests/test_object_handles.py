@@ -4,9 +4,11 @@ Tests for the object-handle converter and its default in-process LRU store
 HTTP status codes) is tested in xlwings-server.
 """
 
+import gc
 import types
 import uuid
 
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -219,6 +221,141 @@ def test_lru_rejects_nonpositive_maxsize():
         oh.LRUObjectCache(maxsize=-5)
 
 
+def test_lru_evicts_beyond_max_bytes():
+    sizes = {"big": 60, "small": 10, "huge": 500}
+    oh.cache = oh.LRUObjectCache(max_bytes=100, sizer=lambda obj: sizes[obj])
+    _, key1 = _write("big")
+    _, key2 = _write("small")
+    _, key3 = _write("small")
+    assert oh.cache.stats()["bytes"] == 80
+
+    # Evicts the least recently used entries until the new one fits
+    _, key4 = _write("big")
+    with pytest.raises(xw.ObjectCacheMissError):
+        Converter.read_value(key1, {})
+    assert oh.cache.stats() == {
+        "entries": 3,
+        "bytes": 80,
+        "maxsize": 1000,
+        "max_bytes": 100,
+        "evictions": 1,
+        "spilled_entries": 0,
+        "spilled_bytes": 0,
+    }
+
+    # An object beyond the budget is kept on its own
+    _, key5 = _write("huge")
+    assert Converter.read_value(key5, {}) == "huge"
+    assert oh.cache.stats()["bytes"] == 500 and len(oh.cache) == 1
+
+    oh.cache.delete(key5)
+    assert oh.cache.stats()["bytes"] == 0
+
+
+def test_estimate_size():
+    df = pd.DataFrame({"a": range(1000), "b": ["x" * 100] * 1000})
+    assert oh.estimate_size(df) == df.memory_usage(deep=True).sum() > 100_000
+    assert oh.estimate_size(df["a"].to_numpy()) == 8000
+    assert oh.estimate_size("x" * 100) > 100
+
+
+def test_lru_rejects_nonpositive_max_bytes():
+    with pytest.raises(ValueError, match="positive integer"):
+        oh.LRUObjectCache(max_bytes=0)
+
+
+def test_lru_spills_evicted_entries(tmp_path):
+    oh.cache = oh.LRUObjectCache(maxsize=1, spill_dir=tmp_path / "spill")
+    df = pd.DataFrame({"a": range(1000), "b": ["x"] * 1000}, index=range(5, 1005))
+    arr = np.arange(1000.0).reshape(100, 10)
+    _, key1 = _write(df)
+    _, key2 = _write(arr)
+    assert len(oh.cache) == 1
+    assert oh.cache.stats()["spilled_entries"] == 1
+    assert len(list(oh.cache.spill_dir.iterdir())) == 1
+
+    # Loading a spilled entry moves it back into memory and spills the other one
+    reloaded = Converter.read_value(key1, {})
+    pd.testing.assert_frame_equal(reloaded, df)
+    reloaded.iloc[0, 0] = 100
+    np.testing.assert_array_equal(Converter.read_value(key2, {}), arr)
+    assert oh.cache.stats()["evictions"] == 3
+    assert oh.cache.stats()["spilled_entries"] == 1
+
+    oh.cache.delete(key1)
+    assert oh.cache.stats()["spilled_bytes"] == 0
+    assert not list(oh.cache.spill_dir.iterdir())
+    with pytest.raises(xw.ObjectCacheMissError):
+        Converter.read_value(key1, {})
+
+
+def test_lru_spill_max_bytes(tmp_path):
+    oh.cache = oh.LRUObjectCache(maxsize=1, spill_dir=tmp_path, spill_max_bytes=15_000)
+    _, key1 = _write(np.zeros(1000))
+    _, key2 = _write(np.ones(1000))
+    _, key3 = _write(np.ones(10))
+    # The oldest spilled file is deleted to stay within spill_max_bytes
+    assert oh.cache.stats()["spilled_entries"] == 1
+    assert oh.cache.stats()["spilled_bytes"] < 15_000
+    with pytest.raises(xw.ObjectCacheMissError):
+        Converter.read_value(key1, {})
+    np.testing.assert_array_equal(Converter.read_value(key2, {}), np.ones(1000))
+
+    oh.cache.clear()
+    assert oh.cache.stats()["spilled_entries"] == 0
+    assert not list(oh.cache.spill_dir.iterdir())
+
+
+def test_lru_drops_unpicklable_entries(tmp_path):
+    oh.cache = oh.LRUObjectCache(maxsize=1, spill_dir=tmp_path)
+    _, key1 = _write(lambda: None)
+    _write("two")
+    assert oh.cache.stats()["spilled_entries"] == 0
+    with pytest.raises(xw.ObjectCacheMissError):
+        Converter.read_value(key1, {})
+
+
+def test_lru_drops_entries_that_cant_be_spilled(tmp_path):
+    oh.cache = oh.LRUObjectCache(maxsize=1, spill_dir=tmp_path)
+    oh.cache.spill_dir.rmdir()
+    _, key1 = _write(np.zeros(1000))
+    _write(np.ones(1000))
+    assert oh.cache.stats()["spilled_entries"] == 0
+    assert oh.cache.stats()["spilled_bytes"] == 0
+    with pytest.raises(xw.ObjectCacheMissError):
+        Converter.read_value(key1, {})
+
+
+def test_lru_truncated_spill_file_is_a_miss(tmp_path):
+    oh.cache = oh.LRUObjectCache(maxsize=1, spill_dir=tmp_path)
+    _, key1 = _write(np.arange(1000.0))
+    _write("two")
+    (path,) = oh.cache.spill_dir.iterdir()
+    path.write_bytes(path.read_bytes()[:100])
+    with pytest.raises(xw.ObjectCacheMissError):
+        Converter.read_value(key1, {})
+    assert oh.cache.stats()["spilled_entries"] == 0
+    assert not path.exists()
+
+
+def test_lru_spills_into_its_own_directory(tmp_path):
+    # Files left behind by another process are neither read nor counted
+    (tmp_path / "stale").write_bytes(b"x" * 20_000)
+    cache = oh.LRUObjectCache(maxsize=1, spill_dir=tmp_path, spill_max_bytes=15_000)
+    cache.set("key1", np.zeros(1000))
+    cache.set("key2", "two")
+    assert cache.spill_dir.parent == tmp_path
+    assert cache.stats()["spilled_entries"] == 1
+    np.testing.assert_array_equal(cache.get("key1"), np.zeros(1000))
+
+    # The directory is removed together with the cache
+    spill_dir = cache.spill_dir
+    del cache
+    gc.collect()
+    assert not spill_dir.exists()
+    assert (tmp_path / "stale").exists()
+
+
 def test_lru_clear():
     _, key = _write("one")
     oh.cache.clear()
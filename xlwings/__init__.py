@@ -55,6 +55,16 @@ class ObjectCacheMissError(XlwingsError):
         )
 
 
+class SnapshotMissError(XlwingsError):
+    """Raised when a delta book payload refers to a snapshot that isn't cached
+    (anymore), e.g., because it expired. The client has to send the full book again.
+    Carries the ``snapshot_id``."""
+
+    def __init__(self, snapshot_id=None):
+        self.snapshot_id = snapshot_id
+        super().__init__(f"Book snapshot is no longer cached: {snapshot_id}")
+
+
 class ObjectHandle:
     """Wraps a return value of a custom function so that it's stored as an object handle
     with custom presentation. Use it to override the cell text, icon, and the properties
@@ -232,6 +242,7 @@ __all__ = (
     "CustomFunctionResult",
     "ObjectCacheMissError",
     "ObjectHandle",
+    "SnapshotMissError",
     "WithScript",
     "Picture",
     "Range",
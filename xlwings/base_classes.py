@@ -206,6 +206,9 @@ class Book:
     def json(self):
         raise NotImplementedError()
 
+    def json_chunks(self, max_cells):
+        raise NotImplementedError()
+
     @property
     def name(self):
         raise NotImplementedError()
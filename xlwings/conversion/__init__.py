@@ -23,11 +23,14 @@ from .standard import (
     AdjustDimensionsStage,
     CleanDataForWriteStage,
     CleanDataFromReadStage,
+    ColumnarValues,
     DictConverter,
     Ensure2DStage,
     ExpandRangeStage,
     RangeAccessor,
     RawValueAccessor,
+    ReadArrayStage,
+    ReadColumnsStage,
     ReadValueFromRangeStage,
     TransposeStage,
     ValueAccessor,
@@ -61,11 +64,14 @@ __all__ = (
     "AdjustDimensionsStage",
     "CleanDataForWriteStage",
     "CleanDataFromReadStage",
+    "ColumnarValues",
     "DictConverter",
     "Ensure2DStage",
     "ExpandRangeStage",
     "RangeAccessor",
     "RawValueAccessor",
+    "ReadArrayStage",
+    "ReadColumnsStage",
     "ReadValueFromRangeStage",
     "TransposeStage",
     "ValueAccessor",
@@ -118,6 +118,12 @@ class Accessor:
     def router(cls, value, rng, options):
         return cls
 
+    @classmethod
+    def header_rows(cls, options):
+        # Number of rows at the top that aren't data, e.g., the header of a DataFrame.
+        # Range.iter_rows() repeats them for every batch.
+        return 0
+
 
 class Converter(Accessor):
     class ToValueStage:
@@ -161,6 +167,11 @@ class Converter(Accessor):
     base_type = None
     base = None
 
+    # Optionally a classmethod like write_value that returns ColumnarValues, so that
+    # engines can serialize the columns directly. The writer only uses it if
+    # write_value isn't overridden by a subclass, see _writes_columns().
+    _write_columns = None
+
     @classmethod
     def base_reader(cls, options, base_type=None):
         if cls.base is not None:
@@ -181,8 +192,19 @@ class Converter(Accessor):
             cls.FromValueStage(cls.read_value, options)
         )
 
+    @classmethod
+    def _writes_columns(cls):
+        if cls._write_columns is None:
+            return False
+
+        def owner(name):
+            return next(klass for klass in cls.__mro__ if name in vars(klass))
+
+        return issubclass(owner("_write_columns"), owner("write_value"))
+
     @classmethod
     def writer(cls, options):
+        write_value = cls._write_columns if cls._writes_columns() else cls.write_value
         return cls.base_writer(options).prepend_stage(
-            cls.ToValueStage(cls.write_value, options)
+            cls.ToValueStage(write_value, options)
         )
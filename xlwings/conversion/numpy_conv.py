@@ -10,7 +10,24 @@ if np:
     except ImportError:
         pd = None
 
-    from . import Converter, Options
+    from . import ColumnarValues, Converter, Options, Pipeline, ReadArrayStage
+
+    def _adjust_dimensions(value, ndim):
+        # Same as AdjustDimensionsStage, but for a 2d array
+        nrows, ncols = value.shape
+        if ndim in (None, "squeeze", 1):
+            if nrows == 1:
+                return value[0, 0] if ncols == 1 and ndim != 1 else value[0]
+            elif ncols == 1:
+                return value[:, 0]
+            elif ndim == 1:
+                raise Exception("Range must be 1-by-n or n-by-1 when ndim=1.")
+        elif ndim == "natural":
+            if nrows == 1:
+                return value[0, 0] if ncols == 1 else value[0]
+        elif ndim != 2:
+            raise ValueError("Invalid c.value ndim=%s" % ndim)
+        return value
 
     class NumpyArrayConverter(Converter):
         @classmethod
@@ -19,6 +36,16 @@ if np:
                 Options(options).defaults(empty=np.nan)
             )
 
+        @classmethod
+        def reader(cls, options):
+            return Pipeline().append_stage(
+                ReadArrayStage(
+                    options,
+                    super(NumpyArrayConverter, cls).reader(options),
+                    cls.from_array,
+                )
+            )
+
         @classmethod
         def read_value(cls, value, options):
             dtype = options.get("dtype", None)
@@ -27,6 +54,27 @@ if np:
             ndim = options.get("ndim", None) or 0
             return np.array(value, dtype=dtype, copy=copy, order=order, ndmin=ndim)
 
+        @classmethod
+        def from_array(cls, value, options):
+            # value is a freshly allocated array, so there's no need to copy it again
+            if options.get("transpose", False):
+                value = value.T
+            ndim = options.get("ndim", None)
+            value = np.asarray(
+                _adjust_dimensions(value, ndim),
+                dtype=options.get("dtype", None),
+                order=options.get("order", None),
+            )
+            if isinstance(ndim, int) and value.ndim < ndim:
+                value = value.reshape((1,) * (ndim - value.ndim) + value.shape)
+            return value
+
+        @classmethod
+        def _write_columns(cls, value, options):
+            if value.ndim == 2:
+                return ColumnarValues([], list(value.T), value.tolist)
+            return value.tolist()
+
         @classmethod
         def write_value(cls, value, options):
             return value.tolist()
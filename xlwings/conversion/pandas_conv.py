@@ -1,3 +1,5 @@
+import datetime as dt
+
 from ..utils import xlserial_to_datetime
 
 try:
@@ -7,7 +9,9 @@ except ImportError:
 
 
 if pd:
-    from . import Converter, Options
+    import numpy as np
+
+    from . import ColumnarValues, Converter, Options, Pipeline, ReadColumnsStage
 
     def _parse_dates(df, parse_dates):
         # Office.js UDFs don't have the info whether the cell is in date format
@@ -23,7 +27,7 @@ if pd:
                 df[col_name] = df.iloc[:, col].apply(xlserial_to_datetime)
         return df
 
-    def write_value(cls, value, options):
+    def write_columns(cls, value, options):
         index = options.get("index", True)
         header = options.get("header", True)
         assign_empty_index_names = options.get("assign_empty_index_names", False)
@@ -68,11 +72,49 @@ if pd:
                 columns = [value.columns.tolist()]
                 if index:
                     columns[0][:index_levels] = index_names
-            value = columns + value.values.tolist()
         else:
-            value = value.values.tolist()
-
-        return value
+            columns = []
+        # Only engines without a column-wise write path need the (object) rows
+        return ColumnarValues(
+            columns,
+            [value.iloc[:, ix].to_numpy() for ix in range(value.shape[1])],
+            lambda: value.values.tolist(),
+        )
+
+    # pandas < 3 infers datetime64[ns] for datetime objects
+    _datetime_dtype = pd.Series([dt.datetime(2000, 1, 1)]).dtype
+
+    def _column_to_series(kind, data, validity):
+        # Infers the same dtypes as pd.DataFrame does for a list of rows
+        if kind == "empty":
+            return pd.Series([None] * len(validity), dtype=object)
+        elif kind == "bool" and not validity.all():
+            data = data.astype(object)
+            data[~validity] = None
+        elif kind == "datetime":
+            data[~validity] = np.datetime64("NaT")
+            try:
+                return pd.Series(data).astype(_datetime_dtype)
+            except pd.errors.OutOfBoundsDatetime:
+                data = data.astype(object)
+        elif kind == "category":
+            codes, categories = data
+            return pd.Series(pd.Categorical.from_codes(codes, categories))
+        return pd.Series(data)
+
+    def _to_categorical(df):
+        # Same as the "category" columns of the calamine engine: columns that only
+        # contain strings (and empty cells) with sorted categories
+        for ix in range(len(df.columns)):
+            column = df.iloc[:, ix]
+            if (
+                not isinstance(column.dtype, pd.CategoricalDtype)
+                and pd.api.types.is_string_dtype(column.dtype)
+                and column.notna().any()
+                and all(isinstance(x, str) for x in column.dropna())
+            ):
+                df.isetitem(ix, column.astype("category"))
+        return df
 
     class PandasDataFrameConverter(Converter):
         @classmethod
@@ -81,8 +123,35 @@ if pd:
                 Options(options).override(ndim=2)
             )
 
+        @classmethod
+        def reader(cls, options):
+            return Pipeline().append_stage(
+                ReadColumnsStage(
+                    options,
+                    super(PandasDataFrameConverter, cls).reader(options),
+                    cls.from_columns,
+                    header=options.get("header", 1),
+                )
+            )
+
+        @classmethod
+        def header_rows(cls, options):
+            return int(options.get("header", 1))
+
         @classmethod
         def read_value(cls, value, options):
+            header = options.get("header", 1)
+            return cls.to_frame(value[:header], value[header:], options)
+
+        @classmethod
+        def from_columns(cls, header_rows, columns, options):
+            df = pd.DataFrame(
+                {ix: _column_to_series(*column) for ix, column in enumerate(columns)}
+            )
+            return cls.to_frame(header_rows, df, options)
+
+        @classmethod
+        def to_frame(cls, header_rows, data, options):
             index = options.get("index", 1)
             header = options.get("header", 1)
             dtype = options.get("dtype", None)
@@ -91,17 +160,25 @@ if pd:
 
             # build dataframe with only columns (no index) but correct header
             if header == 1:
-                columns = pd.Index(value[0])
+                columns = pd.Index(header_rows[0])
             elif header > 1:
-                columns = pd.MultiIndex.from_arrays(value[:header])
+                columns = pd.MultiIndex.from_arrays(header_rows)
             else:
                 columns = None
 
-            df = pd.DataFrame(value[header:], columns=columns, dtype=dtype, copy=copy)
+            if isinstance(data, pd.DataFrame):
+                df = data if dtype is None else data.astype(dtype)
+                if columns is not None:
+                    df.columns = columns
+            else:
+                df = pd.DataFrame(data, columns=columns, dtype=dtype, copy=copy)
 
             if parse_dates is not None:
                 df = _parse_dates(df, parse_dates)
 
+            if options.get("categorical", False):
+                df = _to_categorical(df)
+
             # handle index by resetting the index to the index first columns
             # and renaming the index according to the name in the last row
             if index > 0:
@@ -112,7 +189,7 @@ if pd:
                 df = df.set_index(list(df.columns)[:index])
 
                 df.index.names = pd.Index(
-                    value[header - 1][:index] if header else [None] * index
+                    header_rows[header - 1][:index] if header else [None] * index
                 )
 
                 if header:
@@ -122,13 +199,21 @@ if pd:
 
             return df
 
+        @classmethod
+        def _write_columns(cls, value, options):
+            return write_columns(cls, value, options)
+
         @classmethod
         def write_value(cls, value, options):
-            return write_value(cls, value, options)
+            return cls._write_columns(value, options).rows()
 
     PandasDataFrameConverter.register(pd.DataFrame, "df")
 
     class PandasSeriesConverter(Converter):
+        @classmethod
+        def header_rows(cls, options):
+            return int(options.get("header", True))
+
         @classmethod
         def read_value(cls, value, options):
             index = options.get("index", 1)
@@ -172,14 +257,17 @@ if pd:
             return series
 
         @classmethod
-        def write_value(cls, value, options):
+        def _write_columns(cls, value, options):
             if all(v is None for v in value.index.names) and value.name is None:
                 default_header = False
             else:
                 default_header = True
 
             options["header"] = options.get("header", default_header)
-            values = write_value(cls, value.to_frame(), options)
-            return values
+            return write_columns(cls, value.to_frame(), options)
+
+        @classmethod
+        def write_value(cls, value, options):
+            return cls._write_columns(value, options).rows()
 
     PandasSeriesConverter.register(pd.Series)
@@ -7,7 +7,7 @@ except ImportError:
 
 
 if pl:
-    from . import Converter, Options
+    from . import Converter, Options, Pipeline, ReadColumnsStage
 
     def _parse_dates(df, parse_dates):
         # Office.js UDFs don't have the info whether the cell is in date format
@@ -35,6 +35,38 @@ if pl:
 
         return result
 
+    def _column_to_series(name, kind, data, validity, options):
+        if kind == "empty":
+            return pl.Series(name, [None] * len(validity))
+        elif kind == "float":
+            return pl.Series(name, data, nan_to_null=True)
+        elif kind == "str":
+            return pl.Series(name, data, dtype=pl.String)
+        elif kind == "category":
+            codes, categories = data
+            indices = pl.Series(codes)
+            if not validity.all():
+                indices = indices.scatter((~validity).nonzero()[0], None)
+            return (
+                pl.Series(name, categories, dtype=pl.String)
+                .gather(indices)
+                .cast(pl.Categorical)
+            )
+        elif kind == "object":
+            # Mixed types: same inference as for the rows in read_value
+            return pl.DataFrame(
+                data=[[value] for value in data],
+                schema=[name],
+                orient="row",
+                strict=options.get("strict", True),
+                infer_schema_length=options.get("infer_schema_length", 100),
+                nan_to_null=options.get("nan_to_null", False),
+            ).to_series()
+        series = pl.Series(name, data)
+        if not validity.all():
+            series = series.scatter((~validity).nonzero()[0], None)
+        return series
+
     class PolarsDataFrameConverter(Converter):
         @classmethod
         def base_reader(cls, options):
@@ -42,6 +74,39 @@ if pl:
                 Options(options).override(ndim=2)
             )
 
+        @classmethod
+        def reader(cls, options):
+            pipeline = super(PolarsDataFrameConverter, cls).reader(options)
+            if options.get("schema") or options.get("schema_overrides"):
+                return pipeline
+            has_header = options.get("has_header", options.get("header", True))
+            return Pipeline().append_stage(
+                ReadColumnsStage(
+                    options, pipeline, cls.from_columns, header=1 if has_header else 0
+                )
+            )
+
+        @classmethod
+        def header_rows(cls, options):
+            return int(options.get("has_header", options.get("header", True)))
+
+        @classmethod
+        def from_columns(cls, header_rows, columns, options):
+            if header_rows:
+                names = header_rows[0]
+            else:
+                names = [f"column_{ix}" for ix in range(len(columns))]
+            df = pl.DataFrame(
+                [
+                    _column_to_series(name, *column, options)
+                    for name, column in zip(names, columns)
+                ]
+            )
+            parse_dates = options.get("parse_dates")
+            if parse_dates is not None:
+                df = _parse_dates(df, parse_dates)
+            return df
+
         @classmethod
         def read_value(cls, value, options):
             has_header = options.get("has_header", options.get("header", True))
@@ -73,6 +138,8 @@ if pl:
                     nan_to_null=nan_to_null,
                 )
 
+            if options.get("categorical", False):
+                df = df.with_columns(pl.col(pl.String).cast(pl.Categorical))
             if parse_dates is not None:
                 df = _parse_dates(df, parse_dates)
             return df
@@ -87,6 +154,10 @@ if pl:
     PolarsDataFrameConverter.register(pl.DataFrame)
 
     class PolarsSeriesConverter(Converter):
+        @classmethod
+        def header_rows(cls, options):
+            return int(options.get("has_header", options.get("header", True)))
+
         @classmethod
         def read_value(cls, value, options):
             has_header = options.get("has_header", options.get("header", True))
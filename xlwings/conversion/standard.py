@@ -7,7 +7,7 @@ from typing import Any, Sequence
 
 from .. import LicenseError
 from ..main import Range
-from ..utils import chunk, xlserial_to_datetime
+from ..utils import chunk, ensure_2d, xlserial_to_datetime
 from . import Accessor, Converter, Options, Pipeline, accessors
 
 try:
@@ -33,6 +33,22 @@ _number_handlers = {
 }
 
 
+class ColumnarValues:
+    """What the pandas and NumPy converters pass to the engine (see
+    ``Converter._write_columns``): the header rows and the NumPy arrays of the columns
+    below them. Their public write_value returns the rows. Engines that implement
+    ``prepare_xl_data_columns`` serialize the columns directly, for all other engines,
+    rows() builds the list of rows."""
+
+    def __init__(self, header, columns, body):
+        self.header = header
+        self.columns = columns
+        self._body = body
+
+    def rows(self):
+        return self.header + self._body()
+
+
 class ExpandRangeStage:
     def __init__(self, options):
         self.expand = options.get("expand", None)
@@ -44,20 +60,102 @@ class ExpandRangeStage:
                 c.range = c.range.expand(self.expand)
 
 
-class AsyncExpandRangeStage:
-    """Async expand stage that resolves expansion via JS global (xlwings Lite only)."""
+def slice_rows(rng, options):
+    """Applies the skip_rows and max_rows options to rng: skip_rows removes rows at
+    the top of the range, max_rows limits the number of rows below the header rows
+    of the converter (e.g., the header of a DataFrame)."""
+    skip_rows = options.get("skip_rows", None) or 0
+    max_rows = options.get("max_rows", None)
+    if skip_rows:
+        if skip_rows < 0 or skip_rows >= rng.shape[0]:
+            raise ValueError(
+                f"skip_rows must be between 0 and {rng.shape[0] - 1} for {rng}."
+            )
+        rng = rng[skip_rows:, :]
+    if max_rows is not None:
+        convert = options.get("convert", None)
+        nrows = accessors.get(convert, convert).header_rows(options) + max_rows
+        if max_rows < 0 or nrows == 0:
+            raise ValueError("max_rows must be at least 1.")
+        rng = rng[:nrows, :]
+    return rng
+
+
+def column_positions(rng, columns):
+    """Resolves the columns option into 0-based column positions within rng:
+    integers are positions (negative ones count from the end), strings are looked
+    up in the first row of rng."""
+    ncols = rng.shape[1]
+    header = None
+    positions = []
+    for column in columns:
+        if isinstance(column, str):
+            if header is None:
+                header = list(ensure_2d(rng[0, :].raw_value)[0])
+            if column not in header:
+                raise ValueError(f"Column '{column}' not found in the first row.")
+            positions.append(header.index(column))
+        else:
+            position = column + ncols if column < 0 else column
+            if not 0 <= position < ncols:
+                raise IndexError(
+                    f"Column index {column} out of range ({ncols} columns)."
+                )
+            positions.append(position)
+    return positions
+
+
+def read_positions(rng, options):
+    """Returns the column positions of the columns option or None if it isn't set"""
+    columns = options.get("columns", None)
+    if columns is None:
+        return None
+    if isinstance(columns, (str, int)):
+        columns = [columns]
+    return column_positions(rng, columns)
+
+
+def read_range(rng, options):
+    """Returns rng after applying the expand, skip_rows, and max_rows options"""
+    expand = options.get("expand", None)
+    if expand:
+        rng = rng.expand(expand)
+    return slice_rows(rng, options)
+
 
+def read_raw_value(rng, options, positions=None):
+    """Returns the raw value of rng, only for the given column positions if
+    provided. Engines that can read selected columns (calamine) don't read the
+    other columns at all."""
+    if positions is None:
+        return rng.raw_value
+    if hasattr(rng.impl, "read_raw_value"):
+        return rng.impl.read_raw_value(options.get("err_to_str", False), positions)
+    return [[row[ix] for ix in positions] for row in ensure_2d(rng.raw_value)]
+
+
+class SliceRowsStage:
     def __init__(self, options):
+        self.options = options
+
+    def __call__(self, c):
+        if c.range:
+            c.range = slice_rows(c.range, self.options)
+
+
+class AsyncExpandRangeStage:
+    """Async expand stage that resolves expansion via the fetcher of a remote book
+    (see xlwings.pro._xlremote.Fetcher)."""
+
+    def __init__(self, options, fetcher):
         self.expand = options.get("expand", None)
+        self.fetcher = fetcher
 
     async def __call__(self, c):
         if c.range and self.expand:
-            import js
-
-            expanded_address = await js.xlwings.getExpandedAddress(
+            expanded_address = await self.fetcher.get_expanded_address(
                 c.range.sheet.name, c.range.address, self.expand
             )
-            expanded_address = str(expanded_address)
             # Strip sheet name prefix if present (e.g., "Sheet1!A1:B2" -> "A1:B2")
             if "!" in expanded_address:
                 expanded_address = expanded_address.split("!", 1)[1]
@@ -106,12 +204,15 @@ class ReadValueFromRangeStage:
 
     def __call__(self, c):
         chunksize = self.options.get("chunksize")
+        positions = read_positions(c.range, self.options) if c.range else None
         if c.range and chunksize:
             parts = []
             for i in range(math.ceil(c.range.shape[0] / chunksize)):
-                raw_value = c.range[
-                    i * chunksize : (i * chunksize) + chunksize, :
-                ].raw_value
+                raw_value = read_raw_value(
+                    c.range[i * chunksize : (i * chunksize) + chunksize, :],
+                    self.options,
+                    positions,
+                )
                 if isinstance(raw_value[0], (list, tuple)):
                     parts.extend(raw_value)
                 else:
@@ -120,40 +221,126 @@ class ReadValueFromRangeStage:
 
             c.value = parts
         elif c.range:
-            c.value = c.range.raw_value
+            c.value = read_raw_value(c.range, self.options, positions)
+
+
+class ReadArrayStage:
+    """Fast path for engines that can export a range as float64 NumPy array
+    (calamine): if the range only contains numbers, `from_array(array, options)` builds
+    the final value directly from the array. Otherwise, the values are handed to the
+    stages of the (list-based) `pipeline` that follow its read stage, so the range is
+    only read once. These stages must read empty cells as NaN (empty=np.nan).
+    """
+
+    def __init__(self, options, pipeline, from_array):
+        self.options = options
+        self.pipeline = pipeline
+        self.from_array = from_array
+        read_stages = [
+            ix
+            for ix, stage in enumerate(pipeline)
+            if isinstance(stage, ReadValueFromRangeStage)
+        ]
+        self.list_stages = pipeline[read_stages[0] + 1 :] if read_stages else None
+        self.enabled = (
+            np is not None
+            and self.list_stages is not None
+            and all(options.get(key) is None for key in ("empty", "dates", "numbers"))
+        )
+
+    def __call__(self, c):
+        if not (self.enabled and c.range and hasattr(c.range.impl, "raw_array")):
+            self.pipeline(c)
+            return
+        rng = read_range(c.range, self.options)
+        values, others = rng.impl.raw_array(
+            self.options.get("err_to_str", False),
+            read_positions(rng, self.options),
+        )
+        nrows, ncols = values.shape
+        if nrows == 0 or ncols == 0:
+            self.pipeline(c)
+        elif not others:
+            c.value = self.from_array(values, self.options)
+        else:
+            # Empty cells are already NaN, i.e., what the list-based stages turn them
+            # into with the default empty=np.nan
+            rows = values.tolist()
+            for ix, value in others:
+                rows[ix // ncols][ix % ncols] = value
+            c.range, c.value = rng, rows
+            for stage in self.list_stages:
+                stage(c)
+
+
+class ReadColumnsStage:
+    """Like ReadArrayStage, but for engines that can export a range as typed columns
+    (calamine): `from_columns(header_rows, columns, options)` builds the final value
+    from the columns below the first `header` rows, without Python objects per cell
+    for columns of numbers, booleans, or dates.
+    """
+
+    def __init__(self, options, pipeline, from_columns, header=0):
+        self.options = options
+        self.pipeline = pipeline
+        self.from_columns = from_columns
+        self.header = header
+        self.enabled = (
+            np is not None
+            and all(options.get(key) is None for key in ("empty", "dates", "numbers"))
+            and not options.get("transpose", False)
+        )
+
+    def read_columns(self, c):
+        if not (self.enabled and c.range and hasattr(c.range.impl, "raw_columns")):
+            return None
+        rng = read_range(c.range, self.options)
+        header_rows, columns = rng.impl.raw_columns(
+            self.header,
+            self.options.get("err_to_str", False),
+            read_positions(rng, self.options),
+            self.options.get("categorical", False),
+        )
+        if not columns or len(columns[0][2]) == 0:
+            return None
+        return header_rows, columns
+
+    def __call__(self, c):
+        value = self.read_columns(c)
+        if value is None:
+            self.pipeline(c)
+        else:
+            c.value = self.from_columns(*value, self.options)
 
 
 class AsyncReadValueFromRangeStage:
-    """Async read stage that fetches values on demand from Excel via JS global
-    (xlwings Lite only)."""
+    """Async read stage that fetches values on demand from Excel via the fetcher of
+    a remote book (see xlwings.pro._xlremote.Fetcher)."""
 
-    def __init__(self, options):
+    def __init__(self, options, fetcher):
         self.options = options
+        self.fetcher = fetcher
 
     async def __call__(self, c):
         if not c.range:
             return
-        import js
-
         chunksize = self.options.get("chunksize")
         if chunksize:
             parts = []
             for i in range(math.ceil(c.range.shape[0] / chunksize)):
                 chunk_range = c.range[i * chunksize : (i * chunksize) + chunksize, :]
-                values_js = await js.xlwings.getRangeValues(
+                chunk_values = await self.fetcher.get_range_values(
                     c.range.sheet.name, chunk_range.address
                 )
-                chunk_values = values_js.to_py()
                 if isinstance(chunk_values[0], (list, tuple)):
                     parts.extend(chunk_values)
                 else:
                     parts.extend([chunk_values])
             c.value = parts
         else:
-            values_js = await js.xlwings.getRangeValues(
+            c.value = await self.fetcher.get_range_values(
                 c.range.sheet.name, c.range.address
             )
-            c.value = values_js.to_py()
 
 
 class CleanDataFromReadStage:
@@ -181,6 +368,12 @@ class CleanDataForWriteStage:
         self.options = options
 
     def __call__(self, c):
+        if isinstance(c.value, ColumnarValues):
+            prepare_columns = getattr(c.engine.impl, "prepare_xl_data_columns", None)
+            if prepare_columns:
+                c.value = prepare_columns(c.value, self.options)
+                return
+            c.value = c.value.rows()
         c.value = [
             [c.engine.impl.prepare_xl_data_element(x, self.options) for x in y]
             for y in c.value
@@ -232,7 +425,9 @@ class AdjustDimensionsStage:
 
 class Ensure2DStage:
     def __call__(self, c):
-        if isinstance(c.value, (list, tuple)):
+        if isinstance(c.value, ColumnarValues):
+            return
+        elif isinstance(c.value, (list, tuple)):
             if len(c.value) > 0:
                 if not isinstance(c.value[0], (list, tuple)):
                     c.value = [c.value]
@@ -243,6 +438,8 @@ class Ensure2DStage:
 
 class TransposeStage:
     def __call__(self, c):
+        if isinstance(c.value, ColumnarValues):
+            c.value = c.value.rows()
         c.value = [
             [e[i] for e in c.value] for i in range(len(c.value[0]) if c.value else 0)
         ]
@@ -264,8 +461,15 @@ class FormatStage:
 class BaseAccessor(Accessor):
     @classmethod
     def reader(cls, options):
-        return Pipeline().append_stage(
-            ExpandRangeStage(options), only_if=options.get("expand", None)
+        return (
+            Pipeline()
+            .append_stage(
+                ExpandRangeStage(options), only_if=options.get("expand", None)
+            )
+            .append_stage(
+                SliceRowsStage(options),
+                only_if=options.get("skip_rows") or options.get("max_rows") is not None,
+            )
         )
 
 
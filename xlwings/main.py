@@ -865,8 +865,21 @@ class Book:
         corrupt_load: Can be one of xlNormalLoad, xlRepairFile or xlExtractData.
             Not supported on macOS.
         json: A JSON object as delivered by the MS Office Scripts or Google Apps Script
-            xlwings module but in a deserialized form, i.e., as dictionary.
+            xlwings module but in a deserialized form, i.e., as dictionary. Instead of a
+            list of rows, the values of a sheet can also be sent in the more compact
+            columns format: ``{"format": "columns", "columns": [...], "dates": [...]}``
+            with a list of cell values per column and the 0-based ``[row, column]`` of
+            the cells that hold ISO datetime strings. Clients that call repeatedly can
+            send a ``"snapshot_id"`` and afterwards only the changed cells relative to
+            it via ``"base_snapshot_id"``. If that snapshot isn't cached anymore,
+            ``SnapshotMissError`` is raised and the full book has to be sent again.
             *New in version 0.26.0.*
+        fetcher: Only with `json`: an instance of a subclass of
+            ``xlwings.pro._xlremote.Fetcher`` that fetches data from the client on
+            demand, so `await myrange.get_value()` and `await book.load()` work
+            outside of xlwings Lite. Together with an async book (see
+            `xw.BookAsync`), the client doesn't have to send the cell values up
+            front.
         mode: Either `"i"` (interactive (default)) or `"r"` (read). In interactive mode,
             xlwings opens the workbook in Excel, i.e., Excel needs to be installed. In read
             mode, xlwings reads from the file directly, without requiring Excel to be
@@ -895,12 +908,17 @@ class Book:
         json: dict[str, Any] | None = None,
         mode: str | None = None,
         engine: str | None = None,
+        fetcher: Any = None,
         **kwargs: Any,
     ) -> None:
         if not impl:
             if json:
                 engine = engine if engine else "remote"
-                impl = engines[engine].apps.active.books.open(json=json).impl
+                impl = (
+                    engines[engine]
+                    .apps.active.books.open(json=json, fetcher=fetcher)
+                    .impl
+                )
             elif fullname and mode == "r":
                 engine = engine if engine else "calamine"
                 impl = engines[engine].apps.active.books.open(fullname=fullname).impl
@@ -973,13 +991,42 @@ class Book:
     def json(self) -> dict[str, Any]:
         """Returns a JSON serializable object as expected by the MS Office Scripts or
         Google Apps Script xlwings module. Only available with book objects that have
-        been instantiated via `xw.Book(json=...)`.
+        been instantiated via `xw.Book(json=...)`. To keep the payload small, writes
+        to neighboring cells are merged into blocks and writes that are overwritten
+        later on are dropped.
+
+        If the client lists any of `"float64"`, `"rle"`, and `"gzip"` under
+        `"encodings"` in its payload, the values of large `setValues` actions are
+        sent in a compact encoding instead of a nested list, see
+        `xlwings.pro._xlremote.encode_values`.
 
         ```{versionadded} 0.26.0
         ```
         """
         return self.impl.json()
 
+    def json_chunks(self, max_cells: int = 100_000) -> Iterator[dict[str, Any]]:
+        """Like `json()`, but yields the actions in several payloads of at most
+        ``max_cells`` cells each (large writes are split into blocks of rows). The
+        client has to apply the payloads in order. This allows a server to stream
+        big writes, e.g., as newline-delimited JSON, instead of serializing them
+        into a single, huge response.
+
+        Parameters
+        ----------
+        max_cells : int, default 100_000
+            Maximum number of cells per payload. A single row of a write is never
+            split, so a payload may exceed it if a row has more cells.
+
+        Examples:
+            ```pycon
+            >>> def stream(book):
+            ...     for payload in book.json_chunks(max_cells=50_000):
+            ...         yield json.dumps(payload) + "\\n"
+            ```
+        """
+        return self.impl.json_chunks(max_cells)
+
     async def flush(self) -> None:
         """Flushes all pending actions to Excel and the Output pane.
 
@@ -1013,7 +1060,7 @@ class Book:
         `.value` reads work again. On a regular book, everything including
         values is loaded regardless.
 
-        Requires xlwings Lite.
+        Requires xlwings Lite or a book with a `fetcher` (see `xw.Book`).
 
         """
         await self.impl.load(values=values)
@@ -1149,6 +1196,40 @@ class Book:
         """
         return Sheets(impl=self.impl.sheets)
 
+    def read_all(
+        self,
+        sheets: list[str | int] | None = None,
+        convert: Any = None,
+        **options: Any,
+    ) -> dict[str, Any]:
+        """Reads the used range of multiple sheets and returns a dictionary with the
+        sheet names as keys. With the calamine engine (`xw.Book(..., mode="r")`), the
+        sheets are decoded in parallel.
+
+        Args:
+            sheets: Names or 0-based indices of the sheets, defaults to all sheets.
+            convert: A converter, see `Range.options()`.
+            **options: Converter options, see `Range.options()`.
+
+        Examples:
+            ```python
+            import xlwings as xw
+
+            with xw.Book("myfile.xlsx", mode="r") as book:
+                dfs = book.read_all(convert="df", index=False)
+            ```
+        """
+        if sheets is None:
+            sheets = list(self.sheets)
+        else:
+            sheets = [self.sheets[sheet] for sheet in sheets]
+        if hasattr(self.impl, "load_sheets"):
+            self.impl.load_sheets([sheet.index for sheet in sheets])
+        return {
+            sheet.name: sheet.used_range.options(convert, **options).value
+            for sheet in sheets
+        }
+
     @property
     def app(self) -> App:
         """Returns an app object that represents the creator of the book.
@@ -1526,7 +1607,7 @@ class Sheet:
         and everything (including values) on a regular book. Pass `values=True`
         to also load this sheet's cell values.
 
-        Requires xlwings Lite.
+        Requires xlwings Lite or a book with a `fetcher` (see `xw.Book`).
 
         """
         await self.impl.load(values=values)
@@ -1786,6 +1867,23 @@ class Sheet:
         """
         return Range(impl=self.impl.used_range)
 
+    def iter_batches(
+        self, batch_size: int = 1000, convert: Any = None, **options: Any
+    ) -> Iterator[Any]:
+        """Iterates over the used range of the sheet in batches of `batch_size` rows,
+        see `Range.iter_rows()`. Accepts the same arguments as `Range.options()`.
+
+        Examples:
+            ```python
+            import xlwings as xw
+
+            with xw.Book("myfile.xlsx", mode="r") as book:
+                for df in book.sheets[0].iter_batches(10_000, "df", index=False):
+                    print(len(df))
+            ```
+        """
+        return self.used_range.options(convert, **options).iter_rows(batch_size)
+
     @property
     def visible(self) -> bool:
         """Gets or sets the visibility of the Sheet (bool).
@@ -1982,6 +2080,13 @@ class Range:
             err_to_str: If `True`, will include cell errors such as `#N/A` as
                 strings. By default, they will be converted to `None`.
                 *New in version 0.28.0.*
+            columns: Only reads the given columns (on reading), either as 0-based
+                positions within the range or as names in the first row of the
+                range. With the calamine engine, the other columns aren't read at
+                all.
+            skip_rows: Number of rows to skip at the top of the range (on reading).
+            max_rows: Maximum number of rows to read (on reading), not counting the
+                header rows of the converter, e.g., the header of a DataFrame.
 
         For converter-specific options, see `converters`.
 
@@ -2427,7 +2532,7 @@ class Range:
     async def get_value(self) -> Any:
         """Fetch values from Excel on demand.
 
-        Requires xlwings Lite.
+        Requires xlwings Lite or a book with a `fetcher` (see `xw.Book`).
         """
         return await conversion.async_read(
             self,
@@ -2436,6 +2541,68 @@ class Range:
             pipeline_overrides=self._impl.get_async_pipeline_overrides(self._options),
         )
 
+    def iter_rows(self, batch_size: int = 1000) -> Iterator[Any]:
+        """Iterates over the values of the Range in batches of `batch_size` rows.
+        Every batch is converted according to the options of the Range, e.g., with
+        `.options(pd.DataFrame)`, every batch is a DataFrame with the header of the
+        Range. As only one batch is read at a time, this allows you to process ranges
+        that are too big to be read at once. If the engine supports it (e.g., the
+        calamine engine via `xw.Book(..., mode="r")`), the batches are streamed
+        directly from the file.
+
+        The `transpose` option isn't supported as the batches are made of rows.
+
+        Args:
+            batch_size: Number of rows per batch (excluding the header).
+
+        Examples:
+            ```python
+            import xlwings as xw
+
+            with xw.Book("myfile.xlsx", mode="r") as book:
+                rng = book.sheets[0]["A1"].options("df", index=False, expand="table")
+                for df in rng.iter_rows(batch_size=10_000):
+                    print(df["Amount"].sum())
+            ```
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1.")
+        if self._options.get("transpose", False):
+            raise ValueError("iter_rows() doesn't support the transpose option.")
+        options = conversion.Options(self._options).defaults(ndim=2)
+        rng = conversion.standard.read_range(self, options)
+        positions = conversion.standard.read_positions(rng, options)
+        for key in ("expand", "skip_rows", "max_rows", "columns"):
+            options.pop(key, None)
+        convert = options.get("convert", None)
+        header = conversion.accessors.get(convert, convert).header_rows(options)
+        err_to_str = options.get("err_to_str", False)
+        engine_name = rng.sheet.book.app.engine.name
+
+        if hasattr(rng.impl, "iter_raw_values"):
+            header_rows, batches = rng.impl.iter_raw_values(
+                batch_size, header, err_to_str, positions
+            )
+        else:
+
+            def read(rng):
+                return utils.ensure_2d(
+                    conversion.standard.read_raw_value(rng, options, positions)
+                )
+
+            nrows = rng.shape[0]
+            header_rows = []
+            if header:
+                header_rows = list(read(rng[: min(header, nrows), :]))
+            batches = (
+                read(rng[i : i + batch_size, :])
+                for i in range(header, nrows, batch_size)
+            )
+        for batch in batches:
+            yield conversion.read(
+                None, header_rows + list(batch), options, engine_name=engine_name
+            )
+
     def expand(self, mode: str = "table") -> Range:
         """Expands the range according to the mode provided. Ignores empty top-left cells
         (unlike `Range.end()`).
@@ -4955,6 +5122,7 @@ class Books(Collection[Book]):
         local: bool | None = None,
         corrupt_load: int | None = None,
         json: dict[str, Any] | None = None,
+        fetcher: Any = None,
     ) -> Book:
         """Opens a Book if it is not open yet and returns it. If it is already open,
         it doesn't raise an exception but simply returns the Book object.
@@ -4970,7 +5138,7 @@ class Books(Collection[Book]):
 
         """
         if self.impl.app.engine.type == "remote":
-            return Book(impl=self.impl.open(json=json))
+            return Book(impl=self.impl.open(json=json, fetcher=fetcher))
 
         fullname = utils.fspath(fullname)
         if not os.path.exists(fullname):
@@ -51,6 +51,19 @@ def _clean_value_data_element(value, datetime_builder, empty_as, number_builder)
     return value
 
 
+def _column_data(kind, data):
+    if kind == "float":
+        return np.frombuffer(data, dtype=np.float64)
+    elif kind == "bool":
+        return np.frombuffer(data, dtype=bool)
+    elif kind == "datetime":
+        return np.frombuffer(data, dtype=np.int64).view("datetime64[us]")
+    elif kind == "category":
+        codes, categories = data
+        return np.frombuffer(codes, dtype=np.int32), categories
+    return data
+
+
 class Engine:
     def __init__(self):
         self.apps = Apps()
@@ -59,15 +72,20 @@ class Engine:
     def clean_value_data(data, datetime_builder, empty_as, number_builder, err_to_str):
         # err_to_str is handled in raw_values for efficiency
         if empty_as or number_builder or datetime_builder is not dt.datetime:
-            return [
-                [
-                    _clean_value_data_element(
-                        c, datetime_builder, empty_as, number_builder
-                    )
-                    for c in row
-                ]
-                for row in data
-            ]
+            passthrough_types = {int, bool, str}
+            if empty_as is None:
+                passthrough_types.add(type(None))
+            if number_builder is None:
+                passthrough_types.add(float)
+            if datetime_builder is dt.datetime:
+                passthrough_types.add(dt.datetime)
+            return utils.clean_by_column(
+                data,
+                passthrough_types,
+                lambda c: _clean_value_data_element(
+                    c, datetime_builder, empty_as, number_builder
+                ),
+            )
         else:
             return data
 
@@ -149,9 +167,10 @@ class Books(base_classes.Books):
 
     def open(self, filename):
         filename = str(Path(filename).resolve())
-        sheet_names = xlwingslib.get_sheet_names(filename)
+        reader = xlwingslib.Workbook(filename)
+        sheet_names = reader.sheet_names()
         names = []
-        for name, ref in xlwingslib.get_defined_names(filename):
+        for name, ref in reader.defined_names():
             if ref.split("!")[0].strip("'") in sheet_names:
                 names.append(
                     {
@@ -168,6 +187,7 @@ class Books(base_classes.Books):
             },
             books=self,
             path=filename,
+            reader=reader,
         )
         self.books.append(book)
         self._active = book
@@ -203,10 +223,16 @@ class Books(base_classes.Books):
 
 
 class Book(base_classes.Book):
-    def __init__(self, api, books, path):
+    def __init__(self, api, books, path, reader=None):
         self._api = api
         self.books = books
         self.path = path
+        # xlwingslib.Workbook: keeps the file open and caches the decoded sheets
+        self.reader = reader
+        # Used range bounds by sheet index, so geometry doesn't require reading cells
+        self.dimensions = {}
+        # The defined names don't change in read mode
+        self.names_index = utils.index_names(api.get("names", []))
 
     @property
     def api(self):
@@ -234,6 +260,9 @@ class Book(base_classes.Book):
 
     def close(self):
         assert self.api is not None, "Seems this book was already closed."
+        if self.reader is not None:
+            self.reader.close()
+            self.reader = None
         self.books.books.remove(self)
         self.books = None
         self._api = None
@@ -241,6 +270,22 @@ class Book(base_classes.Book):
     def activate(self):
         pass
 
+    def load_sheets(self, sheet_indices):
+        """Decodes the sheets in parallel so that reading them is served from the
+        reader's cache"""
+        self.reader.load_sheets([ix - 1 for ix in sheet_indices])
+
+    def get_dimensions(self, sheet_index):
+        """Returns the 1-based first and last cell of the used range of the sheet
+        or None if the sheet is empty"""
+        if sheet_index not in self.dimensions:
+            # The reader is 0-based
+            used_range = self.reader.used_range(sheet_index - 1)
+            if used_range is not None:
+                used_range = tuple((row + 1, col + 1) for row, col in used_range)
+            self.dimensions[sheet_index] = used_range
+        return self.dimensions[sheet_index]
+
 
 class Sheets(base_classes.Sheets):
     def __init__(self, book):
@@ -272,7 +317,7 @@ class Sheets(base_classes.Sheets):
 
 class Sheet(base_classes.Sheet):
     def __init__(self, book, sheet_index):
-        self._api = {}  # used by e.g., Range.end()
+        self._api = {}  # used by Sheet.get_values()
         self._book = book
         self.sheet_index = sheet_index
 
@@ -295,6 +340,19 @@ class Sheet(base_classes.Sheet):
     def range(self, arg1, arg2=None):
         return Range(sheet=self, book=self.book, arg1=arg1, arg2=arg2)
 
+    def get_values(self, err_to_str):
+        key = f"values_err_to_str_{err_to_str}"
+        if key not in self._api:
+            self._api[key] = self.book.reader.sheet_values(self.index - 1, err_to_str)
+        return self._api[key]
+
+    @property
+    def used_range(self):
+        dimensions = self.book.get_dimensions(self.index)
+        if dimensions is None:
+            return Range(sheet=self, book=self.book, arg1=(1, 1))
+        return Range(sheet=self, book=self.book, arg1=dimensions[0], arg2=dimensions[1])
+
     @property
     def cells(self):
         return Range(
@@ -323,12 +381,9 @@ class Range(base_classes.Range):
             tuple1, tuple2 = utils.a1_to_tuples(arg1)
             if not tuple1:
                 # Named range
-                for api_name in sheet.book.api["names"]:
-                    if (
-                        api_name["name"].split("!")[-1] == arg1
-                        and api_name["sheet_index"] == sheet.index - 1
-                    ):
-                        tuple1, tuple2 = utils.a1_to_tuples(api_name["address"])
+                address = sheet.book.names_index.get((sheet.index - 1, arg1))
+                if address:
+                    tuple1, tuple2 = utils.a1_to_tuples(address)
                 if not tuple1:
                     raise NoSuchObjectError(
                         f"The address/named range '{arg1}' doesn't exist."
@@ -351,7 +406,8 @@ class Range(base_classes.Range):
 
     @property
     def coords(self):
-        return self.sheet.name, self.row, self.column, len(self.api), len(self.api[0])
+        # Pure arithmetic, no need to read the cells
+        return (self.sheet.name, self.row, self.column) + self.shape
 
     @property
     def row(self):
@@ -370,26 +426,126 @@ class Range(base_classes.Range):
 
     @property
     def raw_value(self):
-        err_to_str = self.options.get("err_to_str", False)
+        return self.read_raw_value(self.options.get("err_to_str", False))
+
+    def read_raw_value(self, err_to_str=False, columns=None):
+        """Like raw_value, but only reads the given 0-based column positions (in the
+        given order) if columns is provided"""
+        cell2 = self._cell2()
+        if cell2 is None and columns is None:
+            # Whole sheet via sheet.cells
+            return self.sheet.get_values(err_to_str)
+        if cell2 is None:
+            cell2 = self._cell2(resolve=True)
+        if self._is_empty(cell2):
+            return [[]]
+        return self.book.reader.range_values(
+            self.sheet.index - 1,
+            (self.arg1[0] - 1, self.arg1[1] - 1),
+            cell2,
+            err_to_str,
+            self._reader_columns(columns),
+        )
+
+    def _cell2(self, resolve=False):
+        # 0-based last cell for the Rust reader, None for the whole sheet (unless
+        # resolve). Like the whole sheet, ranges that reach the last row or column of
+        # the sheet (e.g., sheet.cells[10:, :]) end with the used range.
         if self.arg2 is None:
             self.arg2 = self.arg1
-        if self.arg2[0] == MAX_ROWS and self.arg2[1] == MAX_COLUMNS:
-            # Whole sheet via sheet.cells
-            if not self.sheet.api.get(f"values_err_to_str_{err_to_str}"):
-                values = xlwingslib.get_sheet_values(
-                    self.book.fullname, self.sheet.index - 1, err_to_str
-                )
-                self.sheet._api[f"values_err_to_str_{err_to_str}"] = values
-                return values
-        else:
-            # Specific range
-            return xlwingslib.get_range_values(
-                self.book.fullname,
-                self.sheet.index - 1,
-                (self.arg1[0] - 1, self.arg1[1] - 1),
-                (self.arg2[0] - 1, self.arg2[1] - 1),
-                err_to_str,
+        row2, col2 = self.arg2
+        if (row2, col2) == (MAX_ROWS, MAX_COLUMNS) and self.arg1 == (1, 1):
+            if not resolve:
+                # Whole sheet via sheet.cells
+                return None
+        if row2 == MAX_ROWS or col2 == MAX_COLUMNS:
+            dimensions = self.book.get_dimensions(self.sheet.index)
+            last_row, last_col = dimensions[1] if dimensions else (0, 0)
+            row2 = last_row if row2 == MAX_ROWS else row2
+            col2 = last_col if col2 == MAX_COLUMNS else col2
+        return row2 - 1, col2 - 1
+
+    def _is_empty(self, cell2):
+        # True if the range lies completely outside of the used range
+        return cell2 is not None and (
+            cell2[0] < self.arg1[0] - 1 or cell2[1] < self.arg1[1] - 1
+        )
+
+    def _reader_columns(self, columns):
+        # 0-based column positions within the range -> 0-based sheet columns
+        if columns is None:
+            return None
+        return [self.arg1[1] - 1 + ix for ix in columns]
+
+    def iter_raw_values(self, batch_size, header=0, err_to_str=False, columns=None):
+        """Returns the first header rows and an iterator that reads the remaining
+        rows in batches of batch_size rows, see Range.iter_rows()"""
+        sheet_index, cell2 = self.sheet.index - 1, self._cell2()
+        if self._is_empty(cell2):
+            return [], iter([])
+        columns = self._reader_columns(columns)
+        header_rows = []
+        if header:
+            header_rows = next(
+                self.book.reader.iter_rows(
+                    sheet_index,
+                    (self.arg1[0] - 1, self.arg1[1] - 1),
+                    cell2,
+                    header,
+                    err_to_str,
+                    columns,
+                ),
+                [],
             )
+        batches = self.book.reader.iter_rows(
+            sheet_index,
+            (self.arg1[0] - 1 + header, self.arg1[1] - 1),
+            cell2,
+            batch_size,
+            err_to_str,
+            columns,
+        )
+        return header_rows, batches
+
+    def raw_array(self, err_to_str=False, columns=None):
+        """Returns the values as 2d float64 NumPy array (NaN for empty cells) and a
+        list of (flat index, value) tuples for the cells that aren't numbers. The
+        array is built directly on the buffer filled by the Rust extension."""
+        cell2 = self._cell2()
+        if self._is_empty(cell2):
+            return np.empty((0, 0)), []
+        buffer, shape, others = self.book.reader.range_array(
+            self.sheet.index - 1,
+            (self.arg1[0] - 1, self.arg1[1] - 1),
+            cell2,
+            err_to_str,
+            self._reader_columns(columns),
+        )
+        return np.frombuffer(buffer, dtype=np.float64).reshape(shape), others
+
+    def raw_columns(self, header=0, err_to_str=False, columns=None, categorical=False):
+        """Returns the first `header` rows as list of lists and the remaining rows as
+        list of (kind, data, validity) columns. Depending on kind ("float", "bool",
+        "datetime", "str", "object", or "empty"), data is a NumPy array, a list, or
+        None. With categorical, columns of strings have the kind "category" and
+        (codes, categories) as data. validity is a boolean array that is False for
+        empty cells."""
+        cell2 = self._cell2()
+        if self._is_empty(cell2):
+            return [], []
+        header_rows, columns = self.book.reader.range_columns(
+            self.sheet.index - 1,
+            (self.arg1[0] - 1, self.arg1[1] - 1),
+            cell2,
+            header,
+            err_to_str,
+            self._reader_columns(columns),
+            categorical,
+        )
+        return header_rows, [
+            (kind, _column_data(kind, data), np.frombuffer(validity, dtype=bool))
+            for kind, data, validity in columns
+        ]
 
     @property
     def address(self):
@@ -410,58 +566,17 @@ class Range(base_classes.Range):
         return None
 
     def end(self, direction):
-        err_to_str = self.options.get("err_to_str", False)
-        if not self.sheet.api.get(f"values_err_to_str_{err_to_str}"):
-            values = xlwingslib.get_sheet_values(
-                self.book.fullname, self.sheet.index - 1, err_to_str
-            )
-            self.sheet._api[f"values_err_to_str_{err_to_str}"] = values
-        else:
-            values = self.sheet.api[f"values_err_to_str_{err_to_str}"]
-        if direction == "down":
-            i = 1
-            while True:
-                try:
-                    if values[self.row - 1 + i][self.column - 1]:
-                        i += 1
-                    else:
-                        break
-                except IndexError:
-                    break  # outside used range
-            nrows = i - 1
-            return self.sheet.range((self.row + nrows, self.column))
-        if direction == "up":
-            i = -1
-            while True:
-                row_ix = self.row - 1 + i
-                if row_ix >= 0 and values[row_ix][self.column - 1]:
-                    i -= 1
-                else:
-                    break
-            nrows = i + 1
-            return self.sheet.range((self.row + nrows, self.column))
-        if direction == "right":
-            i = 1
-            while True:
-                try:
-                    if values[self.row - 1][self.column - 1 + i]:
-                        i += 1
-                    else:
-                        break
-                except IndexError:
-                    break  # outside used range
-            ncols = i - 1
-            return self.sheet.range((self.row, self.column + ncols))
-        if direction == "left":
-            i = -1
-            while True:
-                col_ix = self.column - 1 + i
-                if col_ix >= 0 and values[self.row - 1][col_ix]:
-                    i -= 1
-                else:
-                    break
-            ncols = i + 1
-            return self.sheet.range((self.row, self.column + ncols))
+        row, col = self.book.reader.region_end(
+            self.sheet.index - 1, (self.row - 1, self.column - 1), direction
+        )
+        return self.sheet.range((row + 1, col + 1))
+
+    @property
+    def current_region(self):
+        (row1, col1), (row2, col2) = self.book.reader.current_region(
+            self.sheet.index - 1, (self.row - 1, self.column - 1)
+        )
+        return self.sheet.range((row1 + 1, col1 + 1), (row2 + 1, col2 + 1))
 
     def __len__(self):
         nrows, ncols = self.shape
@@ -34,11 +34,8 @@ def _is_jsnull(value):
 
     Returns False on older Pyodide versions (no ``JsNull``) or outside Pyodide.
     """
-    try:
-        from pyodide.ffi import JsNull
-    except ImportError:
-        return False
-    return isinstance(value, JsNull)
+    JsNull = utils.jsnull_type()
+    return JsNull is not None and isinstance(value, JsNull)
 
 
 def datetime_to_formatted_number(datetime_object, date_format, runtime):
@@ -11,13 +11,18 @@ xlwings PRO is dual-licensed under one of the following licenses:
 Commercial licenses can be purchased at https://www.xlwings.org
 """
 
+import array
 import asyncio
 import base64
 import datetime as dt
+import gzip
+import itertools
+import json
 import numbers
 import re
 import sys
-from functools import lru_cache
+import threading
+import time
 
 try:
     import numpy as np
@@ -28,7 +33,14 @@ try:
 except ImportError:
     pd = None
 
-from .. import NoSuchObjectError, XlwingsError, __version__, base_classes, utils
+from .. import (
+    NoSuchObjectError,
+    SnapshotMissError,
+    XlwingsError,
+    __version__,
+    base_classes,
+    utils,
+)
 from ..constants import MAX_COLUMNS, MAX_ROWS
 
 # Private marker set on a sheet's api dict once its cell values have been loaded
@@ -46,6 +58,55 @@ def _sheet_values_loaded(sheet_api):
     return sheet_api.get(_SHEET_VALUES_LOADED_KEY, False)
 
 
+def _per_sheet(cache, sheet_api, build):
+    # Caches per sheet live on the Book (not on the sheet's api dict, which is part of
+    # the payload) and are keyed by the id of the api dict. The entry keeps the dict
+    # alive, so its id can't be reused by another sheet.
+    entry = cache.get(id(sheet_api))
+    if entry is None:
+        entry = cache[id(sheet_api)] = (sheet_api, build(sheet_api))
+    return entry[1]
+
+
+def _sheet_values(book, sheet_api):
+    """Immutable snapshot of a sheet's cell values (a tuple of row tuples). It's built
+    on the first read and dropped whenever the values are reloaded, so ranges can be
+    sliced from it without copying the sheet."""
+    return _per_sheet(book._values_stores, sheet_api, _build_values_store)
+
+
+def _build_values_store(sheet_api):
+    if _sheet_values_typed(sheet_api):
+        return _decode_typed_values(sheet_api["values"])
+    # Rows that are tuples already (e.g., from a delta payload) aren't copied
+    return tuple(tuple(row) for row in sheet_api["values"])
+
+
+def _sheet_values_typed(sheet_api):
+    return isinstance(sheet_api["values"], dict)
+
+
+def _invalidate_sheet_values(book, sheet_api):
+    book._values_stores.pop(id(sheet_api), None)
+
+
+def _tables_index(book, sheet_api):
+    """Maps the table names of a sheet to the address of their data body range. Like
+    the values store, it's built on first use and dropped when the tables change."""
+    return _per_sheet(book._tables_indexes, sheet_api, _build_tables_index)
+
+
+def _build_tables_index(sheet_api):
+    index = {}
+    for api_table in sheet_api["tables"]:
+        index.setdefault(api_table["name"], api_table["data_body_range_address"])
+    return index
+
+
+def _invalidate_tables_index(book, sheet_api):
+    book._tables_indexes.pop(id(sheet_api), None)
+
+
 def _normalize_jsnull(obj):
     """Recursively replace Pyodide's `JsNull` sentinel with Python `None`.
 
@@ -68,9 +129,8 @@ def _normalize_jsnull(obj):
     `JsNull`. Those don't pass through here — UDFs use a separate engine, so
     they're normalized in `_xlofficejs._clean_value_data_element` instead.
     """
-    try:
-        from pyodide.ffi import JsNull
-    except ImportError:
+    JsNull = utils.jsnull_type()
+    if JsNull is None:
         return obj
 
     def walk(o):
@@ -123,30 +183,61 @@ def _update_api_in_place(target, source):
             target[key] = value
 
 
+cell_errors = frozenset(
+    ["#DIV/0!", "#N/A", "#NAME?", "#NULL!", "#NUM!", "#REF!", "#VALUE!", "#DATA!"]
+)
+
+
+def _parse_datetime(value):
+    # Cut off "Z" (Python doesn't accept it and Excel doesn't support tz)
+    return dt.datetime.fromisoformat(value[:-1])
+
+
+class TypedValues(list):
+    """Values of a range on a sheet that was sent in the columns format (see
+    _decode_typed_values): dates are already datetime objects, so strings are never
+    parsed as dates."""
+
+
+def _decode_typed_values(values):
+    """Turns a sheet's values that were sent in the compact columns format into a
+    tuple of row tuples. Instead of a list of rows, a client can send:
+
+        {
+            "format": "columns",
+            "columns": [["a", 1.0, ""], ...],  # the cell values of each column
+            "dates": [[1, 0], ...],  # 0-based (row, column) of the datetime cells
+        }
+
+    Datetimes, empty cells, and errors are sent like in the list of rows (ISO strings,
+    "", and e.g., "#N/A"), but only the cells listed under "dates" are parsed."""
+    if values.get("format") != "columns":
+        raise XlwingsError(
+            f"Unsupported format of sheet values: {values.get('format')}"
+        )
+    columns = values["columns"]
+    dates = values.get("dates", [])
+    if dates:
+        columns = list(columns)
+        copied = set()
+        for row, col in dates:
+            if col not in copied:
+                columns[col] = list(columns[col])
+                copied.add(col)
+            columns[col][row] = _parse_datetime(columns[col][row])
+    return tuple(zip(*columns)) or ((),)
+
+
 def _clean_value_data_element(
-    value, datetime_builder, empty_as, number_builder, err_to_str
+    value, datetime_builder, empty_as, number_builder, err_to_str, typed=False
 ):
     if value == "":
         return empty_as
     if isinstance(value, str):
-        # TODO: Send arrays back and forth with indices of the location of dt values
-        if datetime_regex.match(value):
-            value = dt.datetime.fromisoformat(
-                value[:-1]
-            )  # cut off "Z" (Python doesn't accept it and Excel doesn't support tz)
-        elif not err_to_str and value in [
-            "#DIV/0!",
-            "#N/A",
-            "#NAME?",
-            "#NULL!",
-            "#NUM!",
-            "#REF!",
-            "#VALUE!",
-            "#DATA!",
-        ]:
+        if not typed and datetime_regex.match(value):
+            value = _parse_datetime(value)
+        elif not err_to_str and value in cell_errors:
             value = None
-        else:
-            value = value
     if isinstance(value, dt.datetime) and datetime_builder is not dt.datetime:
         value = datetime_builder(
             month=value.month,
@@ -163,21 +254,60 @@ def _clean_value_data_element(
     return value
 
 
+def _format_datetimes(column):
+    """Same as prepare_xl_data_element for every cell of a datetime64 column"""
+    dates = column.astype("datetime64[D]")
+    values = np.where(
+        column.astype("datetime64[us]") == dates,
+        np.datetime_as_string(dates),
+        np.char.replace(
+            np.datetime_as_string(column.astype("datetime64[s]"), unit="s"), "T", " "
+        ),
+    )
+    values[np.isnat(column)] = ""
+    return values.tolist()
+
+
+def _prepare_column(column, options):
+    """Same as prepare_xl_data_element for every cell of a NumPy array, using array
+    operations unless it's an object array"""
+    kind = column.dtype.kind
+    if kind in "biuU":
+        return column.tolist()
+    elif kind == "f":
+        values = column.tolist()
+        for ix in np.flatnonzero(np.isnan(column)).tolist():
+            values[ix] = ""
+        return values
+    elif kind == "M":
+        return _format_datetimes(column)
+    values = column.tolist()
+    if set(map(type, values)) <= {str, int, bool}:
+        # e.g., a pandas column of strings
+        return values
+    return [Engine.prepare_xl_data_element(x, options) for x in values]
+
+
 class Engine:
     def __init__(self):
         self.apps = Apps()
 
     @staticmethod
     def clean_value_data(data, datetime_builder, empty_as, number_builder, err_to_str):
-        return [
-            [
-                _clean_value_data_element(
-                    c, datetime_builder, empty_as, number_builder, err_to_str
-                )
-                for c in row
-            ]
-            for row in data
-        ]
+        typed = isinstance(data, TypedValues)
+        # Strings may be empty cells, errors or dates and are always cleaned
+        passthrough_types = {int, bool, type(None)}
+        if number_builder is None:
+            passthrough_types.add(float)
+        if datetime_builder is dt.datetime:
+            passthrough_types.add(dt.datetime)
+        return utils.clean_by_column(
+            data,
+            passthrough_types,
+            lambda c: _clean_value_data_element(
+                c, datetime_builder, empty_as, number_builder, err_to_str, typed
+            ),
+        )
 
     @staticmethod
     def prepare_xl_data_element(x, options):
@@ -204,6 +334,15 @@ class Engine:
             x = x.isoformat()
         return x
 
+    @staticmethod
+    def prepare_xl_data_columns(values, options):
+        # values is a ColumnarValues instance, see CleanDataForWriteStage. The rows
+        # are built once from the serialized columns
+        prepare = Engine.prepare_xl_data_element
+        header = [[prepare(x, options) for x in row] for row in values.header]
+        columns = [_prepare_column(column, options) for column in values.columns]
+        return header + [list(row) for row in zip(*columns)]
+
     @property
     def name(self):
         return "remote"
@@ -313,6 +452,163 @@ class App(base_classes.App):
         )
 
 
+class SnapshotCache:
+    """Server-side cache of the cell values of book payloads, so that clients calling
+    repeatedly from the same workbook can send only what changed (see
+    _apply_book_delta). Holds up to maxsize snapshots (least recently used are
+    evicted first), each for ttl seconds after it was stored. The values are immutable
+    row tuples that are shared with the books, so a snapshot doesn't copy them.
+
+    Snapshot ids are chosen by the client and must be random (e.g., a UUID), as they
+    give access to the cell values. The cache is thread-safe, so that it can be shared
+    by the threads of a server.
+    """
+
+    def __init__(self, maxsize=20, ttl=300):
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be a positive integer, got {maxsize!r}")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._store = {}
+        self._lock = threading.Lock()
+
+    def get(self, snapshot_id):
+        """Returns the snapshot and refreshes its recency. None if absent or expired."""
+        with self._lock:
+            if snapshot_id not in self._store:
+                return None
+            expires, snapshot = self._store.pop(snapshot_id)
+            if expires < time.monotonic():
+                return None
+            self._store[snapshot_id] = expires, snapshot
+            return snapshot
+
+    def set(self, snapshot_id, snapshot):
+        with self._lock:
+            self._store.pop(snapshot_id, None)
+            self._store[snapshot_id] = time.monotonic() + self.ttl, snapshot
+            while len(self._store) > self.maxsize:
+                del self._store[next(iter(self._store))]
+
+    def clear(self):
+        with self._lock:
+            self._store.clear()
+
+    def __len__(self):
+        return len(self._store)
+
+
+# The active snapshot store, can be replaced with a differently configured one
+snapshots = SnapshotCache()
+
+
+def _apply_changes(rows, changes, shape=None):
+    """Returns rows (a tuple of row tuples) with the changes applied. Only the changed
+    rows are copied. Without shape, the rows are padded to the widest row, so that they
+    stay rectangular if a change goes beyond the base."""
+    rows = list(rows)
+    for change in changes:
+        row, col = change["start_row"], change["start_column"]
+        for ix, values in enumerate(change["values"]):
+            while len(rows) <= row + ix:
+                rows.append(())
+            new_row = list(rows[row + ix])
+            if len(new_row) < col:
+                new_row.extend([""] * (col - len(new_row)))
+            new_row[col : col + len(values)] = values
+            rows[row + ix] = tuple(new_row)
+    if shape is None:
+        shape = len(rows), max(map(len, rows), default=0)
+    nrows, ncols = shape
+    rows = rows[:nrows] + [()] * (nrows - len(rows))
+    rows = [
+        row if len(row) == ncols else row[:ncols] + ("",) * (ncols - len(row))
+        for row in rows
+    ]
+    return tuple(rows) or ((),)
+
+
+def _apply_book_delta(api):
+    """Returns the full book payload of a delta payload. Instead of the full values of
+    each sheet, a delta payload refers to the snapshot of a previous payload via
+    "base_snapshot_id" and sends the changed cells of each sheet (matched by name):
+
+        {
+            "name": "Sheet1",
+            "changes": [{"start_row": 0, "start_column": 1, "values": [[1, 2]]}],
+            "shape": [100, 5],  # optional, the new size of the used range
+        }
+
+    Sheets with "values" replace the snapshot's values. The other keys (book, names,
+    pictures, tables, etc.) are sent in full as usual. The delta payload itself isn't
+    modified."""
+    snapshot_id = api["base_snapshot_id"]
+    base = snapshots.get(snapshot_id)
+    if base is None:
+        raise SnapshotMissError(snapshot_id)
+    sheets = []
+    for sheet in api["sheets"]:
+        if "values" not in sheet:
+            values = _apply_changes(
+                base.get(sheet["name"], ((),)),
+                sheet.get("changes", []),
+                sheet.get("shape"),
+            )
+            sheet = {
+                **{k: v for k, v in sheet.items() if k not in ("changes", "shape")},
+                "values": values,
+            }
+        sheets.append(sheet)
+    api = {k: v for k, v in api.items() if k != "base_snapshot_id"}
+    api["sheets"] = sheets
+    return api
+
+
+class Fetcher:
+    """Fetches data from the client on demand, so that scripts with a lazy book (see
+    xw.BookAsync) only transfer the parts of the book that they read. Subclass it
+    for the transport to the client, e.g., socket.io (see
+    udfs_officejs.SocketIOFetcher), and provide it via xw.Book(json=..., fetcher=...).
+    xlwings Lite uses JsFetcher."""
+
+    async def get_book_data(self, include=None, lazy=False):
+        """The book payload as for xw.Book(json=...): only with the sheet named
+        include if provided, and without cell values if lazy"""
+        raise NotImplementedError()
+
+    async def get_range_values(self, sheet_name, address):
+        """The values of a range as 2d list in the format of the book payload"""
+        raise NotImplementedError()
+
+    async def get_expanded_address(self, sheet_name, address, mode):
+        """The address of the range expanded in the given mode, see Range.expand"""
+        raise NotImplementedError()
+
+
+class JsFetcher(Fetcher):
+    """Fetches via the JS global of xlwings Lite"""
+
+    async def get_book_data(self, include=None, lazy=False):
+        import js
+        from pyodide.ffi import to_js
+
+        opts = {"lazy": lazy} if include is None else {"include": include, "lazy": lazy}
+        data = await js.xlwings.getBookData(
+            to_js(opts, dict_converter=js.Object.fromEntries)
+        )
+        return _normalize_jsnull(data.to_py())
+
+    async def get_range_values(self, sheet_name, address):
+        import js
+
+        return (await js.xlwings.getRangeValues(sheet_name, address)).to_py()
+
+    async def get_expanded_address(self, sheet_name, address, mode):
+        import js
+
+        return str(await js.xlwings.getExpandedAddress(sheet_name, address, mode))
+
+
 class Books(base_classes.Books):
     def __init__(self, app):
         self.app = app
@@ -341,11 +637,20 @@ class Books(base_classes.Books):
         # defaults to metadata-only. See Book.load / Range.api.
         return self.open(book_data, lazy=True)
 
-    def open(self, json, lazy=False):
+    def open(self, json, lazy=False, fetcher=None):
         # Normalize here (rather than only at the getBookData boundary) so that
         # callers passing raw `.to_py()` data straight to `xw.Book(json=...)`
         # (e.g. xlwings Lite's notebook runner) also get JsNull -> None.
-        book = Book(api=_normalize_jsnull(json), books=self, lazy=lazy)
+        api = _normalize_jsnull(json)
+        if "base_snapshot_id" in api:
+            api = _apply_book_delta(api)
+        book = Book(api=api, books=self, lazy=lazy, fetcher=fetcher)
+        if "snapshot_id" in api and not lazy:
+            # Values as of this payload, for the next (delta) payload
+            snapshots.set(
+                api["snapshot_id"],
+                {sheet["name"]: _sheet_values(book, sheet) for sheet in api["sheets"]},
+            )
         self.books.append(book)
         self._active = book
         return book
@@ -391,11 +696,322 @@ class Books(base_classes.Books):
             return book
 
 
+# Actions that only affect the cells of their range. coalesce_actions merges and drops
+# such actions within a run of them, i.e., never across another action (e.g., addSheet
+# or rangeInsert) that could change what a range refers to.
+_range_actions = {
+    "setValues",
+    "setNumberFormat",
+    "setRangeColor",
+    "setFontProperty",
+    "rangeClear",
+    "rangeClearContents",
+    "rangeClearFormats",
+}
+
+
+def _action_kind(action):
+    # Actions of the same kind set the same property of a cell
+    if action["func"] == "setFontProperty":
+        return action["func"], action["args"][0]
+    return action["func"], None
+
+
+def _action_bounds(action):
+    # 0-based, end exclusive
+    row, col = action["start_row"], action["start_column"]
+    return row, col, row + action["row_count"], col + action["column_count"]
+
+
+def _overlaps(a, b):
+    return a[0] < b[2] and b[0] < a[2] and a[1] < b[3] and b[1] < a[3]
+
+
+def _contains(a, b):
+    return a[0] <= b[0] and a[1] <= b[1] and a[2] >= b[2] and a[3] >= b[3]
+
+
+def _union(a, b):
+    """Bounds of the union of a and b if it's a rectangle, otherwise None"""
+    if a[0] == b[0] and a[2] == b[2] and a[1] <= b[3] and b[1] <= a[3]:
+        return a[0], min(a[1], b[1]), a[2], max(a[3], b[3])
+    if a[1] == b[1] and a[3] == b[3] and a[0] <= b[2] and b[0] <= a[2]:
+        return min(a[0], b[0]), a[1], max(a[2], b[2]), a[3]
+    if _contains(a, b):
+        return a
+    if _contains(b, a):
+        return b
+    return None
+
+
+class _ValuePieces:
+    """The values of a merged setValues action as the (row, column, values) pieces of
+    the merged actions in the order they were written. They're only combined into a
+    single list of lists when coalescing is done: rebuilding the values on every merge
+    is quadratic when writing cell by cell in a loop."""
+
+    def __init__(self, pieces):
+        self.pieces = pieces
+
+    def to_list(self, bounds):
+        values = [
+            [None] * (bounds[3] - bounds[1]) for _ in range(bounds[2] - bounds[0])
+        ]
+        for row, col, piece in self.pieces:
+            col -= bounds[1]
+            for ix, piece_row in enumerate(piece, start=row - bounds[0]):
+                values[ix][col : col + len(piece_row)] = piece_row
+        return values
+
+
+def _value_pieces(bounds, values):
+    if isinstance(values, _ValuePieces):
+        return values.pieces
+    return [(bounds[0], bounds[1], values)]
+
+
+def _has_shape(action):
+    values = action["values"]
+    if isinstance(values, _ValuePieces):
+        # Only merged from actions that have their shape
+        return True
+    return (
+        isinstance(values, list)
+        and len(values) == action["row_count"]
+        and all(
+            isinstance(row, list) and len(row) == action["column_count"]
+            for row in values
+        )
+    )
+
+
+def _merge_actions(first, second):
+    """Returns a single (bounds, action) with the effect of the (bounds, action) pairs
+    first followed by second if both cover a rectangle together, otherwise None"""
+    (a, first), (b, second) = first, second
+    bounds = _union(a, b)
+    if (
+        bounds is None
+        or first["func"] != second["func"]
+        or first["sheet_position"] != second["sheet_position"]
+        or first["args"] != second["args"]
+    ):
+        return None
+    is_set_values = first["func"] == "setValues"
+    if is_set_values and not (
+        _has_shape(first)
+        and _has_shape(second)
+        and (bounds[2] - bounds[0]) * (bounds[3] - bounds[1]) <= _max_merged_cells
+    ):
+        return None
+    merged = {
+        **first,
+        "start_row": bounds[0],
+        "start_column": bounds[1],
+        "row_count": bounds[2] - bounds[0],
+        "column_count": bounds[3] - bounds[1],
+    }
+    if is_set_values:
+        if isinstance(first["values"], _ValuePieces):
+            # Extended in place: the first action is replaced by the merged one
+            pieces = first["values"]
+            pieces.pieces.extend(_value_pieces(b, second["values"]))
+        else:
+            pieces = _ValuePieces(
+                _value_pieces(a, first["values"]) + _value_pieces(b, second["values"])
+            )
+        merged["values"] = pieces
+    return bounds, merged
+
+
+def _drop_superseded(entries, start, entry):
+    """Removes the actions from entries[start:] that the action of entry overwrites
+    completely, unless an action of another kind touches their cells in between.
+    Entries are (bounds, action) pairs."""
+    bounds, action = entry
+    kind = _action_kind(action)
+    in_between = []
+    for ix in range(len(entries) - 1, max(start, len(entries) - _lookback) - 1, -1):
+        earlier_bounds, earlier = entries[ix]
+        if earlier["sheet_position"] != action["sheet_position"]:
+            continue
+        if _action_kind(earlier) != kind:
+            in_between.append(earlier_bounds)
+        elif _contains(bounds, earlier_bounds) and not any(
+            _overlaps(earlier_bounds, other) for other in in_between
+        ):
+            del entries[ix]
+
+
+def _insert_merged(entries, start, entry):
+    """Appends entry to entries, merged into an earlier entry of entries[start:] if
+    possible. As its action then runs earlier, it may only move past actions that
+    don't touch its cells."""
+    ix = len(entries)
+    jx = ix - 1
+    while jx >= max(start, ix - _lookback):
+        earlier = entries[jx]
+        merged = _merge_actions(earlier, entry)
+        if merged is not None:
+            # Continue with the merged action in place of the earlier one
+            del entries[jx]
+            entry, ix = merged, jx
+        elif earlier[1]["sheet_position"] == entry[1]["sheet_position"] and _overlaps(
+            earlier[0], entry[0]
+        ):
+            break
+        jx -= 1
+    entries.insert(ix, entry)
+
+
+# How many actions coalesce_actions looks back for an action to drop or merge with
+_lookback = 16
+
+# setValues actions are only merged up to this many cells: merging is meant for small
+# writes, while large blocks are kept as they are, e.g., when written with chunksize
+_max_merged_cells = 10_000
+
+
+def coalesce_actions(actions):
+    """Shrinks the list of actions that is sent to the client without changing the
+    result: writes that a later write of the same kind overwrites are dropped, and
+    setValues and formatting actions are merged into rectangular blocks, e.g., when
+    writing and formatting cell by cell in a loop."""
+    entries = []
+    start = 0  # first entry of the current run of range actions
+    for action in actions:
+        if action["func"] not in _range_actions:
+            entries.append((None, action))
+            start = len(entries)
+            continue
+        entry = _action_bounds(action), action
+        _drop_superseded(entries, start, entry)
+        _insert_merged(entries, start, entry)
+    return [
+        {**action, "values": action["values"].to_list(bounds)}
+        if isinstance(action["values"], _ValuePieces)
+        else action
+        for bounds, action in entries
+    ]
+
+
+# Compact encodings for the values of large setValues actions. They're only used if
+# the client lists them under "encodings" in its payload, as it has to decode them.
+value_encodings = ("float64", "rle", "gzip")
+
+# setValues actions with fewer cells are always sent as plain values
+_min_encoded_cells = 1_000
+
+
+def _float64_bytes(flat_values):
+    """Little-endian float64 buffer of flat_values or None if they aren't all numbers"""
+    if not all(type(v) is float or type(v) is int for v in flat_values):
+        return None
+    try:
+        buffer = array.array("d", flat_values)
+    except OverflowError:
+        return None
+    if sys.byteorder == "big":
+        buffer.byteswap()
+    return buffer.tobytes()
+
+
+def _run_lengths(flat_values):
+    """[[value, count], ...] or None if that doesn't at least halve the number of
+    values. Runs only contain values of the same type, so 1, 1.0, and True differ."""
+    runs = []
+    max_runs = len(flat_values) // 2
+    for (_, value), group in itertools.groupby(flat_values, key=lambda v: (type(v), v)):
+        runs.append([value, sum(1 for _ in group)])
+        if len(runs) > max_runs:
+            return None
+    return runs
+
+
+def encode_values(values, encodings):
+    """Returns the 2d list values in the most compact of the given encodings as:
+
+    {"encoding": "float64" | "rle" | "plain", "shape": [rows, columns], "data": ...,
+    "compression": "gzip"}
+
+    * float64: data is the base64 encoded buffer of the row-major values as
+      little-endian doubles, only used if all values are numbers
+    * rle: data is a list of [value, count] runs of the column-major values
+    * plain: data is the 2d list, only used together with gzip
+    * compression (only with gzip): data is the base64 encoded gzip of the buffer
+      (float64) or of the JSON data (rle, plain)
+
+    Returns values unchanged if none of the encodings apply."""
+    flat_values = [v for row in values for v in row]
+    encoding, data = None, None
+    if "float64" in encodings:
+        data = _float64_bytes(flat_values)
+        if data is not None:
+            encoding = "float64"
+    if encoding is None and "rle" in encodings:
+        # Column-major as values tend to repeat within a column, e.g., of a DataFrame
+        data = _run_lengths([v for col in zip(*values) for v in col])
+        if data is not None:
+            encoding = "rle"
+    if encoding is None:
+        if "gzip" not in encodings:
+            return values
+        encoding, data = "plain", values
+    encoded = {
+        "encoding": encoding,
+        "shape": [len(values), len(values[0]) if values else 0],
+    }
+    if "gzip" in encodings:
+        if not isinstance(data, bytes):
+            data = json.dumps(data, separators=(",", ":")).encode("utf-8")
+        data = gzip.compress(data, compresslevel=6)
+        encoded["compression"] = "gzip"
+    if isinstance(data, bytes):
+        data = base64.b64encode(data).decode("ascii")
+    encoded["data"] = data
+    return encoded
+
+
+def _action_cell_count(action):
+    if action["func"] == "setValues" and _has_shape(action):
+        return action["row_count"] * action["column_count"]
+    return 1
+
+
+def _split_set_values(action, max_cells):
+    """Splits a setValues action into blocks of whole rows with at most max_cells cells
+    (or a single row if that's already bigger)"""
+    if _action_cell_count(action) <= max_cells:
+        yield action
+        return
+    nrows = max(1, max_cells // action["column_count"])
+    for ix in range(0, action["row_count"], nrows):
+        values = action["values"][ix : ix + nrows]
+        yield {
+            **action,
+            "values": values,
+            "start_row": action["start_row"] + ix,
+            "row_count": len(values),
+        }
+
+
+def _encode_action(action, encodings):
+    if (
+        encodings
+        and action["func"] == "setValues"
+        and _action_cell_count(action) >= _min_encoded_cells
+    ):
+        return {**action, "values": encode_values(action["values"], encodings)}
+    return action
+
+
 class Book(base_classes.Book):
-    def __init__(self, api, books, lazy=False):
+    def __init__(self, api, books, lazy=False, fetcher=None):
         self.books = books
         self._api = api
         self._json = {"actions": []}
+        # (actions, number of actions, coalesced actions), see _coalesced_actions()
+        self._coalesced = None
         # Async/lazy book: fetched with structure only (no cell values). While
         # lazy, sync `.value` reads on a sheet whose values haven't been loaded
         # raise (use `await get_value()` or `await load(values=True)`), and
@@ -403,6 +1019,11 @@ class Book(base_classes.Book):
         # is marked per sheet on its api dict (see `_SHEET_VALUES_LOADED_KEY`), so
         # it survives sheet renames.
         self._lazy = lazy
+        self._fetcher = fetcher
+        self._names_index = None
+        # See _sheet_values() and _tables_index()
+        self._values_stores = {}
+        self._tables_indexes = {}
         if api["version"] != __version__ and api["client"] != "Office.js":
             raise XlwingsError(
                 f"Your xlwings version is different on the client ({api['version']}) "
@@ -428,8 +1049,63 @@ class Book(base_classes.Book):
     def api(self):
         return self._api
 
+    @property
+    def fetcher(self):
+        """The Fetcher for on-demand reads or None if the book doesn't have one"""
+        if self._fetcher is None and sys.platform == "emscripten":
+            self._fetcher = JsFetcher()
+        return self._fetcher
+
+    def _require_fetcher(self, method):
+        if self.fetcher is None:
+            raise NotImplementedError(
+                f"{method} is only supported in xlwings Lite or with a book that has "
+                "a fetcher, see xw.Book(json=..., fetcher=...)"
+            )
+        return self.fetcher
+
+    @property
+    def names_index(self):
+        # Built on first use and dropped when the book is reloaded
+        if self._names_index is None:
+            self._names_index = utils.index_names(self.api["names"])
+        return self._names_index
+
+    @property
+    def _encodings(self):
+        return [e for e in self.api.get("encodings") or [] if e in value_encodings]
+
+    def _coalesced_actions(self):
+        # Cached until an action is added (actions are only ever appended or replaced
+        # by a new list), as json() and flush() may be called repeatedly
+        actions = self._json.get("actions", [])
+        cached = self._coalesced
+        if cached is None or cached[0] is not actions or cached[1] != len(actions):
+            cached = self._coalesced = actions, len(actions), coalesce_actions(actions)
+        return cached[2]
+
     def json(self):
-        return self._json
+        encodings = self._encodings
+        return {
+            **self._json,
+            "actions": [
+                _encode_action(action, encodings)
+                for action in self._coalesced_actions()
+            ],
+        }
+
+    def json_chunks(self, max_cells):
+        encodings = self._encodings
+        actions, cells = [], 0
+        for action in self._coalesced_actions():
+            for part in _split_set_values(action, max_cells):
+                count = _action_cell_count(part)
+                if actions and cells + count > max_cells:
+                    yield {**self._json, "actions": actions}
+                    actions, cells = [], 0
+                actions.append(_encode_action(part, encodings))
+                cells += count
+        yield {**self._json, "actions": actions}
 
     async def flush(self):
         if sys.platform != "emscripten":
@@ -437,7 +1113,7 @@ class Book(base_classes.Book):
         import js
         from pyodide.ffi import to_js
 
-        actions = self._json.get("actions", [])
+        actions = self._coalesced_actions()
         if actions:
             actions_js = to_js(
                 {"actions": actions}, dict_converter=js.Object.fromEntries
@@ -459,27 +1135,24 @@ class Book(base_classes.Book):
         On a regular (eager) book, everything including values is loaded, as
         before.
         """
-        if sys.platform != "emscripten":
-            raise NotImplementedError("Book.load() is only supported in xlwings Lite")
-        import js
-        from pyodide.ffi import to_js
-
+        fetcher = self._require_fetcher("Book.load()")
         # Default: metadata-only for lazy books, full for eager books.
         load_values = (not self._lazy) if values is None else bool(values)
-        # getBookData(lazy=True) returns structure only (empty values); a plain
+        # get_book_data(lazy=True) returns structure only (empty values); a plain
         # call returns everything.
-        opts = to_js({"lazy": not load_values}, dict_converter=js.Object.fromEntries)
-        data = _normalize_jsnull((await js.xlwings.getBookData(opts)).to_py())
+        data = await fetcher.get_book_data(lazy=not load_values)
         if not load_values:
             # Metadata-only: don't let the empty `values` payload clobber any
             # values already loaded on this book.
             for sheet in data.get("sheets", []):
                 sheet.pop("values", None)
         _update_api_in_place(self._api, data)
-        if load_values:
-            for sheet in self._api.get("sheets", []):
+        self._names_index = None
+        for sheet in self._api.get("sheets", []):
+            _invalidate_tables_index(self, sheet)
+            if load_values:
                 _mark_sheet_values_loaded(sheet)
-        get_range_api.cache_clear()
+                _invalidate_sheet_values(self, sheet)
 
     @property
     def name(self):
@@ -666,6 +1339,8 @@ class Sheet(base_classes.Sheet):
 
     def delete(self):
         del self.book.api["sheets"][self.index - 1]
+        _invalidate_sheet_values(self.book, self.api)
+        _invalidate_tables_index(self.book, self.api)
         self.append_json_action(func="sheetDelete")
 
     def clear(self):
@@ -689,19 +1364,10 @@ class Sheet(base_classes.Sheet):
         values on a regular book. Pass `values=True` to also load this sheet's
         cell values.
         """
-        if sys.platform != "emscripten":
-            raise NotImplementedError("Sheet.load() is only supported in xlwings Lite")
-        import js
-        from pyodide.ffi import to_js
-
         book = self.book
+        fetcher = book._require_fetcher("Sheet.load()")
         load_values = (not book._lazy) if values is None else bool(values)
-        opts = to_js(
-            {"include": self.name, "lazy": not load_values},
-            dict_converter=js.Object.fromEntries,
-        )
-        book_data_js = await js.xlwings.getBookData(opts)
-        book_data = _normalize_jsnull(book_data_js.to_py())
+        book_data = await fetcher.get_book_data(include=self.name, lazy=not load_values)
         for sheet_data in book_data["sheets"]:
             if sheet_data["name"] == self.name:
                 if not load_values:
@@ -709,16 +1375,16 @@ class Sheet(base_classes.Sheet):
                     # metadata-only payload.
                     sheet_data.pop("values", None)
                 self._api.update(sheet_data)
+                _invalidate_tables_index(book, self._api)
                 break
         if load_values:
             _mark_sheet_values_loaded(self._api)
-        get_range_api.cache_clear()
+            _invalidate_sheet_values(book, self._api)
 
 
-@lru_cache(None)
 def get_range_api(api_values, arg1, arg2=None):
-    # Keeping this outside of the Range class allows us to cache it across multiple
-    # instances of the same range
+    # api_values is the sheet's immutable values store (see _sheet_values), so this
+    # only touches the cells of the range
     if arg2:
         values = [
             row[arg1[1] - 1 : arg2[1]] for row in api_values[arg1[0] - 1 : arg2[0]]
@@ -775,21 +1441,14 @@ class Range(base_classes.Range):
             tuple1, tuple2 = utils.a1_to_tuples(arg1)
             if not tuple1:
                 # Named range
-                for api_name in sheet.book.api["names"]:
-                    if (
-                        api_name["name"].split("!")[-1] == arg1
-                        and api_name["sheet_index"] == sheet.index - 1
-                    ):
-                        tuple1, tuple2 = utils.a1_to_tuples(api_name["address"])
-                        break
+                address = sheet.book.names_index.get((sheet.index - 1, arg1))
+                if address:
+                    tuple1, tuple2 = utils.a1_to_tuples(address)
             if not tuple1:
                 # Tables
-                for api_table in sheet.api["tables"]:
-                    if api_table["name"] == arg1:
-                        tuple1, tuple2 = utils.a1_to_tuples(
-                            api_table["data_body_range_address"]
-                        )
-                        break
+                address = _tables_index(sheet.book, sheet.api).get(arg1)
+                if address:
+                    tuple1, tuple2 = utils.a1_to_tuples(address)
             if not tuple1:
                 raise NoSuchObjectError(
                     f"The address/named range '{arg1}' doesn't exist."
@@ -828,12 +1487,12 @@ class Range(base_classes.Range):
     @property
     def api(self):
         return get_range_api(
-            tuple(tuple(row) for row in self.sheet.api["values"]), self.arg1, self.arg2
+            _sheet_values(self.sheet.book, self.sheet.api), self.arg1, self.arg2
         )
 
     @property
     def coords(self):
-        return self.sheet.name, self.row, self.column, len(self.api), len(self.api[0])
+        return self.sheet.name, self.row, self.column, *self.shape
 
     @property
     def row(self):
@@ -852,8 +1511,7 @@ class Range(base_classes.Range):
 
     def get_async_pipeline_overrides(self, options):
         """Return async stage replacements for the converter pipeline."""
-        if sys.platform != "emscripten":
-            raise NotImplementedError("get_value() is only supported in xlwings Lite")
+        fetcher = self.sheet.book._require_fetcher("get_value()")
         from ..conversion.standard import (
             AsyncExpandRangeStage,
             AsyncReadValueFromRangeStage,
@@ -861,9 +1519,11 @@ class Range(base_classes.Range):
             ReadValueFromRangeStage,
         )
 
-        overrides = {ReadValueFromRangeStage: AsyncReadValueFromRangeStage(options)}
+        overrides = {
+            ReadValueFromRangeStage: AsyncReadValueFromRangeStage(options, fetcher)
+        }
         if options.get("expand", None):
-            overrides[ExpandRangeStage] = AsyncExpandRangeStage(options)
+            overrides[ExpandRangeStage] = AsyncExpandRangeStage(options, fetcher)
         return overrides
 
     @property
@@ -871,7 +1531,7 @@ class Range(base_classes.Range):
         # On an async (lazy) book, cell values aren't pre-loaded. Reading `.value`
         # synchronously would silently return None; raise instead and point to
         # the async API. `await get_value()` doesn't go through here (it fetches
-        # via getRangeValues), and `await book.load(values=True)` marks the sheet
+        # via the book's fetcher), and `await book.load(values=True)` marks the sheet
         # as loaded, after which sync reads work again.
         if self.sheet.book._lazy and not _sheet_values_loaded(self.sheet.api):
             raise XlwingsError(
@@ -879,6 +1539,8 @@ class Range(base_classes.Range):
                 "(async book). Use 'await myrange.get_value()' to read on demand, "
                 "or 'await book.load(values=True)' to load all values first."
             )
+        if _sheet_values_typed(self.sheet.api):
+            return TypedValues(self.api)
         return self.api
 
     @raw_value.setter
@@ -894,6 +1556,14 @@ class Range(base_classes.Range):
             values=values,
         )
 
+    def read_raw_value(self, err_to_str=False, columns=None):
+        """Like raw_value, but only for the given 0-based column positions if provided"""
+        values = self.raw_value
+        if columns is None:
+            return values
+        picked = [[row[ix] for ix in columns] for row in values]
+        return TypedValues(picked) if isinstance(values, TypedValues) else picked
+
     def clear_contents(self):
         self.append_json_action(
             func="rangeClearContents",
@@ -931,13 +1601,12 @@ class Range(base_classes.Range):
         return None
 
     def end(self, direction):
+        values = _sheet_values(self.sheet.book, self.sheet.api)
         if direction == "down":
             i = 1
             while True:
                 try:
-                    if self.sheet.api["values"][self.row - 1 + i][
-                        self.column - 1
-                    ] not in (None, ""):
+                    if values[self.row - 1 + i][self.column - 1] not in (None, ""):
                         i += 1
                     else:
                         break
@@ -949,9 +1618,7 @@ class Range(base_classes.Range):
             i = -1
             while True:
                 row_ix = self.row - 1 + i
-                if row_ix >= 0 and self.sheet.api["values"][row_ix][
-                    self.column - 1
-                ] not in (None, ""):
+                if row_ix >= 0 and values[row_ix][self.column - 1] not in (None, ""):
                     i -= 1
                 else:
                     break
@@ -961,9 +1628,7 @@ class Range(base_classes.Range):
             i = 1
             while True:
                 try:
-                    if self.sheet.api["values"][self.row - 1][
-                        self.column - 1 + i
-                    ] not in (None, ""):
+                    if values[self.row - 1][self.column - 1 + i] not in (None, ""):
                         i += 1
                     else:
                         break
@@ -975,9 +1640,7 @@ class Range(base_classes.Range):
             i = -1
             while True:
                 col_ix = self.column - 1 + i
-                if col_ix >= 0 and self.sheet.api["values"][self.row - 1][
-                    col_ix
-                ] not in (None, ""):
+                if col_ix >= 0 and values[self.row - 1][col_ix] not in (None, ""):
                     i -= 1
                 else:
                     break
@@ -1452,6 +2115,7 @@ class Table(base_classes.Table):
     @name.setter
     def name(self, value):
         self.api["name"] = value
+        _invalidate_tables_index(self.parent.book, self.parent.api)
         self.append_json_action(func="setTableName", args=[self.index - 1, value])
 
     @property
@@ -1563,6 +2227,7 @@ class Tables(Collection, base_classes.Tables):
                 "table_style": "",
             }
         )
+        _invalidate_tables_index(self.parent.book, self.parent.api)
         return Table(self.parent, len(self.parent.api["tables"]))
 
 
@@ -11,9 +11,17 @@ xlwings PRO is dual-licensed under one of the following licenses:
 Commercial licenses can be purchased at https://www.xlwings.org
 """
 
+import contextlib
 import hashlib
 import json
+import pickle
+import shutil
+import struct
+import sys
+import tempfile
 import uuid
+import weakref
+from pathlib import Path
 
 try:
     import numpy as np
@@ -52,6 +60,20 @@ CONVERTER_KEYS = (object, "object", "obj")
 NOT_A_HANDLE_MARKER = "__xlwings_not_an_object_handle__"
 
 
+def estimate_size(obj):
+    """Estimates the memory of an object in bytes: the deep memory usage of pandas
+    objects, the buffer of NumPy arrays, and ``sys.getsizeof`` (i.e., without the
+    referenced objects) for anything else. Used by ``LRUObjectCache(max_bytes=...)``
+    unless a ``sizer`` is provided."""
+    if pd and isinstance(obj, pd.DataFrame):
+        return int(obj.memory_usage(deep=True).sum())
+    elif pd and isinstance(obj, pd.Series):
+        return int(obj.memory_usage(deep=True))
+    elif np and isinstance(obj, np.ndarray):
+        return obj.nbytes
+    return sys.getsizeof(obj)
+
+
 class LRUObjectCache:
     """The default object cache: an in-process, capacity-bounded store holding raw Python
     objects, keyed by the handle's UUID.
@@ -65,41 +87,188 @@ class LRUObjectCache:
     by design - resolving an evicted handle raises ``ObjectCacheMissError``, which the
     runtimes turn into the "Expired object" card that a recalculation regenerates.
 
+    With ``max_bytes``, writes also evict the least recently used entries until the
+    estimated size of all entries (see ``estimate_size`` or provide a ``sizer``) fits
+    the budget, so that a few huge DataFrames can't exhaust memory while many small
+    objects aren't evicted early. The entry that was just written is never evicted:
+    an object that exceeds the budget on its own stays until the next write, rather
+    than expiring before it can be used. ``stats()`` reports the current usage.
+
+    With ``spill_dir``, evicted entries are pickled (protocol 5, with the buffers of
+    NumPy arrays and pandas objects written out-of-band) into a subdirectory of its own
+    instead of being dropped and ``get`` transparently loads them back into memory, so
+    that an eviction doesn't force a recalculation. The subdirectory is removed
+    together with the cache. ``spill_max_bytes`` caps the size of the spilled files,
+    the oldest are deleted first. Objects that can't be pickled or written (e.g., if
+    the disk is full) are dropped as without a spill directory.
+
     Backends with their own storage (e.g. Redis in xlwings Server) replace the module's
     ``cache`` attribute with an object implementing ``get``/``set``/``clear``. Keys passed
     to the store are bare UUIDs; prefixing/partitioning and serialization are backend
     concerns - this store keeps plain object references.
     """
 
-    def __init__(self, maxsize=1000):
+    def __init__(
+        self,
+        maxsize=1000,
+        max_bytes=None,
+        sizer=None,
+        spill_dir=None,
+        spill_max_bytes=None,
+    ):
         # A maxsize < 1 is always a misconfiguration: 0 would evict every entry on
         # write (every handle instantly "expired"), negative values would crash the
         # eviction loop. Fail at construction, where the bad config is visible.
         if maxsize < 1:
             raise ValueError(f"maxsize must be a positive integer, got {maxsize!r}")
+        if max_bytes is not None and max_bytes < 1:
+            raise ValueError(f"max_bytes must be a positive integer, got {max_bytes!r}")
         self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self.sizer = sizer or estimate_size
         self._store = {}
+        # Only tracked with max_bytes, as estimating deep sizes isn't free
+        self._sizes = {}
+        self.nbytes = 0
+        self.evictions = 0
+        self.spill_dir = None
+        if spill_dir is not None:
+            Path(spill_dir).mkdir(parents=True, exist_ok=True)
+            # Per cache, so that files of other processes (including ones that didn't
+            # exit cleanly) are neither read nor counted towards spill_max_bytes
+            self.spill_dir = Path(
+                tempfile.mkdtemp(prefix="xlwings-objects-", dir=spill_dir)
+            )
+            self._remove_spill_dir = weakref.finalize(
+                self, shutil.rmtree, self.spill_dir, ignore_errors=True
+            )
+        self.spill_max_bytes = spill_max_bytes
+        # cache_id -> size of the file, in the order of spilling
+        self._spilled = {}
+        self.spilled_bytes = 0
 
     def get(self, cache_id):
         """Returns the cached object and refreshes its recency. None if absent."""
         if cache_id not in self._store:
+            if cache_id in self._spilled:
+                return self._unspill(cache_id)
             return None
         obj = self._store.pop(cache_id)
         self._store[cache_id] = obj
         return obj
 
     def set(self, cache_id, obj):
-        self._store.pop(cache_id, None)
+        self.delete(cache_id)
         self._store[cache_id] = obj
-        while len(self._store) > self.maxsize:
-            del self._store[next(iter(self._store))]
+        if self.max_bytes is not None:
+            size = self.sizer(obj)
+            self._sizes[cache_id] = size
+            self.nbytes += size
+        while len(self._store) > self.maxsize or (
+            self.max_bytes is not None
+            and self.nbytes > self.max_bytes
+            and len(self._store) > 1
+        ):
+            evicted_id = next(iter(self._store))
+            evicted = self._store[evicted_id]
+            self.delete(evicted_id)
+            self.evictions += 1
+            if self.spill_dir is not None:
+                self._spill(evicted_id, evicted)
 
     def delete(self, cache_id):
         """Removes the entry if present. Used by ``evict_superseded``."""
         self._store.pop(cache_id, None)
+        self.nbytes -= self._sizes.pop(cache_id, 0)
+        if cache_id in self._spilled:
+            self._delete_spilled(cache_id)
 
     def clear(self):
         self._store.clear()
+        self._sizes.clear()
+        self.nbytes = 0
+        for cache_id in list(self._spilled):
+            self._delete_spilled(cache_id)
+
+    def _spill_path(self, cache_id):
+        # Cache ids are UUIDs, hashing just guarantees a valid file name
+        return self.spill_dir / hashlib.sha1(cache_id.encode("utf-8")).hexdigest()
+
+    def _spill(self, cache_id, obj):
+        # File format: the number of out-of-band buffers, their lengths, the buffers,
+        # and the pickle data
+        buffers = []
+        try:
+            data = pickle.dumps(obj, protocol=5, buffer_callback=buffers.append)
+            buffers = [buffer.raw() for buffer in buffers]
+        except BufferError:
+            # Non-contiguous buffers can only be pickled in-band
+            data, buffers = pickle.dumps(obj, protocol=5), []
+        except Exception:
+            return
+        path = self._spill_path(cache_id)
+        try:
+            with open(path, "wb") as f:
+                f.write(
+                    struct.pack(
+                        f"<{len(buffers) + 1}Q", len(buffers), *map(len, buffers)
+                    )
+                )
+                for buffer in buffers:
+                    f.write(buffer)
+                f.write(data)
+            size = path.stat().st_size
+        except OSError:
+            # E.g., a full disk: the entry is dropped like an unpicklable one
+            with contextlib.suppress(OSError):
+                path.unlink(missing_ok=True)
+            return
+        self._spilled[cache_id] = size
+        self.spilled_bytes += size
+        while (
+            self.spill_max_bytes is not None
+            and self.spilled_bytes > self.spill_max_bytes
+        ):
+            self._delete_spilled(next(iter(self._spilled)))
+
+    def _unspill(self, cache_id):
+        path = self._spill_path(cache_id)
+        try:
+            with open(path, "rb") as f:
+                (count,) = struct.unpack("<Q", f.read(8))
+                lengths = struct.unpack(f"<{count}Q", f.read(8 * count))
+                # Writable, so that e.g. the arrays of a DataFrame aren't read-only
+                buffers = [bytearray(length) for length in lengths]
+                for buffer in buffers:
+                    if f.readinto(buffer) != len(buffer):
+                        raise EOFError(f"Truncated file: {path}")
+                obj = pickle.loads(f.read(), buffers=buffers)
+        except Exception:
+            # A file that can't be read or loaded (e.g., a truncated one) is a miss
+            self._delete_spilled(cache_id)
+            return None
+        # Moves the entry back into memory, which may spill other entries
+        self.set(cache_id, obj)
+        return obj
+
+    def _delete_spilled(self, cache_id):
+        self.spilled_bytes -= self._spilled.pop(cache_id)
+        with contextlib.suppress(OSError):
+            self._spill_path(cache_id).unlink(missing_ok=True)
+
+    def stats(self):
+        """The number of entries, their estimated size in bytes (only with
+        ``max_bytes``), the limits, the number of evictions so far, and the number
+        and size of the spilled entries (only with ``spill_dir``)."""
+        return {
+            "entries": len(self._store),
+            "bytes": self.nbytes,
+            "maxsize": self.maxsize,
+            "max_bytes": self.max_bytes,
+            "evictions": self.evictions,
+            "spilled_entries": len(self._spilled),
+            "spilled_bytes": self.spilled_bytes,
+        }
 
     def __len__(self):
         return len(self._store)
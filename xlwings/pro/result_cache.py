@@ -0,0 +1,132 @@
+"""
+Required Notice: Copyright (C) Zoomer Analytics GmbH.
+
+xlwings PRO is dual-licensed under one of the following licenses:
+
+* PolyForm Noncommercial License 1.0.0 (for noncommercial use):
+  https://polyformproject.org/licenses/noncommercial/1.0.0
+* xlwings PRO License (for commercial use):
+  https://github.com/xlwings/xlwings/blob/main/LICENSE_PRO.txt
+
+Commercial licenses can be purchased at https://www.xlwings.org
+"""
+
+import asyncio
+import time
+
+from .. import CustomFunctionResult
+from .object_handles import producer_discriminator
+
+
+class LRUResultCache:
+    """The default result cache of custom functions with ``@func(cache=True)``: an
+    in-process store with one LRU partition per function (namespace) and an optional
+    time to live per entry.
+
+    Backends with their own storage (e.g. Redis in xlwings Server) replace the module's
+    ``cache`` attribute with an object implementing ``get``/``set``/``clear``. They may
+    ignore ``maxsize`` and should implement ``ttl`` via their own expiry. Stored values
+    are the converted results, i.e., JSON serializable.
+    """
+
+    def __init__(self, maxsize=1000):
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be a positive integer, got {maxsize!r}")
+        self.maxsize = maxsize
+        self._stores = {}
+
+    def get(self, namespace, key):
+        """Returns the cached value and refreshes its recency. None if absent or
+        expired."""
+        store = self._stores.get(namespace)
+        if not store or key not in store:
+            return None
+        value, expires = store.pop(key)
+        if expires is not None and expires <= time.monotonic():
+            return None
+        store[key] = value, expires
+        return value
+
+    def set(self, namespace, key, value, ttl=None, maxsize=None):
+        store = self._stores.setdefault(namespace, {})
+        store.pop(key, None)
+        store[key] = value, None if ttl is None else time.monotonic() + ttl
+        while len(store) > (maxsize or self.maxsize):
+            del store[next(iter(store))]
+
+    def clear(self, namespace=None):
+        if namespace is None:
+            self._stores.clear()
+        else:
+            self._stores.pop(namespace, None)
+
+    def __len__(self):
+        return sum(len(store) for store in self._stores.values())
+
+
+# The active store. Runtimes with their own backend replace this, e.g.:
+# from xlwings.pro import result_cache; result_cache.cache = RedisResultCache()
+cache = LRUResultCache()
+
+# Hits and misses per function name, e.g., {"price": {"hits": 10, "misses": 2}}.
+# Calls that wait for an identical call in flight count as hits.
+stats = {}
+
+# Tasks of the calls that are being computed, so that concurrent identical calls
+# compute once
+_in_flight = {}
+
+
+def result_key(func_name, args, data, user_id=None):
+    """A stable key for a call, derived from the same hash as the object handles'
+    producer_discriminator. It uses the arguments as sent by Excel: the converted
+    arguments follow from them and the function's (fixed) conversion options, but
+    objects like DataFrames don't have a stable serialization. The date format and
+    runtime are included as they affect the converted result."""
+    return producer_discriminator(
+        func_name,
+        [
+            args,
+            user_id,
+            data.get("date_format"),
+            data.get("culture_info_name"),
+            data.get("runtime"),
+        ],
+    )
+
+
+def _count(namespace, outcome):
+    counts = stats.setdefault(namespace, {"hits": 0, "misses": 0})
+    counts[outcome] += 1
+
+
+async def _compute_and_cache(namespace, key, compute, ttl, maxsize):
+    value = await compute()
+    if value is not None and not isinstance(value, CustomFunctionResult):
+        cache.set(namespace, key, value, ttl=ttl, maxsize=maxsize)
+    return value
+
+
+async def get_or_compute(namespace, key, compute, ttl=None, maxsize=None):
+    """Returns the cached result or awaits compute() and caches its result. Results
+    with a follow-up script (CustomFunctionResult) are returned but not cached as the
+    script should run on every call."""
+    value = cache.get(namespace, key)
+    if value is not None:
+        _count(namespace, "hits")
+        return value
+    task = _in_flight.get((namespace, key))
+    if task is None:
+        _count(namespace, "misses")
+        # A task of its own that all identical calls wait for, so that the
+        # computation isn't tied to the caller that started it
+        task = asyncio.ensure_future(
+            _compute_and_cache(namespace, key, compute, ttl, maxsize)
+        )
+        _in_flight[namespace, key] = task
+        task.add_done_callback(lambda _: _in_flight.pop((namespace, key), None))
+    else:
+        _count(namespace, "hits")
+    # Shielded, so that cancelling one caller (e.g., a disconnected client) doesn't
+    # cancel the computation for the others
+    return await asyncio.shield(task)
@@ -14,15 +14,18 @@ Commercial licenses can be purchased at https://www.xlwings.org
 from __future__ import annotations
 
 import asyncio
+import concurrent.futures
 import contextlib
+import contextvars
 import datetime as dt
 import inspect
 import logging
 import os
 import re
+import sys
 import types
 import warnings
-from functools import wraps
+from functools import lru_cache, partial, wraps
 from pathlib import Path
 from textwrap import dedent
 from typing import (
@@ -49,14 +52,22 @@ from .. import (
     XlwingsError,
     __version__,
     conversion,
+    utils,
 )
-from . import object_handles
+from . import object_handles, result_cache
+from ._xlremote import Fetcher
 
 logger = logging.getLogger(__name__)
 
 # Tasks started by streaming functions
 background_tasks = {}
 
+# How synchronous custom functions are run (see custom_functions_call):
+# "inline" on the event loop, or in a shared "thread" or "process" pool
+EXECUTORS = ("inline", "thread", "process")
+_executor_settings = {"default": "inline", "max_workers": None}
+_executor_pools = {}
+
 MODULE_NAMESPACE_ATTRIBUTE = "__xlwings_func_namespace__"
 
 # Typehints whose values are injected into custom functions by the framework instead of
@@ -153,6 +164,30 @@ def func_sig(f):
     }
 
 
+def _check_cacheable(f, cache):
+    """Injected values aren't part of the cache key (only the user id is with
+    cache="user"), so a cached result would be returned to other users or cells"""
+    # Imported here, not at module level: caller.py imports from this module.
+    from .caller import Caller
+
+    try:
+        type_hints = get_type_hints(f)
+    except Exception:
+        type_hints = {}
+    for name in func_sig(f)["injected"]:
+        if _unwrap_optional_hint(type_hints.get(name)) is Caller:
+            raise XlwingsError(
+                f"'{f.__name__}' can't be cached as its parameter '{name}' depends on "
+                "the calling cell."
+            )
+        if cache is True:
+            raise XlwingsError(
+                f"'{f.__name__}' can't use cache=True as its parameter '{name}' is "
+                'injected and not part of the cache key. Use cache="user" if the '
+                "result only depends on the current user."
+            )
+
+
 def check_bool(kw, default, **func_kwargs):
     if kw in func_kwargs:
         check = func_kwargs.pop(kw)
@@ -327,6 +362,26 @@ def xlfunc(f: _F | None = None, **kwargs: Any) -> _F | Callable[[_F], _F]:
         f.__xlfunc__["namespace"] = kwargs.get("namespace")
         f.__xlfunc__["help_url"] = kwargs.get("help_url")
         f.__xlfunc__["required_roles"] = kwargs.get("required_roles")
+        cache = kwargs.get("cache", False)
+        if cache not in (False, True, "user"):
+            raise XlwingsError(f'cache must be True, False, or "user", got {cache!r}')
+        if cache and inspect.isasyncgenfunction(f):
+            raise XlwingsError("Streaming functions can't be cached.")
+        if cache:
+            _check_cacheable(f, cache)
+        f.__xlfunc__["cache"] = (
+            {
+                "per_user": cache == "user",
+                "ttl": kwargs.get("ttl"),
+                "maxsize": kwargs.get("maxsize"),
+            }
+            if cache
+            else None
+        )
+        executor = kwargs.get("executor")
+        if executor is not None and executor not in EXECUTORS:
+            raise XlwingsError(f"executor must be one of {EXECUTORS}, got {executor!r}")
+        f.__xlfunc__["executor"] = executor
         return f
 
     if f is None:
@@ -369,13 +424,9 @@ def js_to_none(arg):
     # Pyodide >= 0.28 surfaces JS `null` as a distinct `JsNull` sentinel rather
     # than Python `None`, which breaks `arg is None` checks (e.g. empty Excel
     # cells no longer trigger optional-argument defaults). Normalize it back.
-    try:
-        from pyodide.ffi import JsNull
-
-        if isinstance(arg, JsNull):
-            return None
-    except ImportError:
-        pass
+    JsNull = utils.jsnull_type()
+    if JsNull is not None and isinstance(arg, JsNull):
+        return None
     return arg
 
 
@@ -417,6 +468,24 @@ date_format_language_map = {
 }
 
 
+@lru_cache(maxsize=128)
+def _localize_date_format(date_format, locale):
+    # Cached as all calls of a recalculation usually share the same format and locale
+    if any(c not in "dmy" for c in date_format.lower() if c.isalpha()):
+        replacements = date_format_language_map.get(locale.lower())
+
+        if replacements is None:
+            language = locale.split("-")[0]
+            replacements = date_format_language_map.get(language.lower())
+
+        if replacements:
+            for old, new in replacements.items():
+                date_format = date_format.lower().replace(old, new)
+        else:
+            date_format = None
+    return date_format
+
+
 async def convert(result, ret_info, data):
     options = ret_info["options"].copy()
     date_format = (
@@ -441,37 +510,31 @@ async def convert(result, ret_info, data):
     # Applications.
     # WEB: File > Options > Regional Format Settings
     if date_format and data.get("culture_info_name"):
-        if any(c not in "dmy" for c in date_format.lower() if c.isalpha()):
-            locale = data["culture_info_name"]
-            replacements = date_format_language_map.get(locale.lower())
-
-            if replacements is None:
-                language = locale.split("-")[0]
-                replacements = date_format_language_map.get(language.lower())
-
-            if replacements:
-                for old, new in replacements.items():
-                    date_format = date_format.lower().replace(old, new)
-            else:
-                date_format = None
+        date_format = _localize_date_format(date_format, data["culture_info_name"])
 
     options.update({"date_format": date_format, "runtime": data["runtime"]})
     result = await conversion.async_write(result, None, options, engine_name="officejs")
     return result
 
 
-def provide_values_for_special_args(func, args, typehint_to_value: dict) -> tuple:
+def signature_and_type_hints(func):
+    return inspect.signature(func).parameters, get_type_hints(func)
+
+
+def provide_values_for_special_args(
+    func, args, typehint_to_value: dict, signature=None
+) -> tuple:
     """Inject framework-provided values (e.g. CurrentUser, xw.Book) into the call.
 
     Returns (args, kwargs): params declared before *args are inserted positionally at
     their signature index, while keyword-only params (i.e. those after *args) are
-    returned as kwargs since they can't be passed positionally.
+    returned as kwargs since they can't be passed positionally. ``signature`` is the
+    result of signature_and_type_hints(func) if already known.
     """
     if typehint_to_value is None:
         typehint_to_value = {}
 
-    type_hints = get_type_hints(func)
-    parameters = inspect.signature(func).parameters
+    parameters, type_hints = signature or signature_and_type_hints(func)
     args_list = list(args)
     kwargs = {}
     for index, (param, spec) in enumerate(parameters.items()):
@@ -506,6 +569,55 @@ def provide_values_for_special_args(func, args, typehint_to_value: dict) -> tupl
     return tuple(args_list), kwargs
 
 
+def set_executor(default: str = "inline", max_workers: int | None = None) -> None:
+    """Sets how synchronous custom functions without an explicit executor
+    (``@func(executor=...)``) are run: ``"inline"`` (on the event loop, the default),
+    ``"thread"``, or ``"process"``. ``max_workers`` bounds the shared thread and process
+    pools (default: the defaults of ``concurrent.futures``). Existing pools are shut down
+    so that the next call creates them with the new size.
+    """
+    if default not in EXECUTORS:
+        raise XlwingsError(f"executor must be one of {EXECUTORS}, got {default!r}")
+    _executor_settings["default"] = default
+    _executor_settings["max_workers"] = max_workers
+    for pool in _executor_pools.values():
+        pool.shutdown(wait=False)
+    _executor_pools.clear()
+
+
+def _get_executor_pool(executor):
+    pool = _executor_pools.get(executor)
+    if pool is None:
+        max_workers = _executor_settings["max_workers"]
+        if executor == "thread":
+            pool = concurrent.futures.ThreadPoolExecutor(
+                max_workers, thread_name_prefix="xlwings-custom-functions"
+            )
+        else:
+            # Workers stay alive between calls, so imports are only paid once
+            pool = concurrent.futures.ProcessPoolExecutor(max_workers)
+        _executor_pools[executor] = pool
+    return pool
+
+
+async def run_sync_custom_function(func, args, kwargs):
+    """Runs a synchronous custom function with the executor of its decorator or the
+    default executor (see set_executor). In the process pool, the function is imported
+    by name and the arguments and the return value are pickled."""
+    executor = func.__xlfunc__.get("executor") or _executor_settings["default"]
+    if executor == "inline" or sys.platform == "emscripten":
+        # Pyodide (xlwings Lite) doesn't support threads or processes
+        return func(*args, **kwargs)
+    loop = asyncio.get_running_loop()
+    if executor == "thread":
+        # Context variables (e.g., of the web framework) are visible like inline
+        context = contextvars.copy_context()
+        call = partial(context.run, func, *args, **kwargs)
+    else:
+        call = partial(func, *args, **kwargs)
+    return await loop.run_in_executor(_get_executor_pool(executor), call)
+
+
 async def check_user_roles(current_user, required_roles):
     has_required_roles = await current_user.has_required_roles(required_roles)
     if not has_required_roles:
@@ -517,6 +629,43 @@ async def check_user_roles(current_user, required_roles):
         raise XlwingsError(error_message)
 
 
+class _SharedCallState:
+    """The work that the custom function calls of a batch share (see
+    custom_functions_call_batch): role checks, signatures, and reader pipelines."""
+
+    def __init__(self, current_user):
+        self.current_user = current_user
+        self._role_checks = {}
+        self._reader_pipelines = {}
+        self._signatures = {}
+
+    async def check_user_roles(self, required_roles):
+        key = None if required_roles is None else tuple(required_roles)
+        if key not in self._role_checks:
+            self._role_checks[key] = asyncio.ensure_future(
+                check_user_roles(self.current_user, required_roles)
+            )
+        await self._role_checks[key]
+
+    def signature(self, func):
+        if func not in self._signatures:
+            self._signatures[func] = signature_and_type_hints(func)
+        return self._signatures[func]
+
+    def read(self, value, options):
+        # Keyed by identity, as the options belong to the functions' __xlfunc__
+        pipeline = self._reader_pipelines.get(id(options))
+        if pipeline is None:
+            convert = options.get("convert", None)
+            pipeline = conversion.accessors.get(convert, convert).reader(options)
+            self._reader_pipelines[id(options)] = pipeline
+        ctx = conversion.ConversionContext(
+            rng=None, value=value, engine_name="officejs"
+        )
+        pipeline(ctx)
+        return ctx.value
+
+
 async def custom_functions_call(
     data,
     module,
@@ -531,6 +680,66 @@ async def custom_functions_call(
     streaming_callback : callable, used by Lite/Pyodide to push streaming results directly
     streaming_context : context manager applied inside the streaming task (e.g., stdout redirect)
     """
+    return await _custom_functions_call(
+        data,
+        module,
+        current_user,
+        sio,
+        typehint_to_value,
+        streaming_callback,
+        streaming_context,
+        _SharedCallState(current_user),
+    )
+
+
+async def custom_functions_call_batch(
+    data_list,
+    module,
+    current_user=None,
+    typehint_to_value: dict = None,
+    max_concurrency: int = 32,
+):
+    """Runs the custom function calls of a recalculation that were sent in one payload
+    (a list of the ``data`` of custom_functions_call) and returns their results in the
+    same order. A call that fails returns its exception instead of a result, like
+    ``asyncio.gather(..., return_exceptions=True)``, so that one failing cell doesn't
+    fail the others.
+
+    The role checks and the argument conversion pipelines are resolved once per batch
+    and up to ``max_concurrency`` calls run concurrently, see also
+    ``@func(executor=...)`` for synchronous functions. Streaming functions aren't
+    supported.
+    """
+    shared = _SharedCallState(current_user)
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def call(data):
+        async with semaphore:
+            func = getattr(module, data["func_name"])
+            if inspect.isasyncgenfunction(func):
+                raise XlwingsError(
+                    "Streaming functions can't be called via custom_functions_call_batch."
+                )
+            return await _custom_functions_call(
+                data, module, current_user, None, typehint_to_value, None, None, shared
+            )
+
+    return await asyncio.gather(
+        *(call(data) for data in data_list), return_exceptions=True
+    )
+
+
+async def _custom_functions_call(
+    data,
+    module,
+    current_user,
+    sio,
+    typehint_to_value,
+    streaming_callback,
+    streaming_context,
+    shared,
+    use_cache=True,
+):
     func_name = data["func_name"]
     args = data["args"]
     func = getattr(module, func_name)
@@ -556,7 +765,7 @@ async def custom_functions_call(
     )
 
     if current_user:
-        await check_user_roles(current_user, required_roles)
+        await shared.check_user_roles(required_roles)
 
     if data["version"] != __version__ and data["client"] != "Office.js":
         raise XlwingsError(
@@ -564,6 +773,29 @@ async def custom_functions_call(
             "right-click on the task pane and select 'reload'!"
         )
 
+    # Memoized functions (@func(cache=...)), except for object handles, whose results
+    # are generations that are tracked per call
+    cache_info = func_info.get("cache")
+    if use_cache and cache_info and not produces_handles:
+        user_id = getattr(current_user, "id", None) if cache_info["per_user"] else None
+        return await result_cache.get_or_compute(
+            func_name,
+            result_cache.result_key(func_name, args, data, user_id),
+            lambda: _custom_functions_call(
+                data,
+                module,
+                current_user,
+                sio,
+                typehint_to_value,
+                streaming_callback,
+                streaming_context,
+                shared,
+                use_cache=False,
+            ),
+            ttl=cache_info["ttl"],
+            maxsize=cache_info["maxsize"],
+        )
+
     # Turn varargs into regular arguments
     args = list(args)
     new_args = []
@@ -586,12 +818,12 @@ async def custom_functions_call(
         if arg is None:
             args[i] = arg_info.get("optional", None)
         else:
-            args[i] = conversion.read(
-                None, arg, arg_info["options"], engine_name="officejs"
-            )
+            args[i] = shared.read(arg, arg_info["options"])
 
     # Handle function args that are provided behind the scenes and not via Excel
-    args, kwargs = provide_values_for_special_args(func, args, typehint_to_value)
+    args, kwargs = provide_values_for_special_args(
+        func, args, typehint_to_value, shared.signature(func)
+    )
 
     if inspect.isasyncgenfunction(func):
         # Streaming functions
@@ -672,7 +904,7 @@ async def custom_functions_call(
     elif inspect.iscoroutinefunction(func):
         ret = await func(*args, **kwargs)
     else:
-        ret = func(*args, **kwargs)
+        ret = await run_sync_custom_function(func, args, kwargs)
 
     # Unwrap a requested follow-up script BEFORE the return converter is selected.
     # ret_info drives that selection, so an explicit converter (e.g. `-> object` or
@@ -1165,6 +1397,43 @@ def custom_scripts_meta(module):
     return scripts_meta
 
 
+class SocketIOFetcher(Fetcher):
+    """Fetches data of a lazy book on demand from the client of a socket.io session:
+    the client answers the xlwings:get-book-data, xlwings:get-range-values, and
+    xlwings:get-expanded-address events with the same data as the getBookData,
+    getRangeValues, and getExpandedAddress functions of xlwings Lite.
+
+    sio : socketio.AsyncServer instance
+    sid : session ID of the client that runs the script
+    """
+
+    def __init__(self, sio, sid, timeout=60):
+        self.sio = sio
+        self.sid = sid
+        self.timeout = timeout
+
+    async def _call(self, event, data):
+        return await self.sio.call(
+            f"xlwings:{event}", data, to=self.sid, timeout=self.timeout
+        )
+
+    async def get_book_data(self, include=None, lazy=False):
+        return await self._call("get-book-data", {"include": include, "lazy": lazy})
+
+    async def get_range_values(self, sheet_name, address):
+        return await self._call(
+            "get-range-values", {"sheet_name": sheet_name, "address": address}
+        )
+
+    async def get_expanded_address(self, sheet_name, address, mode):
+        return str(
+            await self._call(
+                "get-expanded-address",
+                {"sheet_name": sheet_name, "address": address, "mode": mode},
+            )
+        )
+
+
 # Socket.io (sid is the session ID)
 # task_key_to_sid_counts: task_key -> {sid: subscription_count}
 task_key_to_sid_counts = {}
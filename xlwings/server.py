@@ -8,6 +8,7 @@ from .pro.object_handles import (
 )
 from .pro.udfs_officejs import (
     custom_functions_call,
+    custom_functions_call_batch,
     custom_functions_code,
     custom_functions_meta,
     custom_scripts_call,
@@ -16,6 +17,7 @@ from .pro.udfs_officejs import (
     is_injectable_typehint,
     register_injectable_typehint,
     script,
+    set_executor,
     sio_cancel_task,
     sio_connect,
     sio_custom_function_call,
@@ -40,6 +42,7 @@ __all__ = (
     "ObjectCacheConverter",
     "stale_object_handle",
     "custom_functions_call",
+    "custom_functions_call_batch",
     "custom_functions_code",
     "custom_functions_meta",
     "custom_scripts_call",
@@ -48,6 +51,7 @@ __all__ = (
     "is_injectable_typehint",
     "register_injectable_typehint",
     "script",
+    "set_executor",
     "sio_cancel_task",
     "sio_connect",
     "sio_custom_function_call",
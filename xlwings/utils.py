@@ -118,6 +118,10 @@ def col_name(i):
         raise IndexError(i)
 
 
+_re_range_parts = re.compile(r"(\$?)([A-Z]{1,3})(\$?)(\d+)")
+_re_column = re.compile(r"^[A-Z]+$", re.I)
+
+
 def address_to_index_tuple(address):
     """
     Based on a function from XlsxWriter, which is distributed under the following
@@ -147,38 +151,29 @@ def address_to_index_tuple(address):
     OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
     OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
     """
-    re_range_parts = re.compile(r"(\$?)([A-Z]{1,3})(\$?)(\d+)")
-    match = re_range_parts.match(address)
+    match = _re_range_parts.match(address)
     if match:
-        col_str = match.group(2)
-        row_str = match.group(4)
-
-        # Convert base26 column string to number
-        expn = 0
-        col = 0
-        for char in reversed(col_str):
-            col += (ord(char) - ord("A") + 1) * (26**expn)
-            expn += 1
-
-        return int(row_str), col
+        return int(match.group(4)), column_to_number(match.group(2))
 
 
 def column_to_number(col_str):
-    expn = 0
+    # Base26 column string to number
     col = 0
-    for char in reversed(col_str):
-        col += (ord(char) - ord("A") + 1) * (26**expn)
-        expn += 1
+    for char in col_str:
+        col = col * 26 + ord(char) - 64
     return col
 
 
+@lru_cache(maxsize=4096)
 def a1_to_tuples(address):
+    # Cached as scripts often address the same cells by string, e.g., in a loop.
+    # Returns tuples only, so the cached results can't be mutated.
     if ":" in address:
         part1, part2 = address.split(":")
         if part1.isdigit() and part2.isdigit():
             # Rows
             return (int(part1), 1), (int(part2), MAX_COLUMNS)
-        elif re.match(r"^[A-Z]+$", part1, re.I) and re.match(r"^[A-Z]+$", part2, re.I):
+        elif _re_column.match(part1) and _re_column.match(part2):
             # Columns
             col1 = column_to_number(part1.upper())
             col2 = column_to_number(part2.upper())
@@ -193,6 +188,46 @@ def a1_to_tuples(address):
         return address_to_index_tuple(address.upper()), None
 
 
+def index_names(api_names):
+    """Maps (0-based sheet index, name) to the address of the defined names of the
+    remote and calamine engines, so range names can be resolved without scanning all
+    names. Sheet scope names are indexed without their sheet prefix and the first
+    name wins."""
+    index = {}
+    for api_name in api_names:
+        key = api_name["sheet_index"], api_name["name"].split("!")[-1]
+        index.setdefault(key, api_name["address"])
+    return index
+
+
+def jsnull_type():
+    """Returns Pyodide's JsNull class (Pyodide >= 0.28) or None. Outside of Pyodide,
+    a failed import per value would be expensive, so only an already imported
+    pyodide.ffi module is used there."""
+    module = sys.modules.get("pyodide.ffi")
+    if module is None and sys.platform == "emscripten":
+        try:
+            import pyodide.ffi as module
+        except ImportError:
+            return None
+    return getattr(module, "JsNull", None)
+
+
+def clean_by_column(data, passthrough_types, clean_element):
+    """Cleans the values of the remote and calamine engines column by column: columns
+    that only contain cells of passthrough_types are returned as they are, the other
+    columns call clean_element for every cell."""
+    if not data or not data[0]:
+        return [[clean_element(c) for c in row] for row in data]
+    columns = [
+        column
+        if set(map(type, column)) <= passthrough_types
+        else [clean_element(c) for c in column]
+        for column in zip(*data)
+    ]
+    return [list(row) for row in zip(*columns)]
+
+
 class VBAWriter:
     MAX_VBA_LINE_LENGTH = 1024
     VBA_LINE_SPLIT = " _\n"
@@ -400,6 +435,15 @@ def chunk(sequence, chunksize):
         yield sequence[i : i + chunksize]
 
 
+def ensure_2d(value):
+    # Raw values of single cells or rows aren't nested with all engines
+    if not isinstance(value, (list, tuple)):
+        return [[value]]
+    elif value and not isinstance(value[0], (list, tuple)):
+        return [value]
+    return value
+
+
 def query_yes_no(question, default="yes"):
     """Ask a yes/no question via input() and return their answer.
 